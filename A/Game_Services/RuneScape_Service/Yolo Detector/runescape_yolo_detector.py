@@ -9,7 +9,6 @@ import pyautogui
 import time
 import sys
 import os
-from ultralytics import YOLO
 from typing import List, Dict, Tuple, Optional
 import win32gui
 import win32con
@@ -22,12 +21,22 @@ windows_mgmt_path = os.path.join(project_root, 'B', 'Windows Managment', 'Window
 sys.path.append(windows_mgmt_path)
 from Windows_Management_Controls import GameWindowManager
 
+# Add Model Management to path for the shared model registry
+sys.path.append(os.path.join(project_root, 'B', 'Model_Management'))
+from model_registry import get_model_registry
+from runescape_models import RUNESCAPE_MODELS, register_runescape_models
+
 
 class RuneScapeObjectDetector:
     """YOLO-based object detection for Old School RuneScape"""
     
     def __init__(self):
         self.model = None
+        self.active_model_name = None
+        
+        # Shared registry keeps models resident across commands within a memory budget
+        self.registry = register_runescape_models(get_model_registry())
+        
         # Initialize centralized window manager
         self.window_manager = GameWindowManager()
         self.game_window = self.window_manager.get_game_window_handle()
@@ -61,23 +70,36 @@ class RuneScapeObjectDetector:
     
     def _initialize_model(self):
         """Initialize YOLOv8 model"""
-        try:
-            print("🔧 Initializing YOLOv8 for RuneScape object detection...")
-            # Try to load trained chicken model first, fallback to generic
-            trained_model_path = os.path.join(os.path.dirname(__file__), '..', 'Yolo_Training', 'Chicken_Training', 'runs', 'train', 'yolov8n.pt', 'weights', 'best.pt')
-            
-            if os.path.exists(trained_model_path):
-                self.model = YOLO(trained_model_path)
+        print("🔧 Initializing YOLOv8 for RuneScape object detection...")
+        # Try to load trained chicken model first, registry falls back to generic
+        if self.use_models(['chicken']):
+            trained_model_path = RUNESCAPE_MODELS['chicken']['weights']
+            if self.active_model_name == 'chicken':
                 print("✅ Trained RuneScape chicken detection model loaded successfully!")
                 print(f"   Model: {trained_model_path}")
                 print("   Classes: chicken")
             else:
-                self.model = YOLO('yolov8n.pt')  # Fallback to generic model
                 print("⚠️ Using generic YOLO model (trained chicken model not found)")
                 print(f"   Expected trained model at: {trained_model_path}")
+    
+    def use_models(self, model_names: List[str]) -> bool:
+        """Make the given models resident and switch detection to the first one"""
+        try:
+            models = self.registry.require(model_names)
+            self.model = models[model_names[0]]
+            self.active_model_name = self.registry.resolve(model_names[0])
+            
+            # Read the auto-tuned backend configuration for this host
+            inference_config = self.registry.inference_config(self.active_model_name)
+            if inference_config:
+                print(f"⚙️ Inference: {inference_config['backend']} backend, "
+                      f"threads={inference_config['threads']}, imgsz={inference_config['imgsz']}")
+            return True
         except Exception as e:
             print(f"❌ Failed to initialize YOLOv8: {e}")
             self.model = None
+            self.active_model_name = None
+            return False
     
     
     def capture_game_screen(self) -> Optional[np.ndarray]:
@@ -122,43 +144,38 @@ class RuneScapeObjectDetector:
             if self.model is None:
                 return []
             
-            # Run YOLO detection
-            results = self.model(frame, conf=confidence_threshold)
+            # Run YOLO detection (Nx6 rows: x1, y1, x2, y2, conf, cls)
+            results = self.model.detect(frame, conf=confidence_threshold)
             
             detections = []
             
-            for result in results:
-                boxes = result.boxes
-                if boxes is not None:
-                    for box in boxes:
-                        # Get detection info
-                        x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                        confidence = box.conf[0].cpu().numpy()
-                        class_id = int(box.cls[0].cpu().numpy())
-                        class_name = self.model.names[class_id]
-                        
-                        # Calculate center point
-                        center_x = int((x1 + x2) / 2)
-                        center_y = int((y1 + y2) / 2)
-                        
-                        # Convert to screen coordinates
-                        screen_x, screen_y = self._game_to_screen_coords(center_x, center_y)
-                        
-                        # Categorize object
-                        object_category = self._categorize_object(class_name)
-                        
-                        detection = {
-                            'class_name': class_name,
-                            'category': object_category,
-                            'confidence': float(confidence),
-                            'center_x': center_x,
-                            'center_y': center_y,
-                            'screen_x': screen_x,
-                            'screen_y': screen_y,
-                            'bbox': (int(x1), int(y1), int(x2), int(y2))
-                        }
-                        
-                        detections.append(detection)
+            for x1, y1, x2, y2, confidence, class_id in results:
+                # Get detection info
+                class_id = int(class_id)
+                class_name = self.model.names[class_id]
+                
+                # Calculate center point
+                center_x = int((x1 + x2) / 2)
+                center_y = int((y1 + y2) / 2)
+                
+                # Convert to screen coordinates
+                screen_x, screen_y = self._game_to_screen_coords(center_x, center_y)
+                
+                # Categorize object
+                object_category = self._categorize_object(class_name)
+                
+                detection = {
+                    'class_name': class_name,
+                    'category': object_category,
+                    'confidence': float(confidence),
+                    'center_x': center_x,
+                    'center_y': center_y,
+                    'screen_x': screen_x,
+                    'screen_y': screen_y,
+                    'bbox': (int(x1), int(y1), int(x2), int(y2))
+                }
+                
+                detections.append(detection)
             
             return detections
             
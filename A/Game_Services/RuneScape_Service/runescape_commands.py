@@ -5,7 +5,7 @@ OSRS-specific commands for object interaction using YOLO detection
 
 import time
 import random
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Callable
 from runescape_base_controls import RuneScapeBaseControls
 from runescape_yolo_detector import RuneScapeObjectDetector
 
@@ -17,7 +17,15 @@ class RuneScapeCommands(RuneScapeBaseControls):
         super().__init__()
         self.detector = RuneScapeObjectDetector()
         self.hunting_active = False  # Flag to control hunting loop
-        
+    
+    def requires_models(self, model_names: List[str], command: Callable[[], bool]) -> Callable[[], bool]:
+        """Wrap a command so its models are made resident before it runs"""
+        def run_with_models():
+            if not self.detector.use_models(model_names):
+                print(f"⚠️ Models {model_names} unavailable - running with current model")
+            return command()
+        return run_with_models
+    
     def click_object(self, object_type: str, confidence_threshold: float = 0.1) -> bool:
         """Detect and click on an object of specified type"""
         try:
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test script for the bot launcher
+Preloads a tiny ONNX model and forks a worker that runs it, on POSIX hosts
+without Windows, torch or the game
+"""
+
+import sys
+import os
+import gc
+import io
+import time
+import contextlib
+import signal
+import tempfile
+import multiprocessing
+
+# Add the project root and Model Management directory to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(project_root)
+sys.path.append(os.path.join(project_root, 'B', 'Model_Management'))
+
+from bot_launcher import BotLauncher, preload_models
+from model_registry import get_model_registry
+from runescape_models import register_runescape_models
+from tiny_yolo_model import build_tiny_yolo
+
+
+def test_preload_and_forked_worker():
+    """The parent preloads without Windows modules and a forked worker detects with the shared model"""
+    print("🧪 Testing preload and fork...")
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        print("⏭️ fork is not available on this platform")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        registry = get_model_registry()
+        registry.register('tiny', build_tiny_yolo(os.path.join(tmp_dir, 'tiny.onnx')), footprint_mb=1)
+        try:
+            assert preload_models(['tiny']) is registry
+            assert 'tiny' in registry.resident_models() and 'chicken' in registry.specs
+            assert 'command_processor' not in sys.modules and 'runescape_yolo_detector' not in sys.modules
+            # Workers' detectors registering again keep the parent's specs (and tuned configs)
+            specs = dict(registry.specs)
+            register_runescape_models(registry)
+            assert all(registry.specs[name] is spec for name, spec in specs.items())
+
+            # Commands are dropped off Windows instead of failing to import in the parent
+            total_uss_mb = BotLauncher(1, ['tiny'], commands=['attack chicken']).launch_forked()
+            assert total_uss_mb > 0
+        finally:
+            registry.evict('tiny')
+            gc.unfreeze()
+    print(f"✅ Forked worker ready, {total_uss_mb:.1f} MB USS in total")
+
+
+def test_worker_killed_before_ready():
+    """A worker killed before it reports (segfault, OOM kill) is reported as failed instead of hanging"""
+    print("🧪 Testing killed worker...")
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        print("⏭️ fork is not available on this platform")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        registry = get_model_registry()
+        registry.register('tiny', build_tiny_yolo(os.path.join(tmp_dir, 'tiny.onnx')), footprint_mb=1)
+        try:
+            model = registry.get('tiny', tune=False)
+            # Warm-up in the forked worker dies without reaching run_worker's except
+            model.detect = lambda frame: os.kill(os.getpid(), signal.SIGKILL)
+            start = time.time()
+            total_uss_mb = BotLauncher(1, ['tiny']).launch_forked()
+            elapsed = time.time() - start
+        finally:
+            registry.evict('tiny')
+            gc.unfreeze()
+    assert total_uss_mb == 0.0
+    assert elapsed < 30
+    print(f"✅ Killed worker reported in {elapsed:.1f}s")
+
+
+def test_independent_bot_exits_before_ready():
+    """An independent bot that exits during startup is reported instead of measured"""
+    print("🧪 Testing independent bot startup failure...")
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        total_uss_mb = BotLauncher(1, ['no_such_model']).launch_independent()
+    assert total_uss_mb == 0.0
+    # Reported as a failed start, not measured as a dead process
+    assert 'exited before they were ready' in output.getvalue() and 'USS MB' not in output.getvalue()
+    print("✅ Exited bot reported")
+
+
+def main():
+    """Run all bot launcher tests"""
+    print("🚀 Bot Launcher Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_preload_and_forked_worker()
+    test_worker_killed_before_ready()
+    test_independent_bot_exits_before_ready()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for the inference backend auto-tuner
+Covers the accuracy metric and the per-host cache without running any model
+"""
+
+import sys
+import os
+import time
+import tempfile
+
+import numpy as np
+
+# Add the Model Management directory to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(os.path.join(project_root, 'B', 'Model_Management'))
+
+from inference_tuner import TuningCache, compiled_model_path, detection_agreement, _export_path, _load_without_torch
+from model_registry import ModelSpec
+
+
+def test_detection_agreement():
+    """Agreement is F1 of class-matched boxes at IoU 0.5"""
+    print("🧪 Testing detection agreement...")
+    reference = np.array([[0, 0, 100, 100, 0.9, 0], [200, 200, 300, 300, 0.8, 1]], dtype=np.float32)
+
+    assert detection_agreement(reference, reference) == 1.0
+    # Slightly shifted boxes still match
+    assert detection_agreement(reference + [5, 5, 5, 5, 0, 0], reference) == 1.0
+    # A missed detection halves recall
+    assert abs(detection_agreement(reference[:1], reference) - 2 / 3) < 1e-6
+    # Same box with a different class does not match
+    wrong_class = reference.copy()
+    wrong_class[:, 5] = [1, 0]
+    assert detection_agreement(wrong_class, reference) == 0.0
+    assert detection_agreement(np.zeros((0, 6)), np.zeros((0, 6))) == 1.0
+    print("✅ Agreement metric behaves as expected")
+
+
+def test_tuning_cache_round_trip():
+    """Stored configurations are returned for the same model on this host"""
+    print("🧪 Testing tuning cache...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = TuningCache(os.path.join(tmp_dir, 'tuning.json'))
+        assert cache.lookup('abc') is None
+
+        config = {'backend': 'onnxruntime', 'threads': None, 'imgsz': 416}
+        cache.store('abc', config)
+        assert TuningCache(cache.path).lookup('abc') == config
+        assert cache.lookup('other') is None
+    print("✅ Cache keeps configurations per host and model")
+
+
+def test_compiled_model_path_keys():
+    """Compiled models sit next to the weights, keyed by hash, backend and imgsz"""
+    print("🧪 Testing compiled model cache keys...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        weights_path = os.path.join(tmp_dir, 'best.pt')
+        with open(weights_path, 'wb') as f:
+            f.write(b'weights v1')
+
+        ort_path = compiled_model_path(weights_path, 'onnxruntime', 416)
+        assert os.path.dirname(ort_path) == os.path.join(tmp_dir, '.compiled')
+        assert ort_path.endswith('-onnxruntime-416.ort')
+        assert compiled_model_path(weights_path, 'onnxruntime', 320) != ort_path
+        assert compiled_model_path(weights_path, 'torch', 416).endswith('.torchscript')
+
+        # Retrained weights get a new cache entry
+        with open(weights_path, 'wb') as f:
+            f.write(b'weights v2 retrained')
+        assert compiled_model_path(weights_path, 'onnxruntime', 416) != ort_path
+    print("✅ Cache keys change with weights, backend and imgsz")
+
+
+def test_exports_keyed_by_weights():
+    """Retrained weights are never served an export of the old weights"""
+    print("🧪 Testing export keys...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        weights_path = os.path.join(tmp_dir, 'best.pt')
+        with open(weights_path, 'wb') as f:
+            f.write(b'weights v1')
+        onnx_path = _export_path(weights_path, 'onnxruntime', 416)
+        assert onnx_path.endswith('-416.onnx') and onnx_path != _export_path(weights_path, 'onnxruntime', 320)
+        with open(onnx_path, 'wb') as f:
+            f.write(b'export of v1')
+
+        with open(weights_path, 'wb') as f:
+            f.write(b'weights v2 retrained')
+        assert _export_path(weights_path, 'onnxruntime', 416) != onnx_path
+        assert _export_path(weights_path, 'openvino', 416).endswith('-416_openvino_model')
+        try:
+            _load_without_torch(ModelSpec('trained', weights_path))
+            assert False, "stale export was loaded"
+        except RuntimeError as e:
+            assert 'No ONNX export' in str(e)
+    print("✅ Exports change with the weights")
+
+
+def main():
+    """Run all inference tuner tests"""
+    print("⚙️ Inference Tuner Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_detection_agreement()
+    test_tuning_cache_round_trip()
+    test_compiled_model_path_keys()
+    test_exports_keyed_by_weights()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Test script for the memory-budgeted model registry
+Uses a stand-in loader so no YOLO weights or GPU are needed
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Add the Model Management directory to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(os.path.join(project_root, 'B', 'Model_Management'))
+
+from model_registry import ModelRegistry
+
+
+def _make_registry(budget_mb=250):
+    """Registry with three 100 MB models and a recording loader"""
+    loaded = []
+
+    def fake_loader(spec):
+        loaded.append(spec.name)
+        return f"model:{spec.name}"
+
+    registry = ModelRegistry(memory_budget_mb=budget_mb, loader=fake_loader)
+    registry.register('chicken', 'chicken.pt', next_likely=['woodcutting'], footprint_mb=100)
+    registry.register('woodcutting', 'woodcutting.pt', next_likely=['mining'], footprint_mb=100)
+    registry.register('mining', 'mining.pt', footprint_mb=100)
+    return registry, loaded
+
+
+def _wait_for_prefetch(registry):
+    """Wait for the background prefetch to finish"""
+    thread = registry._prefetch_thread
+    if thread:
+        thread.join(timeout=5)
+
+
+def test_lru_eviction_within_budget():
+    """Loading past the budget evicts the least recently used model"""
+    print("🧪 Testing LRU eviction...")
+    registry, loaded = _make_registry(budget_mb=250)
+
+    registry.get('chicken')
+    registry.get('woodcutting')
+    registry.get('chicken')  # chicken is now most recently used
+    registry.get('mining')   # must evict woodcutting
+
+    assert registry.resident_models() == ['chicken', 'mining']
+    assert registry.resident_mb() <= 250
+    assert loaded == ['chicken', 'woodcutting', 'mining']
+    print("✅ LRU eviction keeps usage within budget")
+
+
+def test_require_prefetches_next_likely():
+    """Requiring an activity's model prefetches the next likely one"""
+    print("🧪 Testing next-likely prefetch...")
+    registry, loaded = _make_registry(budget_mb=250)
+
+    registry.require(['chicken'])
+    _wait_for_prefetch(registry)
+
+    assert 'woodcutting' in registry.resident_models()
+    # Switching activity does not reload the prefetched model
+    registry.require(['woodcutting'])
+    _wait_for_prefetch(registry)
+    assert loaded.count('woodcutting') == 1
+    print("✅ Prefetched model reused on activity switch")
+
+
+def test_prefetch_never_tunes():
+    """Prefetched models load without the tuning benchmark, required ones with it"""
+    print("🧪 Testing untuned prefetch...")
+    tuned, untuned = [], []
+    registry = ModelRegistry(memory_budget_mb=250, loader=lambda spec: tuned.append(spec.name),
+                             untuned_loader=lambda spec: untuned.append(spec.name))
+    registry.register('chicken', 'chicken.pt', next_likely=['woodcutting'], footprint_mb=100)
+    registry.register('woodcutting', 'woodcutting.pt', footprint_mb=100)
+
+    registry.require(['chicken'])
+    _wait_for_prefetch(registry)
+
+    assert tuned == ['chicken'] and untuned == ['woodcutting']
+    print("✅ Tuning kept out of the prefetch thread")
+
+
+def test_pinned_models_survive_prefetch():
+    """Prefetch never evicts the models the current command needs"""
+    print("🧪 Testing pinned models...")
+    registry, loaded = _make_registry(budget_mb=150)
+
+    registry.require(['chicken'])
+    _wait_for_prefetch(registry)
+
+    assert registry.resident_models() == ['chicken']
+    print("✅ Prefetch skipped when it would not fit next to pinned models")
+
+
+def _make_gated_registry(budget_mb, gated):
+    """Registry whose loader blocks loading the gated model until the returned event is set"""
+    gate = threading.Event()
+
+    def slow_loader(spec):
+        if spec.name == gated:
+            gate.wait(timeout=5)
+        return f"model:{spec.name}"
+
+    registry = ModelRegistry(memory_budget_mb=budget_mb, loader=slow_loader)
+    for name in ('chicken', 'woodcutting', 'mining'):
+        registry.register(name, f"{name}.pt", footprint_mb=100)
+    return registry, gate
+
+
+def test_loads_in_progress_count_against_budget():
+    """A foreground load next to a running prefetch evicts instead of overcommitting"""
+    print("🧪 Testing in-flight reservations...")
+    registry, gate = _make_gated_registry(budget_mb=200, gated='woodcutting')
+    registry.get('chicken')
+    registry.prefetch(['woodcutting'])
+    while 'woodcutting' not in registry._loading:
+        time.sleep(0.001)
+
+    registry.get('mining')   # woodcutting is still loading: chicken must make room
+    gate.set()
+    _wait_for_prefetch(registry)
+
+    assert sorted(registry.resident_models()) == ['mining', 'woodcutting']
+    assert registry.resident_mb() <= 200
+    print("✅ Budget held with a prefetch in flight")
+
+
+def test_prefetch_requests_are_queued():
+    """Names prefetched while a prefetch is running are loaded after it"""
+    print("🧪 Testing queued prefetch...")
+    registry, gate = _make_gated_registry(budget_mb=300, gated='chicken')
+    registry.prefetch(['chicken'])
+    registry.prefetch(['woodcutting', 'chicken'])
+    registry.prefetch(['mining'])
+    gate.set()
+    _wait_for_prefetch(registry)
+
+    assert sorted(registry.resident_models()) == ['chicken', 'mining', 'woodcutting']
+    print("✅ Later prefetches merged into the running one")
+
+
+def test_waiting_on_untuned_prefetch_still_tunes():
+    """A foreground load that waited on an untuned prefetch gets a tuned model, unless one is cached"""
+    print("🧪 Testing tune request during prefetch...")
+    for cached in (False, True):
+        gate = threading.Event()
+        loads = []
+
+        def untuned_loader(spec):
+            gate.wait(timeout=5)
+            loads.append(('untuned', spec.name))
+            return f"untuned:{spec.name}"
+
+        def tuned_loader(spec):
+            loads.append(('tuned', spec.name))
+            return f"tuned:{spec.name}"
+
+        registry = ModelRegistry(memory_budget_mb=250, loader=tuned_loader, untuned_loader=untuned_loader,
+                                 has_tuned_config=lambda spec: cached)
+        registry.register('woodcutting', 'woodcutting.pt', footprint_mb=100)
+        registry.prefetch(['woodcutting'])
+        while 'woodcutting' not in registry._loading:
+            time.sleep(0.001)
+
+        threading.Timer(0.05, gate.set).start()
+        model = registry.get('woodcutting')   # Waits for the prefetch
+        _wait_for_prefetch(registry)
+
+        if cached:
+            # The untuned load already used the cached tuned config: no second load
+            assert model == 'untuned:woodcutting' and loads == [('untuned', 'woodcutting')]
+        else:
+            assert model == 'tuned:woodcutting'
+            assert loads == [('untuned', 'woodcutting'), ('tuned', 'woodcutting')]
+            assert registry.get('woodcutting') == 'tuned:woodcutting' and len(loads) == 2
+        assert registry.resident_mb() <= 250
+    print("✅ Tuning request honoured after waiting on the prefetch")
+
+
+def test_fallback_when_weights_missing():
+    """Models whose weights are missing resolve to their fallback"""
+    print("🧪 Testing fallback resolution...")
+    registry, loaded = _make_registry()
+    registry.register('trained', os.path.join('missing', 'best.pt'), fallback='chicken', footprint_mb=100)
+
+    assert registry.get('trained') == 'model:chicken'
+    assert loaded == ['chicken']
+    print("✅ Missing weights fall back to registered model")
+
+
+def test_reregistering_keeps_tuned_config():
+    """Detectors re-registering the same weights keep the tuned config, new weights replace it"""
+    print("🧪 Testing re-registration...")
+
+    def tuning_loader(spec):
+        spec.inference_config = {'backend': 'onnx', 'threads': 2, 'imgsz': 480}
+        return f"model:{spec.weights_path}"
+
+    registry = ModelRegistry(memory_budget_mb=250, loader=tuning_loader)
+    registry.register('generic', 'yolov8n.pt', footprint_mb=100)
+    registry.get('generic')
+    registry.register('generic', 'yolov8n.pt', footprint_mb=100)
+
+    assert registry.inference_config('generic') == {'backend': 'onnx', 'threads': 2, 'imgsz': 480}
+    assert registry.resident_models() == ['generic']
+
+    registry.register('generic', 'yolov8s.pt', footprint_mb=100)
+    assert registry.inference_config('generic') == {}
+    assert registry.get('generic') == 'model:yolov8s.pt'
+    print("✅ Tuned config survives re-registration")
+
+
+def test_after_fork_reopens_models():
+    """Forked workers reopen fork-unsafe model state and keep resident models"""
+    print("🧪 Testing after-fork reopen...")
+
+    class ReopenableModel:
+        def __init__(self):
+            self.reopened = 0
+
+        def reopen(self):
+            self.reopened += 1
+
+    registry = ModelRegistry(memory_budget_mb=250, loader=lambda spec: ReopenableModel())
+    registry.register('chicken', 'chicken.pt', footprint_mb=100)
+    model = registry.get('chicken')
+
+    registry.after_fork()
+
+    assert model.reopened == 1
+    assert registry.get('chicken') is model
+    print("✅ Resident models reopened without reloading")
+
+
+def main():
+    """Run all model registry tests"""
+    print("📦 Model Registry Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_lru_eviction_within_budget()
+    test_require_prefetches_next_likely()
+    test_prefetch_never_tunes()
+    test_pinned_models_survive_prefetch()
+    test_loads_in_progress_count_against_budget()
+    test_prefetch_requests_are_queued()
+    test_waiting_on_untuned_prefetch_still_tunes()
+    test_fallback_when_weights_missing()
+    test_reregistering_keeps_tuned_config()
+    test_after_fork_reopens_models()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
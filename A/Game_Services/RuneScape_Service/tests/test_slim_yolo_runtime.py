@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Test script for the torch-free YOLO runtime
+Checks letterboxing, YOLOv8 output decoding and NMS on synthetic data, and the
+compiled-model cache on a tiny generated model
+"""
+
+import sys
+import os
+import time
+import tempfile
+
+import numpy as np
+
+# Add the Model Management directory to path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(os.path.join(project_root, 'B', 'Model_Management'))
+
+from slim_yolo_runtime import SlimYOLO, decode_yolov8, letterbox, nms
+from inference_tuner import compiled_model_path
+from tiny_yolo_model import TINY_IMGSZ, TINY_NAMES, build_tiny_yolo
+
+
+def _raw_output(rows, num_classes=3):
+    """Build a (1, 4 + classes, anchors) output from (cx, cy, w, h, class_id, score) rows"""
+    output = np.zeros((1, 4 + num_classes, len(rows)), dtype=np.float32)
+    for anchor, (cx, cy, w, h, class_id, score) in enumerate(rows):
+        output[0, :4, anchor] = (cx, cy, w, h)
+        output[0, 4 + class_id, anchor] = score
+    return output
+
+
+def test_letterbox_keeps_aspect_ratio():
+    """Wide frames are scaled to fit and padded top and bottom"""
+    print("🧪 Testing letterbox...")
+    frame = np.zeros((360, 640, 3), dtype=np.uint8)
+    frame[:, :, 0] = 255  # Blue in BGR
+
+    blob, scale, (left, top) = letterbox(frame, 320)
+
+    assert blob.shape == (1, 3, 320, 320) and blob.dtype == np.float32
+    assert scale == 0.5 and left == 0 and top == 70
+    # Channels are flipped to RGB and padding uses the training fill colour
+    assert blob[0, 2, 160, 160] == 1.0 and blob[0, 0, 160, 160] == 0.0
+    assert abs(blob[0, 0, 0, 0] - 114 / 255) < 1e-6
+    print("✅ Letterbox matches ultralytics preprocessing")
+
+
+def test_decode_applies_classwise_nms():
+    """Overlapping boxes of one class are suppressed, other classes are kept"""
+    print("🧪 Testing decode and NMS...")
+    output = _raw_output([
+        (100, 100, 50, 50, 0, 0.9),
+        (102, 101, 50, 50, 0, 0.8),  # Duplicate of the first box
+        (101, 100, 50, 50, 1, 0.7),  # Same place, different class
+        (300, 300, 40, 40, 2, 0.1),  # Below confidence threshold
+    ])
+
+    detections = decode_yolov8(output, conf_threshold=0.25, iou_threshold=0.45)
+
+    assert detections.shape == (2, 6)
+    assert list(detections[:, 5]) == [0, 1]
+    np.testing.assert_allclose(detections[0, :5], [75, 75, 125, 125, 0.9], rtol=1e-6)
+    print("✅ Decode returns one box per object and class")
+
+
+def test_nms_orders_by_score():
+    """NMS keeps the best box first and drops overlapping ones"""
+    print("🧪 Testing NMS ordering...")
+    boxes = np.array([[0, 0, 10, 10], [1, 1, 11, 11], [50, 50, 60, 60]], dtype=np.float32)
+    scores = np.array([0.5, 0.9, 0.7], dtype=np.float32)
+
+    assert list(nms(boxes, scores, 0.5)) == [1, 2]
+    print("✅ NMS keeps highest scoring boxes")
+
+
+def _raw(model, blob):
+    """Raw model output for an input blob"""
+    return model.session.run(None, {model.input_name: blob})[0]
+
+
+def test_compiled_model_round_trip():
+    """The cached ORT model is portable, reused on restart and matches the ONNX model"""
+    print("🧪 Testing compiled model cache...")
+    blob = np.random.default_rng(1).random((1, 3, TINY_IMGSZ, TINY_IMGSZ), dtype=np.float32)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        onnx_path = build_tiny_yolo(os.path.join(tmp_dir, 'tiny.onnx'))
+        compiled_path = compiled_model_path(onnx_path, 'onnxruntime', TINY_IMGSZ)
+        reference = _raw(SlimYOLO(onnx_path), blob)
+
+        first = SlimYOLO(onnx_path, compiled_path=compiled_path)
+        with open(compiled_path, 'rb') as f:
+            compiled = f.read()
+        # No NCHWc layout nodes: those kernels depend on the CPU that optimised the model
+        assert b'ReorderOutput' not in compiled and b'ReorderInput' not in compiled
+        stored_at = os.stat(compiled_path).st_mtime_ns
+
+        second = SlimYOLO(onnx_path, compiled_path=compiled_path)
+        assert second._model_bytes == compiled and os.stat(compiled_path).st_mtime_ns == stored_at
+        assert second.names == TINY_NAMES and second.imgsz == TINY_IMGSZ
+        np.testing.assert_allclose(_raw(first, blob), reference, rtol=1e-4, atol=1e-5)
+        np.testing.assert_allclose(_raw(second, blob), reference, rtol=1e-4, atol=1e-5)
+    print("✅ Compiled model reused and matches the ONNX model")
+
+
+def test_compiled_model_invalidation():
+    """Retrained weights get a fresh compiled model, a corrupt cache is rebuilt"""
+    print("🧪 Testing compiled model invalidation...")
+    blob = np.random.default_rng(1).random((1, 3, TINY_IMGSZ, TINY_IMGSZ), dtype=np.float32)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        onnx_path = build_tiny_yolo(os.path.join(tmp_dir, 'tiny.onnx'))
+        old_path = compiled_model_path(onnx_path, 'onnxruntime', TINY_IMGSZ)
+        old_output = _raw(SlimYOLO(onnx_path, compiled_path=old_path), blob)
+
+        build_tiny_yolo(onnx_path, seed=7)
+        new_path = compiled_model_path(onnx_path, 'onnxruntime', TINY_IMGSZ)
+        assert new_path != old_path
+        retrained = SlimYOLO(onnx_path, compiled_path=new_path)
+        assert os.path.exists(new_path)
+        np.testing.assert_allclose(_raw(retrained, blob), _raw(SlimYOLO(onnx_path), blob), rtol=1e-4, atol=1e-5)
+        assert not np.allclose(_raw(retrained, blob), old_output)
+
+        with open(new_path, 'wb') as f:
+            f.write(b'truncated')
+        rebuilt = SlimYOLO(onnx_path, compiled_path=new_path)
+        np.testing.assert_allclose(_raw(rebuilt, blob), _raw(retrained, blob), rtol=1e-4, atol=1e-5)
+        assert os.path.getsize(new_path) > len(b'truncated')
+    print("✅ Stale and corrupt compiled models are replaced")
+
+
+def main():
+    """Run all slim runtime tests"""
+    print("🪶 Slim YOLO Runtime Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_letterbox_keeps_aspect_ratio()
+    test_decode_applies_classwise_nms()
+    test_nms_orders_by_score()
+    test_compiled_model_round_trip()
+    test_compiled_model_invalidation()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
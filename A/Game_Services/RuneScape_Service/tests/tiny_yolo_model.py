@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Tiny YOLOv8-shaped ONNX model for tests
+A few random convolutions with the exporter's output layout (1, 4 + classes,
+anchors) and metadata, small enough to build and run in milliseconds.
+"""
+
+import numpy as np
+import onnx
+from onnx import TensorProto, helper, numpy_helper
+
+TINY_IMGSZ = 32
+TINY_NAMES = {0: 'chicken', 1: 'cow'}
+
+
+def build_tiny_yolo(path: str, seed: int = 0, imgsz: int = TINY_IMGSZ, names=None):
+    """Write a tiny model to path; a different seed stands in for retrained weights"""
+    names = TINY_NAMES if names is None else names
+    rng = np.random.default_rng(seed)
+    channels, outputs = 16, 4 + len(names)
+
+    def weights(name, shape):
+        return numpy_helper.from_array(rng.normal(0, 0.1, shape).astype(np.float32), name)
+
+    initializers = [weights('w1', (channels, 3, 3, 3)), weights('w2', (channels, channels, 3, 3)),
+                    weights('w3', (outputs, channels, 1, 1)),
+                    numpy_helper.from_array(np.array([1, outputs, -1], dtype=np.int64), 'shape')]
+    nodes = [
+        helper.make_node('Conv', ['images', 'w1'], ['conv1'], pads=[1, 1, 1, 1]),
+        helper.make_node('Relu', ['conv1'], ['relu1']),
+        helper.make_node('Conv', ['relu1', 'w2'], ['conv2'], pads=[1, 1, 1, 1]),
+        helper.make_node('Relu', ['conv2'], ['relu2']),
+        helper.make_node('Conv', ['relu2', 'w3'], ['head']),
+        helper.make_node('Reshape', ['head', 'shape'], ['output0']),
+    ]
+    graph = helper.make_graph(
+        nodes, 'tiny_yolo',
+        [helper.make_tensor_value_info('images', TensorProto.FLOAT, [1, 3, imgsz, imgsz])],
+        [helper.make_tensor_value_info('output0', TensorProto.FLOAT, [1, outputs, imgsz * imgsz])],
+        initializers)
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid('', 17)], ir_version=8)
+    helper.set_model_props(model, {'names': str(names), 'imgsz': str([imgsz, imgsz])})
+    onnx.save(model, path)
+    return path
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Action Voting
+Confirms an avoidance action before the loops act on it. Each frame's decision
+is a vote; a manoeuvre is only committed once it wins K of the last N votes, so
+a single false-positive bench or person no longer costs a full manoeuvre. K and
+N depend on how close the threat is, danger-proximity decisions act at once,
+and going forward never waits. Loops vote exactly once per frame.
+"""
+
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+# (votes required, of the last N frames) per decision proximity; None acts at once
+VOTING_RULES: Dict[str, Optional[Tuple[int, int]]] = {
+    'danger': None,
+    'close': (2, 3),
+    'medium': (3, 5),
+    'safe': (3, 5),
+}
+# Decisions without a proximity (e.g. the skyline's run)
+DEFAULT_VOTING_RULE = (3, 5)
+
+
+class ActionVoter:
+    """K-of-N confirmation of the actions a policy proposes frame by frame"""
+
+    def __init__(self, default_action: str = 'forward', rules: Optional[Dict] = None,
+                 default_rule: Tuple[int, int] = DEFAULT_VOTING_RULE):
+        self.default_action = default_action
+        self.rules = dict(VOTING_RULES if rules is None else rules)
+        self.default_rule = default_rule
+        window = max([rule[1] for rule in self.rules.values() if rule] + [default_rule[1]])
+        self._votes = deque(maxlen=window)
+        self.suppressed = 0  # Candidate frames held back so far
+        self.reset()
+
+    def reset(self):
+        """Forget the votes (e.g. after a recovery manoeuvre changed the view)"""
+        self._votes.clear()
+
+    def vote(self, decision: Dict) -> Dict:
+        """Record this frame's decision, returns it once confirmed, else a forward decision
+
+        An unconfirmed decision comes back with the default action, its own
+        action as 'candidate' and the votes it has so far.
+        """
+        action = decision['action']
+        self._votes.append(action)
+        if action == self.default_action:
+            return decision
+
+        rule = self.rules.get(decision.get('proximity'), self.default_rule)
+        if rule is None:
+            return decision
+        required, window = rule
+        votes = sum(1 for vote in list(self._votes)[-window:] if vote == action)
+        if votes >= required:
+            return decision
+
+        self.suppressed += 1
+        return dict(decision, action=self.default_action, reason=f"confirming_{decision['reason']}",
+                    candidate=action, votes=votes)
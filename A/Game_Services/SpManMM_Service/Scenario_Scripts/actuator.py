@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Manoeuvre Actuator
+Runs timed key manoeuvres (swings, runs, combos) on their own thread, so the
+perception loop keeps processing frames while a manoeuvre plays out. The loop
+can queue the next manoeuvre while one is running, or pre-empt it to redirect;
+waits are interruptible, so an abort takes effect within milliseconds and
+releases every key the manoeuvre was holding.
+"""
+
+import time
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+# A manoeuvre step: ('down', key), ('up', key), ('wait', seconds) or ('print', message)
+Step = Tuple[str, Union[str, float]]
+
+# Seconds a manoeuvre runs before perception may redirect it (avoids flip-flopping)
+REDIRECT_AFTER_S = 0.3
+
+
+def timeline(events: Sequence[Tuple[float, str, str]]) -> List[Step]:
+    """Steps from (time, 'down'/'up', key) events, as overlapping key holds are easiest written"""
+    steps: List[Step] = []
+    now = 0.0
+    for at, action, key in sorted(events, key=lambda event: event[0]):
+        if at > now:
+            steps.append(('wait', at - now))
+            now = at
+        steps.append((action, key))
+    return steps
+
+
+def swing_turn_steps(keys: Dict[str, str], direction: str) -> List[Step]:
+    """Swing while turning for 1 second, then swing forward for 1 second"""
+    return [
+        ('print', f"   Executing {direction} swing..."),
+        ('down', keys[direction]), ('down', keys['swing']), ('wait', 1.0), ('up', keys[direction]),
+        ('print', "   Resuming forward motion..."),
+        ('down', keys['forward']), ('wait', 1.0), ('up', keys['forward']), ('up', keys['swing']),
+    ]
+
+
+def run_steps(keys: Dict[str, str], duration: float = 1.0) -> List[Step]:
+    """Sprint along the ground (swing key without jumping)"""
+    return [
+        ('print', "   No swing anchors - running..."),
+        ('down', keys['forward']), ('down', keys['swing']), ('wait', duration),
+        ('up', keys['swing']), ('up', keys['forward']),
+    ]
+
+
+def web_swing_combo_steps(keys: Dict[str, str]) -> List[Step]:
+    """Web-swing combo: sprint, jump release at 1s, swing resets at 5s and 6s, 10s in total"""
+    swing, forward, jump = keys['swing'], keys['forward'], keys['jump']
+    return [('print', "Web-Swing Combo!")] + timeline([
+        (0, 'down', swing), (0, 'down', forward),
+        (1, 'down', jump), (2, 'up', jump),
+        (5, 'up', swing), (6, 'down', swing),
+        (6, 'up', swing), (7, 'down', swing),
+        (10, 'up', swing), (10, 'up', forward),
+    ])
+
+
+
+def swing_manoeuvre_steps(keys: Dict[str, str], action: str) -> Optional[List[Step]]:
+    """Steps of the auto-swing manoeuvre for a decided action
+
+    'forward' has none: the swing already under way simply carries on.
+    """
+    if action in ('left_swing', 'right_swing'):
+        return swing_turn_steps(keys, action.split('_')[0])
+    if action == 'run':
+        return run_steps(keys)
+    if action == 'forward':
+        return None
+    raise ValueError(f"Unknown swing action: {action}")
+
+
+def submit_swing_action(actuator: 'ManoeuvreActuator', keys: Dict[str, str], action: str,
+                        preempt: bool = False):
+    """Queue the manoeuvre for an auto-swing action, or start it now with preempt
+
+    'forward' starts nothing and drops any queued manoeuvre, so the current
+    swing carries on.
+    """
+    steps = swing_manoeuvre_steps(keys, action)
+    if steps is None:
+        actuator.cancel_pending()
+    else:
+        actuator.submit(action, steps, preempt)
+
+
+class ManoeuvreActuator:
+    """Plays one manoeuvre at a time on a worker thread, with a single pending slot
+
+    submit() while busy either queues the manoeuvre to run next (replacing any
+    queued one, so the latest decision wins) or, with preempt, aborts the
+    current one and runs the new one straight away.
+    """
+
+    def __init__(self, key_down: Callable[[str], None], key_up: Callable[[str], None]):
+        self.key_down = key_down
+        self.key_up = key_up
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._abort = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        self._pending: Optional[Tuple[str, List[Step]]] = None
+        self._held: List[str] = []
+        self.current: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.aborted = 0
+
+    # === COMMANDS ===
+
+    def submit(self, name: str, steps: Sequence[Step], preempt: bool = False):
+        """Run a manoeuvre next, or right away (aborting the current one) with preempt"""
+        with self._lock:
+            self._pending = (name, list(steps))
+            if preempt and self.current is not None:
+                self._abort.set()
+        self._wake.set()
+
+    def cancel_pending(self):
+        """Drop the queued manoeuvre, the current one keeps running"""
+        with self._lock:
+            self._pending = None
+
+    def abort(self):
+        """Stop the current manoeuvre and drop the queued one"""
+        with self._lock:
+            self._pending = None
+            if self.current is not None:
+                self._abort.set()
+
+    # === STATE ===
+
+    @property
+    def busy(self) -> bool:
+        """A manoeuvre is running or queued"""
+        return self.current is not None or self._pending is not None
+
+    @property
+    def pending(self) -> Optional[str]:
+        """Name of the queued manoeuvre"""
+        pending = self._pending
+        return pending[0] if pending else None
+
+    def elapsed(self) -> float:
+        """Seconds the current manoeuvre has been running (0 when idle)"""
+        if self.current is None or self.started_at is None:
+            return 0.0
+        return time.perf_counter() - self.started_at
+
+    def idle_for(self) -> float:
+        """Seconds since the last manoeuvre finished (0 while busy, inf before the first)"""
+        if self.busy:
+            return 0.0
+        if self.finished_at is None:
+            return float('inf')
+        return time.perf_counter() - self.finished_at
+
+    # === WORKER THREAD ===
+
+    def start(self):
+        """Start the worker thread"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Abort everything, release held keys and stop the worker"""
+        self._running = False
+        self.abort()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        """Wait for submitted manoeuvres and play them in order"""
+        while self._running:
+            self._wake.wait()
+            with self._lock:
+                self._wake.clear()
+                job, self._pending = self._pending, None
+                if job is None:
+                    continue
+                self._abort.clear()
+                self.current, self.started_at = job[0], time.perf_counter()
+            try:
+                self._play(job[1])
+            except Exception as e:
+                print(f"❌ Manoeuvre {job[0]} failed: {e}")
+            finally:
+                self._release_all()
+                with self._lock:
+                    self.current = None
+                    self.finished_at = time.perf_counter()
+                    if self._pending is not None:
+                        self._wake.set()
+
+    def _play(self, steps: List[Step]):
+        """Send the steps, stopping at the first wait interrupted by an abort"""
+        for action, value in steps:
+            if self._abort.is_set():
+                break
+            if action == 'down':
+                self.key_down(value)
+                self._held.append(value)
+            elif action == 'up':
+                self.key_up(value)
+                if value in self._held:
+                    self._held.remove(value)
+            elif action == 'wait':
+                if self._abort.wait(value):
+                    break
+            elif action == 'print':
+                print(value)
+        if self._abort.is_set():
+            self.aborted += 1
+
+    def _release_all(self):
+        """Release keys left down by an aborted (or badly written) manoeuvre"""
+        for key in reversed(self._held):
+            try:
+                self.key_up(key)
+            except Exception as e:
+                print(f"⚠️ Failed to release {key}: {e}")
+        self._held.clear()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Buffer Pool
+Reusable output arrays for the classical-CV pipelines. OpenCV and NumPy calls
+write into pooled buffers through dst=/out=, so a steady detection loop does not
+allocate frame-sized arrays; buffers are only reallocated when the frame
+geometry (e.g. the game window size) changes.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+class BufferPool:
+    """Named arrays for one pipeline, reallocated only when their shape changes
+
+    A pool is not thread-safe: give each detection loop its own. Arrays handed
+    out are overwritten by the next frame, so copy anything that must be kept.
+    """
+
+    def __init__(self):
+        self._buffers: Dict[str, np.ndarray] = {}
+        self.allocations = 0
+
+    def get(self, name: str, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """The buffer called name with this shape and dtype (contents undefined)"""
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buffer
+            self.allocations += 1
+        return buffer
+
+    def clear(self):
+        """Drop every buffer"""
+        self._buffers.clear()
+
+
+def pooled(buffers: Optional[BufferPool], name: str, shape: Tuple[int, ...], dtype=np.uint8) -> Optional[np.ndarray]:
+    """Pooled buffer, or None (let OpenCV/NumPy allocate) when there is no pool"""
+    if buffers is None:
+        return None
+    return buffers.get(name, shape, dtype)
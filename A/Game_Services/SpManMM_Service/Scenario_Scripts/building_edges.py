@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Edge-Based Building Detection
+Backup building detector: Canny edges and contours, run on a downscaled pyramid
+level of the frame. Bounding boxes are returned in full-frame coordinates.
+"""
+
+from typing import Dict, List, Optional
+
+import cv2
+import numpy as np
+
+from buffer_pool import BufferPool, pooled
+from image_pyramid import pyramid_down, pyramid_scale
+
+# Pyramid level for edge detection (0 = full resolution, 1 = 1/2, 2 = 1/4)
+EDGE_PYRAMID_LEVEL = 1
+
+# Building-like contours at full resolution: minimum area (px^2) and height (px)
+MIN_BUILDING_AREA = 5000
+MIN_BUILDING_HEIGHT = 100
+
+# Gaussian blur kernel at full resolution (shrinks with the pyramid level)
+BLUR_KERNEL = 5
+
+EDGE_CONFIDENCE = 0.7  # Fixed confidence for edge detection
+
+
+def edge_map(image: np.ndarray, scale: int = 1, buffers: Optional[BufferPool] = None) -> np.ndarray:
+    """Binary (0/255) Canny edges of a BGR image downscaled by scale from the frame"""
+    shape = image.shape[:2]
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=pooled(buffers, 'gray', shape))
+    kernel = max(3, (BLUR_KERNEL // scale) | 1)
+    blurred = cv2.GaussianBlur(gray, (kernel, kernel), 0, dst=pooled(buffers, 'blurred', shape))
+    return cv2.Canny(blurred, 50, 150, edges=pooled(buffers, 'edges', shape))
+
+
+def buildings_from_edges(edges: np.ndarray, scale: int = 1) -> List[Dict]:
+    """Tall contours of an edge map, as building detections in frame pixels"""
+    contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+    # Thresholds in pyramid pixels
+    min_area = MIN_BUILDING_AREA / (scale * scale)
+    min_height = MIN_BUILDING_HEIGHT / scale
+
+    buildings = []
+    for contour in contours:
+        if cv2.contourArea(contour) <= min_area:
+            continue
+        x, y, w, h = cv2.boundingRect(contour)
+        # Building-like proportions: taller than wide
+        if h > w and h > min_height:
+            x, y, w, h = x * scale, y * scale, w * scale, h * scale
+            buildings.append({
+                'bbox': (x, y, x + w, y + h),
+                'confidence': EDGE_CONFIDENCE,
+                'class': 'building_edge',
+                'class_id': -1,
+                'center': (x + w // 2, y + h // 2),
+                'size': (w, h)
+            })
+    return buildings
+
+
+def detect_building_edges(frame: np.ndarray, level: int = EDGE_PYRAMID_LEVEL,
+                          buffers: Optional[BufferPool] = None) -> List[Dict]:
+    """Tall contours in the frame's edge map, as building detections in frame pixels
+
+    With buffers, the image stages write into pooled arrays; only the contours
+    (whose number depends on the scene) are allocated per frame.
+    """
+    scale = pyramid_scale(level)
+    # Downscale first so every later stage touches 1/scale^2 of the pixels
+    small = pyramid_down(frame, level, buffers)
+    return buildings_from_edges(edge_map(small, scale, buffers), scale)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Ego-Motion Estimation
+Sparse Lucas-Kanade optical flow between consecutive downscaled frames tells
+whether the camera (and so the player) is moving, turning or stalled. Corners
+are tracked outside the character and HUD, where the scene only moves if the
+player does. The uniform part of the flow is camera yaw; what remains after
+removing it is parallax from walking forward. Stalling for longer than a short
+grace period is reported as stuck, so walking loops can recover at once.
+"""
+
+from typing import Dict, Optional
+
+import cv2
+import numpy as np
+
+from buffer_pool import BufferPool, pooled
+from image_pyramid import pyramid_down, pyramid_scale
+
+# Pyramid level for the flow (1/4: 480x270 at 1080p)
+EGO_MOTION_PYRAMID_LEVEL = 2
+
+# Corners tracked per frame
+MAX_CORNERS = 80
+CORNER_QUALITY = 0.01
+CORNER_MIN_DISTANCE = 8
+MIN_TRACKED = 12
+
+# Screen region of the character (fractions of width and height), not tracked
+CHARACTER_REGION = (0.35, 0.25, 0.65, 0.85)
+# HUD border (fraction of each side), not tracked
+HUD_MARGIN = 0.05
+
+LK_PARAMS = dict(winSize=(15, 15), maxLevel=2,
+                 criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 20, 0.03))
+
+# Scene speeds in full-resolution px/s
+STALL_SPEED_PX_S = 25      # Median flow below this: nothing is moving
+ROTATION_SPEED_PX_S = 60   # Uniform horizontal flow above this: the camera is turning
+ROTATION_DOMINANCE = 2.0   # ... and it is this many times the parallax
+
+# Stalled for this long while walking means stuck
+STUCK_AFTER_S = 0.6
+
+MOVING, STALLED, ROTATING, UNKNOWN = 'moving', 'stalled', 'rotating', 'unknown'
+
+
+class EgoMotionEstimator:
+    """Moving / stalled / rotating from the optical flow between consecutive frames"""
+
+    def __init__(self, level: int = EGO_MOTION_PYRAMID_LEVEL, stuck_after: float = STUCK_AFTER_S,
+                 buffers: Optional[BufferPool] = None):
+        self.level = level
+        self.scale = pyramid_scale(level)
+        self.stuck_after = stuck_after
+        self.buffers = BufferPool() if buffers is None else buffers
+        self._mask = None
+        self._parity = 0
+        self.reset()
+
+    def reset(self):
+        """Forget the previous frame and the stall timer (e.g. after a recovery manoeuvre)"""
+        self._previous = None
+        self._previous_at: Optional[float] = None
+        self._stalled_since: Optional[float] = None
+
+    def _feature_mask(self, shape) -> np.ndarray:
+        """Where corners may be picked: everywhere but the character and the HUD border"""
+        if self._mask is None or self._mask.shape != shape:
+            height, width = shape
+            mask = np.zeros(shape, dtype=np.uint8)
+            margin_y, margin_x = int(height * HUD_MARGIN), int(width * HUD_MARGIN)
+            mask[margin_y:height - margin_y, margin_x:width - margin_x] = 255
+            x1, y1, x2, y2 = CHARACTER_REGION
+            mask[int(y1 * height):int(y2 * height), int(x1 * width):int(x2 * width)] = 0
+            self._mask = mask
+        return self._mask
+
+    def update(self, frame: np.ndarray, timestamp: float) -> Dict:
+        """Flow from the previous frame to this one, returns the motion state
+
+        translation is the uniform (yaw/pitch) flow and parallax the median flow
+        left after removing it, both in full-resolution px/s.
+        """
+        small = pyramid_down(frame, self.level, self.buffers)
+        shape = small.shape[:2]
+        # Alternate between two gray buffers so the previous frame survives this one
+        self._parity ^= 1
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=pooled(self.buffers, f'gray_{self._parity}', shape))
+
+        previous, previous_at = self._previous, self._previous_at
+        self._previous, self._previous_at = gray, timestamp
+        if previous is None or previous.shape != gray.shape or timestamp <= previous_at:
+            return self._result(UNKNOWN, timestamp)
+
+        corners = cv2.goodFeaturesToTrack(previous, MAX_CORNERS, CORNER_QUALITY, CORNER_MIN_DISTANCE,
+                                          mask=self._feature_mask(shape))
+        if corners is None or len(corners) < MIN_TRACKED:
+            return self._result(UNKNOWN, timestamp)
+        tracked, status, _ = cv2.calcOpticalFlowPyrLK(previous, gray, corners, None, **LK_PARAMS)
+        found = status.ravel() == 1
+        if np.count_nonzero(found) < MIN_TRACKED:
+            return self._result(UNKNOWN, timestamp)
+
+        # Flow in full-resolution px/s
+        flow = (tracked[found] - corners[found]).reshape(-1, 2) * (self.scale / (timestamp - previous_at))
+        speed = float(np.median(np.hypot(flow[:, 0], flow[:, 1])))
+        translation = np.median(flow, axis=0)
+        residual = flow - translation
+        parallax = float(np.median(np.hypot(residual[:, 0], residual[:, 1])))
+
+        if speed < STALL_SPEED_PX_S:
+            state = STALLED
+        elif abs(translation[0]) > ROTATION_SPEED_PX_S and abs(translation[0]) > ROTATION_DOMINANCE * parallax:
+            state = ROTATING
+        else:
+            state = MOVING
+        return self._result(state, timestamp, speed=speed, parallax=parallax,
+                            translation=(float(translation[0]), float(translation[1])), tracked=int(found.sum()))
+
+    def _result(self, state: str, timestamp: float, **motion) -> Dict:
+        """State dict with the stall timer applied (unknown frames neither start nor clear it)"""
+        if state == STALLED:
+            if self._stalled_since is None:
+                self._stalled_since = timestamp
+        elif state != UNKNOWN:
+            self._stalled_since = None
+        stalled_for = 0.0 if self._stalled_since is None else timestamp - self._stalled_since
+        result = {'state': state, 'stalled_for': stalled_for, 'stuck': stalled_for >= self.stuck_after,
+                  'speed': 0.0, 'parallax': 0.0, 'translation': (0.0, 0.0), 'tracked': 0}
+        result.update(motion)
+        return result
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Frame Pacer
+Paces a loop against absolute deadlines instead of sleeping a fixed time after
+the work. Each iteration is due one period after the previous deadline, so the
+rate does not drift with the processing time; an iteration that overruns its
+deadline starts the next one immediately and missed deadlines are skipped, not
+made up. The achieved rate, jitter and overruns are tracked over recent frames.
+"""
+
+import time
+from collections import deque
+from typing import Dict
+
+# Periods kept for the achieved rate and jitter
+PACER_WINDOW = 120
+
+
+class FramePacer:
+    """Deadline-based loop pacing at a declared target rate"""
+
+    def __init__(self, rate_hz: float, name: str = 'loop', window: int = PACER_WINDOW):
+        self.name = name
+        self.rate_hz = rate_hz
+        self.period = 1.0 / rate_hz
+        self._periods = deque(maxlen=window)
+        self.reset()
+
+    def reset(self):
+        """Start pacing afresh from the next wait()"""
+        self._deadline = None
+        self._last_start = None
+        self._periods.clear()
+        self.frames = 0
+        self.overruns = 0
+
+    def wait(self) -> float:
+        """Sleep until this iteration is due, returns the time slept in seconds
+
+        Call once per iteration (at the top of the loop, so early continues are
+        paced too). The first call returns at once.
+        """
+        now = time.perf_counter()
+        slept = 0.0
+        if self._deadline is None:
+            self._deadline = now
+        else:
+            self._deadline += self.period
+            delay = self._deadline - now
+            if delay > 0:
+                time.sleep(delay)
+                slept = delay
+                now = time.perf_counter()
+            else:
+                # Overran: start now and skip the missed deadlines
+                self.overruns += 1
+                self._deadline = now
+
+        if self._last_start is not None:
+            self._periods.append(now - self._last_start)
+        self._last_start = now
+        self.frames += 1
+        return slept
+
+    def stats(self) -> Dict:
+        """Target and achieved rate, jitter (std of the period) and overruns"""
+        periods = list(self._periods)
+        if periods:
+            mean = sum(periods) / len(periods)
+            jitter = (sum((period - mean) ** 2 for period in periods) / len(periods)) ** 0.5
+        else:
+            mean, jitter = 0.0, 0.0
+        return {
+            'target_hz': self.rate_hz,
+            'achieved_hz': 1.0 / mean if mean > 0 else 0.0,
+            'jitter_ms': jitter * 1000,
+            'overruns': self.overruns,
+            'frames': self.frames,
+        }
+
+    def report(self) -> str:
+        """One line of pacing statistics"""
+        stats = self.stats()
+        return (f"⏱️ {self.name}: {stats['achieved_hz']:.1f}/{stats['target_hz']:g} Hz, "
+                f"jitter {stats['jitter_ms']:.1f} ms, {stats['overruns']} overruns in {stats['frames']} frames")
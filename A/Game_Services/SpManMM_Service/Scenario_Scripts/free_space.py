@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Free-Space Map
+Coarse occupancy grid over the screen, rebuilt every frame from fused detections,
+edge density and the path mask. Boxes are rasterised with NumPy broadcasting
+(fractional cell coverage), image layers are area-averaged onto the grid, and
+the grid is collapsed into a cost per heading. The cheapest heading, refined to
+sub-cell precision, is the steering target for both auto-swing and auto-walk.
+"""
+
+import math
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from buffer_pool import BufferPool
+from building_edges import edge_map
+from image_pyramid import pyramid_down, pyramid_scale
+from obstacle_analysis import Detections, detection_array
+from path_detection import path_mask
+
+# Grid cells across and down the frame (60px cells at 1080p)
+GRID_COLUMNS = 32
+GRID_ROWS = 18
+
+# Horizontal camera field of view, maps screen columns to heading angles
+CAMERA_FOV = math.radians(90)
+
+# Pyramid level of the edge and path layers (the grid is far coarser anyway)
+FREE_SPACE_PYRAMID_LEVEL = 2
+
+# Fraction of edge pixels in a cell that counts as fully occupied
+EDGE_SATURATION = 0.25
+
+# Rows further than this from Spider-Man (screen centre) count less
+DISTANCE_FALLOFF_PX = 300
+
+# Cells either side of a heading that Spider-Man's body sweeps through
+BODY_HALF_WIDTH_CELLS = 1
+
+# Cost added per half field of view: turning away from straight ahead, and from the last heading
+STRAIGHT_BIAS = 0.1
+HEADING_HYSTERESIS = 0.1
+
+# Ahead cost below which there is nothing to avoid
+CLEAR_COST = 0.15
+
+# Ahead costs from which the obstacle ahead is close, and an immediate danger
+CLOSE_COST = 0.3
+DANGER_COST = 0.5
+
+# Headings closer than this to straight ahead are not worth a turn
+MIN_TURN_HEADING = math.radians(8)
+
+# How strongly each layer occupies a cell; off_path adds cost to cells off the path
+FREE_SPACE_PROFILES = {
+    'walk': {'detections': 1.0, 'edges': 0.5, 'off_path': 0.4},
+    'swing': {'detections': 1.0, 'edges': 0.7, 'off_path': 0.0},
+}
+
+
+def frame_layers(frame: np.ndarray, level: int = FREE_SPACE_PYRAMID_LEVEL,
+                 buffers: Optional[BufferPool] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Edge map and path mask of one downscaled copy of the frame"""
+    small = pyramid_down(frame, level, buffers)
+    return edge_map(small, pyramid_scale(level), buffers), path_mask(small, buffers)
+
+
+class FreeSpaceMap:
+    """Occupancy grid in screen space and the best free heading through it"""
+
+    def __init__(self, profile: str = 'walk', columns: int = GRID_COLUMNS, rows: int = GRID_ROWS,
+                 fov: float = CAMERA_FOV):
+        self.weights = FREE_SPACE_PROFILES[profile]
+        self.columns = columns
+        self.rows = rows
+        self.fov = fov
+        self.occupancy = np.zeros((rows, columns), dtype=np.float32)
+        self.heading = 0.0
+        self._frame_size = None
+
+    def _set_geometry(self, frame_shape):
+        """Cell edges, column headings and row weights for a frame size (cached)"""
+        height, width = frame_shape[:2]
+        if self._frame_size == (height, width):
+            return
+        self._frame_size = (height, width)
+        self.cell_width = width / self.columns
+        self.cell_height = height / self.rows
+        self.column_edges = np.arange(self.columns + 1) * self.cell_width
+        self.row_edges = np.arange(self.rows + 1) * self.cell_height
+
+        self.center_x = width / 2
+        self.focal = self.center_x / math.tan(self.fov / 2)
+        self.column_centers = self.column_edges[:-1] + self.cell_width / 2
+        self.column_headings = np.arctan((self.column_centers - self.center_x) / self.focal)
+
+        row_centers = self.row_edges[:-1] + self.cell_height / 2
+        row_weights = np.exp(-np.abs(row_centers - height / 2) / DISTANCE_FALLOFF_PX)
+        self.row_weights = (row_weights / row_weights.sum()).astype(np.float32)
+
+    def _rasterise(self, detections: np.ndarray) -> np.ndarray:
+        """Per cell, the highest confidence times the fraction of the cell a box covers"""
+        covered_x = (np.minimum(detections['x2'][:, None], self.column_edges[None, 1:])
+                     - np.maximum(detections['x1'][:, None], self.column_edges[None, :-1]))
+        covered_y = (np.minimum(detections['y2'][:, None], self.row_edges[None, 1:])
+                     - np.maximum(detections['y1'][:, None], self.row_edges[None, :-1]))
+        coverage_x = np.clip(covered_x / self.cell_width, 0, 1)
+        coverage_y = np.clip(covered_y / self.cell_height, 0, 1) * detections['confidence'][:, None]
+        return (coverage_y[:, :, None] * coverage_x[:, None, :]).max(axis=0)
+
+    def _layer(self, image: np.ndarray) -> np.ndarray:
+        """Fraction of set pixels per cell of a 0/255 image at any pyramid level"""
+        return cv2.resize(image, (self.columns, self.rows), interpolation=cv2.INTER_AREA).astype(np.float32) / 255
+
+    def update(self, frame_shape, detections: Detections = (), edges: Optional[np.ndarray] = None,
+               path: Optional[np.ndarray] = None) -> Dict:
+        """Rebuild the grid from this frame's layers, returns the best free heading
+
+        heading is in radians (positive = right of straight ahead) and target_x is
+        the screen column it points at. Costs are in [0, 1]: the row-weighted
+        occupancy each heading sweeps through.
+        """
+        self._set_geometry(frame_shape)
+        occupancy = self.occupancy
+        occupancy.fill(0)
+
+        detections = detection_array(detections)
+        if len(detections):
+            np.maximum(occupancy, self._rasterise(detections) * self.weights['detections'], out=occupancy)
+        if edges is not None:
+            density = np.minimum(self._layer(edges) / EDGE_SATURATION, 1)
+            np.maximum(occupancy, density * self.weights['edges'], out=occupancy)
+        if path is not None and self.weights['off_path']:
+            occupancy += (1 - self._layer(path)) * self.weights['off_path']
+            np.minimum(occupancy, 1, out=occupancy)
+
+        # A heading is only as free as the cells Spider-Man's body sweeps through
+        costs = self.row_weights @ occupancy
+        padded = np.pad(costs, BODY_HALF_WIDTH_CELLS, mode='edge')
+        costs = np.lib.stride_tricks.sliding_window_view(padded, 2 * BODY_HALF_WIDTH_CELLS + 1).max(axis=1)
+
+        half_fov = self.fov / 2
+        total = (costs + STRAIGHT_BIAS * np.abs(self.column_headings) / half_fov
+                 + HEADING_HYSTERESIS * np.abs(self.column_headings - self.heading) / half_fov)
+
+        # Parabolic refinement of the minimum gives a continuous heading
+        best = int(np.argmin(total))
+        position = float(best)
+        if 0 < best < self.columns - 1:
+            left, middle, right = total[best - 1:best + 2]
+            curvature = left - 2 * middle + right
+            if curvature > 0:
+                position += 0.5 * (left - right) / curvature
+
+        target_x = float((position + 0.5) * self.cell_width)
+        self.heading = math.atan((target_x - self.center_x) / self.focal)
+        return {
+            'heading': self.heading,
+            'target_x': target_x,
+            'cost': float(np.interp(target_x, self.column_centers, costs)),
+            'ahead_cost': float(np.interp(self.center_x, self.column_centers, costs)),
+            'costs': costs,
+        }
+
+    def reset(self):
+        """Forget the last heading"""
+        self.heading = 0.0
+
+
+class FreeSpacePolicy:
+    """Steer toward the best free heading of a free-space map
+
+    The obstacle policy of both auto-swing and auto-walk: each frame's detections
+    (with the edge and path layers) go to decide(). actions are the (left,
+    forward, right) action names of the calling loop.
+    """
+
+    def __init__(self, profile: str = 'walk', actions: Tuple[str, str, str] = ('left', 'forward', 'right')):
+        self.free_space = FreeSpaceMap(profile)
+        self.actions = actions
+
+    def analyze(self, detections: Detections, frame_shape, edges: Optional[np.ndarray] = None,
+                path: Optional[np.ndarray] = None) -> Dict:
+        """Free-space map update for this frame"""
+        return self.free_space.update(frame_shape, detections, edges, path)
+
+    def decide(self, detections: Detections, frame_shape, edges: Optional[np.ndarray] = None,
+               path: Optional[np.ndarray] = None) -> Dict:
+        """Action toward the best free heading, with the heading itself for continuous steering"""
+        analysis = self.analyze(detections, frame_shape, edges, path)
+        left, forward, right = self.actions
+        heading = analysis['heading']
+
+        if analysis['ahead_cost'] < CLEAR_COST:
+            action, reason = forward, 'clear_ahead'
+        elif abs(heading) < MIN_TURN_HEADING:
+            action, reason = forward, 'best_heading_ahead'
+        else:
+            action = right if heading > 0 else left
+            reason = f"free_space_{'right' if heading > 0 else 'left'}"
+        return {
+            'action': action,
+            'reason': reason,
+            'heading': heading,
+            'target_x': analysis['target_x'],
+            'ahead_cost': analysis['ahead_cost'],
+            'clearance': 1 - analysis['cost'],
+            'proximity': self._proximity(analysis['ahead_cost']),
+            'buildings': len(detections),
+        }
+
+    @staticmethod
+    def _proximity(ahead_cost: float) -> str:
+        """Proximity class of what lies straight ahead, as the swing policy names them"""
+        if ahead_cost >= DANGER_COST:
+            return 'danger'
+        if ahead_cost >= CLOSE_COST:
+            return 'close'
+        return 'medium' if ahead_cost >= CLEAR_COST else 'safe'
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Game Capture
+Finds the game window and captures it (or a region of it). Loops that only need
+pixels, such as threat reaction and path-following, use this directly instead of
+creating a building detector, which would load (and possibly tune) YOLO.
+"""
+
+import time
+import cv2
+import numpy as np
+import pyautogui
+import win32gui
+from typing import Optional, Tuple
+
+
+class GameWindow:
+    """Spider-Man: Miles Morales window and its screen captures"""
+
+    def __init__(self):
+        self.hwnd = None
+        self.rect = None
+
+    def find(self) -> bool:
+        """Find Spider-Man: Miles Morales game window"""
+        def enum_windows_callback(hwnd, windows):
+            if win32gui.IsWindowVisible(hwnd):
+                window_title = win32gui.GetWindowText(hwnd)
+                if 'spider-man' in window_title.lower() or 'miles morales' in window_title.lower():
+                    windows.append((hwnd, window_title))
+            return True
+
+        windows = []
+        win32gui.EnumWindows(enum_windows_callback, windows)
+
+        if windows:
+            self.hwnd = windows[0][0]
+            self.rect = win32gui.GetWindowRect(self.hwnd)
+            print(f"✅ Found game window: {win32gui.GetWindowText(self.hwnd)}")
+            return True
+        else:
+            print("❌ Spider-Man: Miles Morales not found")
+            return False
+
+    def capture(self, region: Optional[Tuple[float, float, float, float]] = None) -> Optional[np.ndarray]:
+        """Capture the game window screen, or only a region of it (fractions x1, y1, x2, y2)"""
+        if not self.hwnd or not self.rect:
+            return None
+
+        try:
+            # Focus game window (only waits for the switch when it was not focused already)
+            if win32gui.GetForegroundWindow() != self.hwnd:
+                win32gui.SetForegroundWindow(self.hwnd)
+                time.sleep(0.1)
+
+            # Capture window region
+            x, y, x2, y2 = self.rect
+            if region is not None:
+                width, height = x2 - x, y2 - y
+                x, y, x2, y2 = (x + int(region[0] * width), y + int(region[1] * height),
+                                x + int(region[2] * width), y + int(region[3] * height))
+            screenshot = pyautogui.screenshot(region=(x, y, x2-x, y2-y))
+
+            # Convert to OpenCV format
+            frame = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+            return frame
+
+        except Exception as e:
+            print(f"❌ Failed to capture screen: {e}")
+            return None
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Image Pyramid
+Downscaling helpers so classical-CV stages (edges, path segmentation) can run on
+a reduced copy of the frame. Level 0 is full resolution, level 1 is 1/2, level 2
+is 1/4; results are scaled back to full-frame coordinates by the caller.
+"""
+
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from buffer_pool import BufferPool, pooled
+
+# Pool buffer name for each halving step
+_STEP_BUFFERS = ('pyramid_1', 'pyramid_2', 'pyramid_3', 'pyramid_4')
+
+
+def pyramid_scale(level: int) -> int:
+    """Full-resolution pixels per pyramid pixel along each axis"""
+    return 1 << level
+
+
+def pyramid_down(image: np.ndarray, level: int, buffers: Optional[BufferPool] = None) -> np.ndarray:
+    """Downscale by 2**level, cropping odd rows/columns so pixels stay aligned
+
+    Pixel (x, y) of the result covers full-resolution pixels
+    [x*scale, (x+1)*scale) x [y*scale, (y+1)*scale). With buffers, each step
+    writes into a pooled array instead of allocating.
+    """
+    scale = pyramid_scale(level)
+    height, width = image.shape[:2]
+    image = image[:height - height % scale, :width - width % scale]
+    # Repeated halving with area averaging is faster than one large INTER_AREA step
+    for step in range(level):
+        height, width = image.shape[:2]
+        dst = pooled(buffers, _STEP_BUFFERS[step], (height // 2, width // 2) + image.shape[2:])
+        image = cv2.resize(image, (width // 2, height // 2), dst=dst, interpolation=cv2.INTER_AREA)
+    return image
+
+
+def to_full_resolution(coordinate, level: int):
+    """Map a pyramid pixel index (or array of them) to the centre of the pixels it covers"""
+    scale = pyramid_scale(level)
+    return coordinate * scale + (scale - 1) / 2.0
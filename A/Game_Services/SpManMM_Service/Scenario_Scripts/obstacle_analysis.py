@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Obstacle Analysis
+Detections packed into a structured array, and detections of the same structure
+from several detectors fused into one set before the free-space map sees them
+(see free_space.FreeSpacePolicy, the policy both auto-swing and auto-walk use).
+"""
+
+import os
+import sys
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+# Add Model Management to path for the shared box IoU
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(os.path.join(project_root, 'B', 'Model_Management'))
+from slim_yolo_runtime import box_iou
+
+# One row per detection, bbox in frame pixels
+DETECTION_DTYPE = np.dtype([
+    ('x1', np.float32), ('y1', np.float32), ('x2', np.float32), ('y2', np.float32),
+    ('confidence', np.float32), ('class_id', np.int32),
+])
+
+# How much each detector's confidence is trusted when the same structure is seen twice
+SOURCE_RELIABILITY = {'yolo': 1.0, 'edge': 0.6}
+DEFAULT_RELIABILITY = 0.5
+
+# Boxes overlapping more than this are the same structure
+FUSION_IOU = 0.4
+
+SECTOR_LEFT, SECTOR_CENTER, SECTOR_RIGHT = 0, 1, 2
+SECTOR_NAMES = ('left', 'center', 'right')
+
+Detections = Union[np.ndarray, List[Dict]]
+
+
+def detection_array(detections: Detections) -> np.ndarray:
+    """Structured detection array from detection dicts (arrays pass through)"""
+    if isinstance(detections, np.ndarray):
+        return detections
+    return np.array([(*detection['bbox'], detection['confidence'], detection['class_id'])
+                     for detection in detections], dtype=DETECTION_DTYPE)
+
+
+def fuse_detections(sources: Dict[str, List[Dict]], iou_threshold: float = FUSION_IOU,
+                    reliability: Optional[Dict[str, float]] = None) -> List[Dict]:
+    """Merge detections of the same structure from several detectors into one set
+
+    Detections are ranked by confidence times their source's reliability. Greedy
+    NMS groups each best-ranked box with everything overlapping it, and the group
+    becomes one detection. The box is the score-weighted mean of the group, and
+    the class and confidence come from the best-ranked member.
+    """
+    reliability = SOURCE_RELIABILITY if reliability is None else reliability
+    detections, scores = [], []
+    for source, source_detections in sources.items():
+        weight = reliability.get(source, DEFAULT_RELIABILITY)
+        for detection in source_detections:
+            detections.append((source, detection))
+            scores.append(detection['confidence'] * weight)
+    if len(detections) < 2:
+        return [dict(detection, sources=[source]) for source, detection in detections]
+
+    scores = np.array(scores)
+    boxes = np.array([detection['bbox'] for _, detection in detections], dtype=np.float64)
+    overlaps = box_iou(boxes, boxes) > iou_threshold
+
+    fused = []
+    remaining = np.ones(len(detections), dtype=bool)
+    for best in np.argsort(-scores, kind='stable'):
+        if not remaining[best]:
+            continue
+        group = overlaps[best] & remaining
+        remaining &= ~group
+
+        source, detection = detections[best]
+        if np.count_nonzero(group) == 1:
+            fused.append(dict(detection, sources=[source]))
+            continue
+        weights = scores[group]
+        x1, y1, x2, y2 = (int(round(v)) for v in weights @ boxes[group] / weights.sum())
+        fused.append(dict(
+            detection,
+            bbox=(x1, y1, x2, y2),
+            center=((x1 + x2) // 2, (y1 + y2) // 2),
+            size=(x2 - x1, y2 - y1),
+            sources=sorted({detections[index][0] for index in np.flatnonzero(group)}),
+        ))
+    return fused
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Path Detection
+Vectorised path-edge search for path following. Only the rows that are needed
+are segmented, and edges are located with whole-array reductions instead of
+per-column Python loops. A centreline fitted over several rows ahead of
+Spider-Man gives offset, heading and curvature so steering can anticipate turns.
+Segmentation can run on a downscaled pyramid level; results are always returned
+in full-frame coordinates. Value-only calibrations are applied as a lookup table
+on max(B, G, R), which skips the HSV conversion.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from buffer_pool import BufferPool, pooled
+from image_pyramid import pyramid_down, pyramid_scale, to_full_resolution
+
+# Dark asphalt/concrete in HSV (change with set_path_calibration)
+PATH_HSV_LOWER = np.array([0, 0, 20])
+PATH_HSV_UPPER = np.array([180, 255, 80])
+
+# OpenCV 8-bit HSV channel limits
+HUE_MAX = 179
+SATURATION_MAX = 255
+
+# Rows searched above and below the feet for path edges
+EDGE_SEARCH_RANGE = 50
+
+# Extra rows segmented around the band so morphology and Canny see the same
+# neighbourhood they would on the full frame
+FILTER_MARGIN = 8
+
+# Fallback scanline: darker than this is path, narrower spans are ignored
+DARK_THRESHOLD = 80
+MIN_PATH_WIDTH = 50
+
+# Centreline look-ahead: rows sampled from the feet up to this fraction of the
+# frame height ahead, each reduced over ±LOOKAHEAD_ROW_BAND rows
+LOOKAHEAD_FRACTION = 0.25
+LOOKAHEAD_ROWS = 8
+LOOKAHEAD_ROW_BAND = 6
+
+# Robust centreline fit (Tukey biweight, iteratively reweighted least squares)
+MIN_CENTRELINE_POINTS = 3
+ROBUST_ITERATIONS = 4
+TUKEY_C = 4.685
+MIN_RESIDUAL_SCALE = 2.0  # px, keeps near-perfect fits from rejecting every point
+
+# Path steering aims at a point this fraction of the look-ahead up the fitted
+# centreline, blended with the offset at the feet, so turns start before the bend
+PATH_PREVIEW_FRACTION = 0.6
+PATH_PREVIEW_WEIGHT = 0.5
+
+# Steering errors beyond this many pixels call for a left/right correction
+CORRECTION_THRESHOLD_PX = 30
+
+# Pyramid level used by path following (0 = full resolution, 1 = 1/2, 2 = 1/4).
+# Left/right/forward decisions do not need full 1080p detail
+PATH_PYRAMID_LEVEL = 1
+
+MORPH_KERNEL = np.ones((3, 3), np.uint8)
+
+# Plane buffer names for the lookup-table mask
+_PLANE_BUFFERS = ('plane_b', 'plane_g', 'plane_r')
+
+
+def build_path_lut(hsv_lower: np.ndarray, hsv_upper: np.ndarray) -> Optional[np.ndarray]:
+    """Path mask lookup table indexed by max(B, G, R), None if the calibration needs HSV
+
+    When hue and saturation are unconstrained the HSV test only depends on
+    V = max(B, G, R), so a 256-entry table gives the exact same mask.
+    """
+    if hsv_lower[0] > 0 or hsv_upper[0] < HUE_MAX or hsv_lower[1] > 0 or hsv_upper[1] < SATURATION_MAX:
+        return None
+    values = np.arange(256)
+    return np.where((values >= hsv_lower[2]) & (values <= hsv_upper[2]), 255, 0).astype(np.uint8)
+
+
+PATH_MASK_LUT = build_path_lut(PATH_HSV_LOWER, PATH_HSV_UPPER)
+
+
+def set_path_calibration(hsv_lower, hsv_upper):
+    """Change the path colour range and rebuild its lookup table"""
+    global PATH_HSV_LOWER, PATH_HSV_UPPER, PATH_MASK_LUT
+    PATH_HSV_LOWER = np.array(hsv_lower)
+    PATH_HSV_UPPER = np.array(hsv_upper)
+    PATH_MASK_LUT = build_path_lut(PATH_HSV_LOWER, PATH_HSV_UPPER)
+
+
+def path_mask(image: np.ndarray, buffers: Optional[BufferPool] = None) -> np.ndarray:
+    """Binary (0/255) mask of path-coloured pixels in a BGR image"""
+    shape = image.shape[:2]
+    dst = pooled(buffers, 'mask', shape)
+    if PATH_MASK_LUT is None:
+        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV, dst=pooled(buffers, 'hsv', image.shape))
+        return cv2.inRange(hsv, PATH_HSV_LOWER, PATH_HSV_UPPER, dst=dst)
+
+    # Contiguous planes make the per-channel max several times faster than strided views
+    if buffers is None:
+        blue, green, red = cv2.split(image)
+    else:
+        blue, green, red = cv2.split(image, [buffers.get(name, shape) for name in _PLANE_BUFFERS])
+    value = cv2.max(blue, green, dst=blue)
+    value = cv2.max(value, red, dst=value)
+    return cv2.LUT(value, PATH_MASK_LUT, dst=dst)
+
+
+def segment_path_edges(frame: np.ndarray, y_start: int, y_end: int, level: int = 0,
+                       buffers: Optional[BufferPool] = None) -> np.ndarray:
+    """Canny edges of the path mask for rows y_start:y_end
+
+    At level > 0 the strip is downscaled first, so the result has 1/2**level of
+    the rows and columns (row 0 covers y_start). With buffers, every stage writes
+    into the pool and the result is a view that the next call overwrites.
+    """
+    height = frame.shape[0]
+    scale = pyramid_scale(level)
+
+    # Segment a slightly taller strip, then drop the margin rows. The margin is
+    # kept in pyramid pixels and the strip starts on a pyramid row boundary
+    strip_start = y_start - min(FILTER_MARGIN, y_start // scale) * scale
+    strip_end = min(height, y_end + FILTER_MARGIN * scale)
+    strip = pyramid_down(frame[strip_start:strip_end], level, buffers)
+    shape = strip.shape[:2]
+    mask = path_mask(strip, buffers)
+    closed = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, MORPH_KERNEL, dst=pooled(buffers, 'closed', shape))
+    mask = cv2.morphologyEx(closed, cv2.MORPH_OPEN, MORPH_KERNEL, dst=mask)
+    edges = cv2.Canny(mask, 50, 150, edges=pooled(buffers, 'edges', shape))
+
+    top = (y_start - strip_start) // scale
+    return edges[top:top + -(-(y_end - y_start) // scale)]
+
+
+def path_edge_band(frame: np.ndarray, y_position: int, search_range: int = EDGE_SEARCH_RANGE,
+                   level: int = 0, buffers: Optional[BufferPool] = None) -> np.ndarray:
+    """Canny edges of the path mask for rows y_position ± search_range"""
+    height = frame.shape[0]
+    return segment_path_edges(frame, max(0, y_position - search_range), min(height, y_position + search_range),
+                              level, buffers)
+
+
+def find_path_edges(edge_band: np.ndarray, center_x: int) -> Tuple[Optional[int], Optional[int]]:
+    """Nearest edge column on each side of center_x (inclusive), None if there is none"""
+    # One reduction over the band: which columns contain any edge pixel
+    edge_columns = edge_band.any(axis=0)
+
+    left_hits = np.flatnonzero(edge_columns[1:center_x + 1])
+    right_hits = np.flatnonzero(edge_columns[center_x:])
+
+    left_edge = int(left_hits[-1]) + 1 if left_hits.size else None
+    right_edge = center_x + int(right_hits[0]) if right_hits.size else None
+    return left_edge, right_edge
+
+
+def find_dark_span(frame: np.ndarray, y_position: int, dark_threshold: int = DARK_THRESHOLD,
+                   min_width: int = MIN_PATH_WIDTH, buffers: Optional[BufferPool] = None) -> Optional[Tuple[int, int]]:
+    """Outermost dark pixels on one row (converting only that row), None if too few"""
+    width = frame.shape[1]
+    scan_line = cv2.cvtColor(frame[y_position:y_position + 1], cv2.COLOR_BGR2GRAY,
+                             dst=pooled(buffers, 'scan_line', (1, width)))[0]
+    dark = np.less(scan_line, dark_threshold, out=pooled(buffers, 'dark', (width,), np.bool_))
+    if np.count_nonzero(dark) <= min_width:
+        return None
+    return int(dark.argmax()), int(width - 1 - dark[::-1].argmax())
+
+
+def robust_polyfit(x: np.ndarray, y: np.ndarray, degree: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Polynomial fit that down-weights outliers, returns (coefficients, weights)"""
+    weights = np.ones_like(y, dtype=np.float64)
+    coefficients = np.polyfit(x, y, degree)
+    for _ in range(ROBUST_ITERATIONS):
+        residuals = y - np.polyval(coefficients, x)
+        scale = max(1.4826 * np.median(np.abs(residuals)), MIN_RESIDUAL_SCALE)
+        u = residuals / (TUKEY_C * scale)
+        new_weights = np.where(np.abs(u) < 1, (1 - u ** 2) ** 2, 0.0)
+        if np.count_nonzero(new_weights) <= degree:
+            break
+        weights = new_weights
+        # polyfit weights multiply residuals, so pass the square root
+        coefficients = np.polyfit(x, y, degree, w=np.sqrt(weights))
+    return coefficients, weights
+
+
+def fit_path_centreline(frame: np.ndarray, center_x: int, feet_y: int,
+                        lookahead: Optional[int] = None, level: int = 0,
+                        buffers: Optional[BufferPool] = None) -> Optional[Dict]:
+    """Fit the path centreline over several rows from the feet ahead
+
+    The centreline is x(d) = a*d^2 + b*d + c, with d the distance ahead of the feet
+    in pixels. Returns offset (Spider-Man x minus the centre at the feet, positive
+    when too far right), heading (radians, positive when the path bends right),
+    curvature (1/px) and the coefficients, or None if too few rows show both edges.
+    Edges are searched on pyramid level `level`; the fit is in full-frame pixels.
+    With buffers, segmentation and the row gather reuse pooled arrays.
+    """
+    height = frame.shape[0]
+    if lookahead is None:
+        lookahead = int(height * LOOKAHEAD_FRACTION)
+
+    sample_rows = np.linspace(feet_y, feet_y - lookahead, LOOKAHEAD_ROWS).round().astype(int)
+    sample_rows = sample_rows[(sample_rows >= LOOKAHEAD_ROW_BAND) & (sample_rows < height - LOOKAHEAD_ROW_BAND)]
+    if sample_rows.size < MIN_CENTRELINE_POINTS:
+        return None
+
+    scale = pyramid_scale(level)
+    y_start = int(sample_rows.min()) - LOOKAHEAD_ROW_BAND
+    edges = segment_path_edges(frame, y_start, int(sample_rows.max()) + LOOKAHEAD_ROW_BAND + 1, level, buffers)
+
+    # Gather each sampled row's band into (rows, band, width) and reduce in one pass
+    row_band = max(1, LOOKAHEAD_ROW_BAND // scale)
+    band_offsets = np.arange(-row_band, row_band + 1)
+    band_rows = np.minimum((sample_rows - y_start)[:, None] // scale + band_offsets[None, :], len(edges) - 1)
+    gathered = np.take(edges, band_rows, axis=0, mode='clip',
+                       out=pooled(buffers, 'gathered', band_rows.shape + edges.shape[1:]))
+    edge_columns = gathered.any(axis=1, out=pooled(buffers, 'edge_columns', (len(band_rows), edges.shape[1]), np.bool_))
+
+    # Nearest edge on each side of the centre for every row at once
+    level_center_x = center_x // scale
+    left_side = edge_columns[:, 1:level_center_x + 1][:, ::-1]
+    right_side = edge_columns[:, level_center_x:]
+    left_edges = level_center_x - left_side.argmax(axis=1)
+    right_edges = level_center_x + right_side.argmax(axis=1)
+    # Both edges present, and not one edge on the centre column counted twice
+    found = left_side.any(axis=1) & right_side.any(axis=1) & (right_edges > left_edges)
+    if np.count_nonzero(found) < MIN_CENTRELINE_POINTS:
+        return None
+
+    centres = to_full_resolution((left_edges + right_edges) / 2.0, level)[found]
+    distances = (feet_y - sample_rows)[found].astype(np.float64)
+
+    degree = 2 if centres.size > MIN_CENTRELINE_POINTS else 1
+    coefficients, weights = robust_polyfit(distances, centres, degree)
+    if degree == 1:
+        coefficients = np.concatenate([[0.0], coefficients])
+    a, b, c = coefficients
+
+    return {
+        'offset': float(center_x - c),
+        'heading': float(np.arctan(b)),
+        'curvature': float(2 * a / (1 + b ** 2) ** 1.5),
+        'coefficients': coefficients,
+        'lookahead': lookahead,
+        'inliers': int(np.count_nonzero(weights > 0)),
+    }
+
+
+def centreline_x(path_model: Dict, distance: float) -> float:
+    """Centreline x position at a distance (px) ahead of the feet"""
+    return float(np.polyval(path_model['coefficients'], distance))
+
+
+def path_steering_error(path_model: Dict, center_x: int) -> float:
+    """Blend of the offset at the feet and at the preview point (positive = steer left)"""
+    preview_distance = path_model['lookahead'] * PATH_PREVIEW_FRACTION
+    preview_offset = center_x - centreline_x(path_model, preview_distance)
+    return (1 - PATH_PREVIEW_WEIGHT) * path_model['offset'] + PATH_PREVIEW_WEIGHT * preview_offset
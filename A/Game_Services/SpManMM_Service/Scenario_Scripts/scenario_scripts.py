@@ -11,9 +11,37 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from spiderman_keyboard_controls import SpiderManKeyboardControls
 import time
+import math
 import pydirectinput
 import threading
 
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from path_detection import (fit_path_centreline, path_steering_error, find_dark_span,
+                            CORRECTION_THRESHOLD_PX, PATH_PYRAMID_LEVEL)
+from steering_controller import SteeringController
+from virtual_pad import GamepadStick, create_gamepad, STEERING_OUTPUT
+from buffer_pool import BufferPool
+from state_estimation import PathStateFilter
+from free_space import frame_layers
+from ego_motion import EgoMotionEstimator
+from frame_pacer import FramePacer
+from walk_avoidance import WalkAvoidance
+from threat_reaction import ThreatReactionLoop, ThreatProbe, THREAT_ROI, FULL_FRAME
+
+# Perception rates of the walking loops
+AUTO_WALK_RATE_HZ = 20
+PATH_FOLLOWING_RATE_HZ = 20
+
+# Stall recovery: back off, then walk off at an angle (alternating sides)
+RECOVERY_BACKOFF_S = 0.4
+RECOVERY_TURN_S = 0.6
+
+# Path corrections that carry no measurement (the filter coasts instead)
+NO_PATH_MEASUREMENT = ('fallback_no_path', 'fallback_error', 'detection_error')
+
+# How long the threat-reaction dodge key is held
+DODGE_PRESS_S = 0.05
+
 class SpiderManScenarioScripts(SpiderManKeyboardControls):
     """Spider-Man composite scenario scripts"""
     
@@ -22,6 +50,9 @@ class SpiderManScenarioScripts(SpiderManKeyboardControls):
         self.gamepad = gamepad  # Keep gamepad for backward compatibility
         self.keyboard_listener = None
         self.auto_walk_running = False
+        self.recovery_side = 'left'  # Side of the next stall recovery
+        self.threat_loop = None
+        self.dodge_release = None  # Timer that releases the last dodge press
     
     def _hold_keys_concurrent(self, keys, duration):
         """Hold multiple keys simultaneously for a specified duration"""
@@ -166,6 +197,64 @@ class SpiderManScenarioScripts(SpiderManKeyboardControls):
         except Exception as e:
             print(f"❌ Auto-swing stop error: {e}")
     
+    def _start_threat_reaction(self):
+        """Start dodging on the spider-sense indicator (colour probe, no YOLO)"""
+        try:
+            if self.threat_loop is not None and self.threat_loop.running:
+                print("⚠️ Threat reaction already running")
+                return
+            # Only pixels are needed: capture without a detector (and its YOLO model)
+            from game_capture import GameWindow
+            
+            window = GameWindow()
+            if not window.find():
+                print("❌ Cannot start threat reaction: Game window not found")
+                return
+            
+            print("🕷️ Starting threat reaction - dodging on spider-sense...")
+            print("💡 Press 'End' key to stop threat reaction")
+            self._start_keyboard_listener()
+            # Only the region around Miles is captured, so the probe sees the whole capture
+            self.threat_loop = ThreatReactionLoop(
+                capture=lambda: window.capture(region=THREAT_ROI),
+                react=self._dodge_now,
+                probe=ThreatProbe(roi=FULL_FRAME),
+            )
+            self.threat_loop.start()
+            
+        except Exception as e:
+            print(f"❌ Threat reaction startup error: {e}")
+    
+    def _stop_threat_reaction(self):
+        """Stop the threat-reaction loop"""
+        try:
+            if self.threat_loop is None:
+                print("⚠️ Threat reaction not running")
+                return
+            self._halt_threat_reaction()
+            self._stop_keyboard_listener()
+            print(self.threat_loop.report())
+            self.threat_loop = None
+            print("✅ Threat reaction stopped!")
+        except Exception as e:
+            print(f"❌ Threat reaction stop error: {e}")
+    
+    def _dodge_now(self):
+        """Press dodge at once and release it from a timer, so the reaction loop never waits"""
+        pydirectinput.keyDown(self.KEYS['dodge'], _pause=False)
+        self.dodge_release = threading.Timer(DODGE_PRESS_S, pydirectinput.keyUp, args=(self.KEYS['dodge'],),
+                                             kwargs={'_pause': False})
+        self.dodge_release.start()
+    
+    def _halt_threat_reaction(self):
+        """Stop the threat loop's dodges at once, releasing a dodge press still pending"""
+        if self.threat_loop is not None:
+            self.threat_loop.stop()
+        release, self.dodge_release = self.dodge_release, None
+        if release is not None and release.is_alive():
+            release.cancel()
+            pydirectinput.keyUp(self.KEYS['dodge'], _pause=False)
+    
     def _start_auto_walk(self):
         """Start continuous auto-walking forward"""
         try:
@@ -183,17 +272,17 @@ class SpiderManScenarioScripts(SpiderManKeyboardControls):
         except Exception as e:
             print(f"❌ Auto-walk startup error: {e}")
     
-    def _start_path_following(self):
+    def _start_path_following(self, steering_profile='path'):
         """Start path-following system to keep Spider-Man centered on paths"""
         try:
-            print("🛤️ Starting path-following system...")
+            print(f"🛤️ Starting path-following system ({steering_profile} steering)...")
             print("💡 Press 'End' key to stop path-following")
             
             # Start keyboard listener for End key
             self._start_keyboard_listener()
             
             # Start path-following thread
-            self.auto_walk_thread = threading.Thread(target=self._path_following_loop)
+            self.auto_walk_thread = threading.Thread(target=self._path_following_loop, args=(steering_profile,))
             self.auto_walk_running = True
             self.auto_walk_thread.start()
             
@@ -214,8 +303,33 @@ class SpiderManScenarioScripts(SpiderManKeyboardControls):
         except Exception as e:
             print(f"❌ Auto-walk stop error: {e}")
     
+    def _create_steering_controller(self, profile):
+        """Steering controller driving the A/D keys without per-call input pauses, or the left stick"""
+        stick = None
+        if STEERING_OUTPUT == 'stick':
+            try:
+                if self.gamepad is None:
+                    self.gamepad = create_gamepad()
+                stick = GamepadStick(self.gamepad)
+                print("🎮 Steering with the analogue stick")
+            except Exception as e:
+                print(f"⚠️ Analogue steering unavailable ({e}) - steering with the keys")
+        return SteeringController(
+            key_down=lambda key: pydirectinput.keyDown(key, _pause=False),
+            key_up=lambda key: pydirectinput.keyUp(key, _pause=False),
+            left_key=self.KEYS['left'],
+            right_key=self.KEYS['right'],
+            profile=profile,
+            stick=stick,
+        )
+    
     def _auto_walk_loop(self):
         """Main loop for obstacle-avoiding walking in Central Park"""
+        steering = None
+        pacer = FramePacer(AUTO_WALK_RATE_HZ, 'Auto-walk')
+        # Tracks obstacles, estimates time to collision, steers toward the best free
+        # heading and only starts avoiding once that persists over a few frames
+        avoidance = WalkAvoidance()
         try:
             # Import the building detector for obstacle detection
             import sys
@@ -230,80 +344,111 @@ class SpiderManScenarioScripts(SpiderManKeyboardControls):
                 print("❌ Cannot start auto-walk: Game window not found")
                 return
             
-            last_avoid_time = 0
-            avoid_cooldown = 0.5  # 0.5 second cooldown between avoidance maneuvers
+            # Steering runs on its own tick; this loop only perceives and sets the target
+            steering = self._create_steering_controller('park')
             
             print("🌳 Starting Central Park auto-walk with obstacle detection...")
+            pydirectinput.keyDown(self.KEYS['forward'])
+            steering.start()
+            last_reason = None
+            layer_buffers = BufferPool()
+            # Optical flow notices when the player is pinned against something
+            ego_motion = EgoMotionEstimator()
             
             while self.auto_walk_running:
-                current_time = time.time()
-                
+                pacer.wait()
                 # Capture game screen for obstacle detection
                 frame = detector.capture_game_screen()
                 if frame is None:
                     time.sleep(0.1)
                     continue
                 
+                # Pinned against a bench or wall: recover before spending a YOLO pass
+                now = time.perf_counter()
+                if ego_motion.update(frame, now)['stuck']:
+                    self._recover_from_stall(steering)
+                    ego_motion.reset()
+                    avoidance.reset()
+                    continue
+                
                 # Detect Central Park obstacles (trees, benches, light poles, garbage cans, persons)
-                obstacles = self._detect_central_park_obstacles(frame, detector)
+                detections = self._detect_central_park_obstacles(frame, detector)
+                edges, path = frame_layers(frame, buffers=layer_buffers)
                 
-                # Check if we need to avoid obstacles
-                if obstacles and current_time - last_avoid_time > avoid_cooldown:
-                    avoidance_action = self._determine_avoidance_action(obstacles, frame.shape)
-                    if avoidance_action['action'] != 'forward':
-                        print(f"🚫 Avoiding {avoidance_action['reason']} - {len(obstacles)} obstacles")
-                        self._execute_avoidance_maneuver(avoidance_action)
-                        last_avoid_time = current_time
-                        continue  # Skip normal walking this frame
+                # Steer toward the best free heading while something is ahead, straight otherwise
+                avoidance_action = avoidance.step(detections, frame.shape, now, edges, path)
+                if avoidance_action['action'] != 'forward':
+                    steering.update(frame.shape[1] / 2 - avoidance_action['target_x'])
+                else:
+                    steering.update(0.0)
                 
-                # Normal forward walking
-                pydirectinput.keyDown(self.KEYS['forward'])
-                time.sleep(0.1)
-                pydirectinput.keyUp(self.KEYS['forward'])
-                time.sleep(0.05)
+                if avoidance_action['action'] != 'forward' and avoidance_action['reason'] != last_reason:
+                    print(f"🚫 Avoiding {avoidance_action['reason']} - {avoidance_action['obstacles']} obstacles, "
+                          f"heading {math.degrees(avoidance_action['heading']):+.0f}°, "
+                          f"time to collision {avoidance_action['ttc']:.1f}s")
+                last_reason = avoidance_action['reason']
                 
         except Exception as e:
             print(f"❌ Auto-walk loop error: {e}")
         finally:
-            # Ensure forward key is released when stopping
+            # Ensure steering and forward keys are released when stopping
+            if steering is not None:
+                steering.stop()
             pydirectinput.keyUp(self.KEYS['forward'])
+            if pacer.frames:
+                print(pacer.report())
+                print(f"🗳️ {avoidance.voter.suppressed} unconfirmed avoidance frames ignored")
+    
+    def _recover_from_stall(self, steering):
+        """Back off and walk away at an angle when the scene stopped moving while walking forward"""
+        side = self.recovery_side
+        self.recovery_side = 'right' if side == 'left' else 'left'
+        print(f"🧱 Stuck - backing off and turning {side}")
+        
+        # Take the steering keys back for the manoeuvre
+        steering.stop()
+        pydirectinput.keyUp(self.KEYS['forward'])
+        pydirectinput.keyDown(self.KEYS['backward'])
+        time.sleep(RECOVERY_BACKOFF_S)
+        pydirectinput.keyUp(self.KEYS['backward'])
+        
+        pydirectinput.keyDown(self.KEYS[side])
+        pydirectinput.keyDown(self.KEYS['forward'])
+        time.sleep(RECOVERY_TURN_S)
+        pydirectinput.keyUp(self.KEYS[side])
+        steering.start()
     
     def _detect_central_park_obstacles(self, frame, detector):
         """Detect Central Park specific obstacles"""
         try:
             # Get YOLO detections
-            results = detector.model(frame, conf=0.4, iou=0.3)  # Lower confidence for more detections
+            results = detector.model.detect(frame, conf=0.4, iou=0.3)  # Lower confidence for more detections
             
             obstacles = []
-            for result in results:
-                boxes = result.boxes
-                if boxes is not None:
-                    for box in boxes:
-                        x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                        confidence = box.conf[0].cpu().numpy()
-                        class_id = int(box.cls[0].cpu().numpy())
-                        class_name = detector.model.names[class_id]
-                        
-                        # Central Park obstacles to avoid
-                        park_obstacles = [
-                            'person',      # People walking
-                            'bench',       # Park benches
-                            'chair',       # Chairs/seating
-                            'bottle',      # Garbage cans/trash
-                            'cup',         # Trash items
-                            'car',         # Vehicles (rare in park but possible)
-                            'truck',       # Maintenance vehicles
-                        ]
-                        
-                        if class_name in park_obstacles and confidence > 0.4:
-                            obstacles.append({
-                                'bbox': (int(x1), int(y1), int(x2), int(y2)),
-                                'confidence': float(confidence),
-                                'class': class_name,
-                                'class_id': class_id,
-                                'center': ((int(x1) + int(x2)) // 2, (int(y1) + int(y2)) // 2),
-                                'size': (int(x2 - x1), int(y2 - y1))
-                            })
+            for x1, y1, x2, y2, confidence, class_id in results:
+                class_id = int(class_id)
+                class_name = detector.model.names[class_id]
+                
+                # Central Park obstacles to avoid
+                park_obstacles = [
+                    'person',      # People walking
+                    'bench',       # Park benches
+                    'chair',       # Chairs/seating
+                    'bottle',      # Garbage cans/trash
+                    'cup',         # Trash items
+                    'car',         # Vehicles (rare in park but possible)
+                    'truck',       # Maintenance vehicles
+                ]
+                
+                if class_name in park_obstacles and confidence > 0.4:
+                    obstacles.append({
+                        'bbox': (int(x1), int(y1), int(x2), int(y2)),
+                        'confidence': float(confidence),
+                        'class': class_name,
+                        'class_id': class_id,
+                        'center': ((int(x1) + int(x2)) // 2, (int(y1) + int(y2)) // 2),
+                        'size': (int(x2 - x1), int(y2 - y1))
+                    })
             
             return obstacles
             
@@ -311,107 +456,33 @@ class SpiderManScenarioScripts(SpiderManKeyboardControls):
             print(f"❌ Obstacle detection failed: {e}")
             return []
     
-    def _determine_avoidance_action(self, obstacles, frame_shape):
-        """Determine sharp avoidance action based on obstacle positions"""
-        height, width = frame_shape[:2]
-        center_x = width // 2
-        spiderman_x = center_x
-        spiderman_y = height // 2
-        
-        # Calculate distances and categorize obstacles
-        close_obstacles = []
-        for obstacle in obstacles:
-            x, y, x2, y2 = obstacle['bbox']
-            obstacle_center_x = (x + x2) // 2
-            obstacle_center_y = (y + y2) // 2
-            
-            # Calculate distance from Spider-Man
-            distance = ((obstacle_center_x - spiderman_x) ** 2 + (obstacle_center_y - spiderman_y) ** 2) ** 0.5
-            
-            # Only avoid obstacles within 200 pixels (close range)
-            if distance <= 200:
-                obstacle['distance'] = distance
-                close_obstacles.append(obstacle)
-        
-        if not close_obstacles:
-            return {'action': 'forward', 'reason': 'no_close_obstacles'}
-        
-        # Categorize by horizontal position
-        left_obstacles = []
-        right_obstacles = []
-        center_obstacles = []
-        
-        for obstacle in close_obstacles:
-            x, y, x2, y2 = obstacle['bbox']
-            obstacle_center_x = (x + x2) // 2
-            
-            if obstacle_center_x < center_x - 60:  # Left side
-                left_obstacles.append(obstacle)
-            elif obstacle_center_x > center_x + 60:  # Right side
-                right_obstacles.append(obstacle)
-            else:  # Center path
-                center_obstacles.append(obstacle)
-        
-        # Sharp avoidance logic - prioritize center obstacles
-        if center_obstacles:
-            # Center blocked - sharp turn (randomize direction)
-            import random
-            action = random.choice(['left', 'right'])
-            reason = f'center_blocked_{action}'
-            return {'action': action, 'reason': reason, 'obstacles': len(center_obstacles)}
-        elif len(left_obstacles) > len(right_obstacles):
-            # More obstacles on left - sharp right turn
-            return {'action': 'right', 'reason': 'avoid_left_obstacles', 'obstacles': len(left_obstacles)}
-        elif len(right_obstacles) > len(left_obstacles):
-            # More obstacles on right - sharp left turn
-            return {'action': 'left', 'reason': 'avoid_right_obstacles', 'obstacles': len(right_obstacles)}
-        else:
-            # Balanced - continue forward
-            return {'action': 'forward', 'reason': 'balanced_obstacles', 'obstacles': len(close_obstacles)}
-    
-    def _execute_avoidance_maneuver(self, avoidance_action):
-        """Execute sharp turning maneuver with quick readjustment"""
-        action = avoidance_action['action']
-        reason = avoidance_action['reason']
-        obstacle_count = avoidance_action['obstacles']
-        
-        print(f"   🚫 Sharp {action} turn - {reason} ({obstacle_count} obstacles)")
-        
-        if action == 'left':
-            # Sharp left turn
-            pydirectinput.keyDown(self.KEYS['left'])
-            time.sleep(0.3)  # Very quick turn
-            pydirectinput.keyUp(self.KEYS['left'])
-        elif action == 'right':
-            # Sharp right turn
-            pydirectinput.keyDown(self.KEYS['right'])
-            time.sleep(0.3)  # Very quick turn
-            pydirectinput.keyUp(self.KEYS['right'])
-        
-        # Quick readjustment back to forward
-        print("   ⚡ Quick readjustment to forward...")
-        pydirectinput.keyDown(self.KEYS['forward'])
-        time.sleep(0.2)  # Brief forward motion
-        pydirectinput.keyUp(self.KEYS['forward'])
-    
-    def _path_following_loop(self):
+    def _path_following_loop(self, steering_profile='path'):
         """Main loop for path-following with continuous walk mode and steering"""
+        steering = None
+        pacer = FramePacer(PATH_FOLLOWING_RATE_HZ, 'Path-following')
         try:
-            # Import the building detector for screen capture
+            # Import the game capture (path-following needs no detector or YOLO model)
             import sys
             import os
             script_dir = os.path.dirname(os.path.abspath(__file__))
             if script_dir not in sys.path:
                 sys.path.append(script_dir)
-            from yolo_building_detector import YOLOBuildingDetector
+            from game_capture import GameWindow
             
-            detector = YOLOBuildingDetector()
-            if not detector.find_game_window():
+            window = GameWindow()
+            if not window.find():
                 print("❌ Cannot start path-following: Game window not found")
                 return
             
-            last_correction_time = 0
-            correction_cooldown = 0.3  # 0.3 second cooldown between corrections
+            # Steering runs on its own tick; this loop only perceives and feeds it
+            steering = self._create_steering_controller(steering_profile)
+            # Segmentation arrays reused across frames (resized only if the window changes)
+            path_buffers = BufferPool()
+            # Steering follows the filtered path state, not single-frame measurements
+            path_filter = PathStateFilter()
+            # Optical flow notices when the player is pinned against something
+            ego_motion = EgoMotionEstimator()
+            last_reason = None
             
             print("🛤️ Starting path-following with continuous walk mode...")
             print("🚶 Holding Left-Alt (walk mode) + W (forward) continuously...")
@@ -419,44 +490,56 @@ class SpiderManScenarioScripts(SpiderManKeyboardControls):
             # Start continuous walk mode: Hold Left-Alt + W for entire duration
             pydirectinput.keyDown(self.KEYS['walk'])  # Left-Alt for walk mode
             pydirectinput.keyDown(self.KEYS['forward'])  # W for forward movement
+            steering.start()
             
             while self.auto_walk_running:
-                current_time = time.time()
-                
+                pacer.wait()
                 # Capture game screen for path detection
-                frame = detector.capture_game_screen()
+                frame = window.capture()
                 if frame is None:
                     time.sleep(0.1)
                     continue
                 
-                # Detect path edges and determine correction needed
-                if current_time - last_correction_time > correction_cooldown:
-                    correction = self._detect_path_edges_and_correct(frame)
-                    if correction['action'] != 'forward':
-                        print(f"🛤️ Path correction: {correction['reason']} - offset: {correction['offset']:.1f}px")
-                        self._execute_path_correction_continuous(correction)
-                        last_correction_time = current_time
-                        continue  # Skip normal walking this frame
+                # Pinned against a bench or wall: recover instead of pushing forward
+                now = time.perf_counter()
+                if ego_motion.update(frame, now)['stuck']:
+                    self._recover_from_stall(steering)
+                    ego_motion.reset()
+                    path_filter.reset()
+                    continue
                 
-                # Brief pause to check if still running
-                time.sleep(0.1)
+                # Detect path and feed the steering controller
+                correction = self._detect_path_edges_and_correct(frame, path_buffers)
+                if correction['reason'] in NO_PATH_MEASUREMENT:
+                    path_state = path_filter.predict(now)
+                else:
+                    path_state = path_filter.update(correction['error'], correction.get('heading', 0.0), now)
+                if path_state is not None:
+                    steering.update(path_state['error'], path_state['heading'], now)
+                else:
+                    steering.update(0.0, 0.0, now)
+                
+                if correction['action'] != 'forward' and correction['reason'] != last_reason:
+                    print(f"🛤️ Path correction: {correction['reason']} - offset: {correction['offset']:.1f}px")
+                last_reason = correction['reason']
                 
         except Exception as e:
             print(f"❌ Path-following loop error: {e}")
         finally:
             # Release all keys when stopping
             print("🛑 Releasing walk mode keys...")
+            if steering is not None:
+                steering.stop()
             pydirectinput.keyUp(self.KEYS['walk'])
             pydirectinput.keyUp(self.KEYS['forward'])
             pydirectinput.keyUp(self.KEYS['left'])
             pydirectinput.keyUp(self.KEYS['right'])
+            if pacer.frames:
+                print(pacer.report())
     
-    def _detect_path_edges_and_correct(self, frame):
+    def _detect_path_edges_and_correct(self, frame, buffers=None):
         """Detect path edges and determine if correction is needed"""
         try:
-            import cv2
-            import numpy as np
-            
             height, width = frame.shape[:2]
             center_x = width // 2
             
@@ -469,118 +552,66 @@ class SpiderManScenarioScripts(SpiderManKeyboardControls):
             spiderman_feet_y = (height // 2) + spiderman_foot_offset  # Feet below center
             spiderman_y = height // 2  # Use torso Y for detection
             
-            # Convert to HSV for better color detection
-            hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
-            
-            # Define ranges for path detection (dark asphalt/concrete)
-            # Lower and upper bounds for dark path material
-            lower_path = np.array([0, 0, 20])    # Very dark colors
-            upper_path = np.array([180, 255, 80]) # Dark to medium gray
-            
-            # Create mask for path areas
-            path_mask = cv2.inRange(hsv, lower_path, upper_path)
+            # Fit the path centreline over several rows ahead of Spider-Man's feet
+            path_model = fit_path_centreline(frame, center_x, spiderman_feet_y, level=PATH_PYRAMID_LEVEL,
+                                             buffers=buffers)
             
-            # Clean up the mask
-            kernel = np.ones((3,3), np.uint8)
-            path_mask = cv2.morphologyEx(path_mask, cv2.MORPH_CLOSE, kernel)
-            path_mask = cv2.morphologyEx(path_mask, cv2.MORPH_OPEN, kernel)
-            
-            # Find path edges using Canny edge detection
-            edges = cv2.Canny(path_mask, 50, 150)
-            
-            # Detect left and right path edges at Spider-Man's feet level
-            left_edge = self._find_path_edge(edges, spiderman_feet_y, 'left', width, height)
-            right_edge = self._find_path_edge(edges, spiderman_feet_y, 'right', width, height)
-            
-            # Calculate path center and Spider-Man's offset
-            if left_edge is not None and right_edge is not None:
-                path_center = (left_edge + right_edge) / 2
-                offset = spiderman_torso_x - path_center
+            if path_model is not None:
+                offset = path_model['offset']
+                
+                # Blend the offset at the feet with the offset at a preview point ahead
+                steering_error = path_steering_error(path_model, spiderman_torso_x)
+                
+                correction = {
+                    'error': steering_error,
+                    'offset': abs(steering_error),
+                    'heading': path_model['heading'],
+                    'curvature': path_model['curvature'],
+                }
                 
                 # Determine correction needed
-                if abs(offset) > 30:  # Significant offset from center
-                    if offset > 0:
-                        return {'action': 'left', 'reason': 'too_far_right', 'offset': offset}
+                if abs(steering_error) > CORRECTION_THRESHOLD_PX:  # Significant offset from center or curve ahead
+                    if abs(offset) > CORRECTION_THRESHOLD_PX:
+                        reason = 'too_far_right' if steering_error > 0 else 'too_far_left'
                     else:
-                        return {'action': 'right', 'reason': 'too_far_left', 'offset': abs(offset)}
+                        reason = 'path_curves_left' if steering_error > 0 else 'path_curves_right'
+                    correction.update(action='left' if steering_error > 0 else 'right', reason=reason)
                 else:
-                    return {'action': 'forward', 'reason': 'centered_on_path', 'offset': abs(offset)}
+                    correction.update(action='forward', reason='centered_on_path')
+                return correction
             else:
                 # Fallback: try to detect path using horizontal line scanning at feet level
-                return self._detect_path_fallback(frame, spiderman_torso_x, spiderman_feet_y)
+                return self._detect_path_fallback(frame, spiderman_torso_x, spiderman_feet_y, buffers)
             
         except Exception as e:
             print(f"❌ Path detection failed: {e}")
-            return {'action': 'forward', 'reason': 'detection_error', 'offset': 0}
+            return {'action': 'forward', 'reason': 'detection_error', 'offset': 0, 'error': 0.0}
     
-    def _find_path_edge(self, edges, y_position, direction, width, height):
-        """Find path edge at specific y position"""
-        try:
-            import cv2
-            import numpy as np
-            
-            # Look for edges near Spider-Man's y position (±50 pixels)
-            search_range = 50
-            y_start = max(0, y_position - search_range)
-            y_end = min(height, y_position + search_range)
-            
-            # Extract horizontal slice
-            edge_slice = edges[y_start:y_end, :]
-            
-            if direction == 'left':
-                # Look from center towards left edge
-                for x in range(width // 2, 0, -1):
-                    if np.any(edge_slice[:, x]):
-                        return x
-            else:  # right
-                # Look from center towards right edge
-                for x in range(width // 2, width):
-                    if np.any(edge_slice[:, x]):
-                        return x
-            
-            return None
-            
-        except Exception as e:
-            print(f"❌ Edge detection failed: {e}")
-            return None
-    
-    def _detect_path_fallback(self, frame, spiderman_x, spiderman_y):
+    def _detect_path_fallback(self, frame, spiderman_x, spiderman_y, buffers=None):
         """Fallback path detection using horizontal scanning"""
         try:
-            import cv2
-            import numpy as np
-            
-            # Convert to grayscale
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            
-            # Scan horizontal line at Spider-Man's position
-            scan_line = gray[spiderman_y, :]
-            
-            # Find dark areas (path) vs light areas (snow/grass)
-            dark_threshold = 80
-            path_pixels = scan_line < dark_threshold
+            # Scan horizontal line at Spider-Man's position for dark areas (path)
+            # vs light areas (snow/grass) - only that row is converted to grayscale
+            path_span = find_dark_span(frame, spiderman_y, buffers=buffers)
             
-            # Find left and right boundaries of path
-            path_indices = np.where(path_pixels)[0]
-            
-            if len(path_indices) > 50:  # Minimum path width
-                left_boundary = path_indices[0]
-                right_boundary = path_indices[-1]
+            if path_span is not None:  # Wider than the minimum path width
+                left_boundary, right_boundary = path_span
                 path_center = (left_boundary + right_boundary) / 2
                 
                 offset = spiderman_x - path_center
                 
-                if abs(offset) > 30:
+                if abs(offset) > CORRECTION_THRESHOLD_PX:
                     if offset > 0:
-                        return {'action': 'left', 'reason': 'fallback_too_far_right', 'offset': offset}
+                        return {'action': 'left', 'reason': 'fallback_too_far_right', 'offset': offset, 'error': offset}
                     else:
-                        return {'action': 'right', 'reason': 'fallback_too_far_left', 'offset': abs(offset)}
+                        return {'action': 'right', 'reason': 'fallback_too_far_left', 'offset': abs(offset), 'error': offset}
+                return {'action': 'forward', 'reason': 'fallback_centered', 'offset': abs(offset), 'error': offset}
             
-            return {'action': 'forward', 'reason': 'fallback_centered', 'offset': 0}
+            return {'action': 'forward', 'reason': 'fallback_no_path', 'offset': 0, 'error': 0.0}
             
         except Exception as e:
             print(f"❌ Fallback detection failed: {e}")
-            return {'action': 'forward', 'reason': 'fallback_error', 'offset': 0}
+            return {'action': 'forward', 'reason': 'fallback_error', 'offset': 0, 'error': 0.0}
     
     def _execute_path_correction(self, correction):
         """Execute path correction maneuver"""
@@ -614,38 +645,6 @@ class SpiderManScenarioScripts(SpiderManKeyboardControls):
         time.sleep(0.1)
         pydirectinput.keyUp(self.KEYS['forward'])
     
-    def _execute_path_correction_continuous(self, correction):
-        """Execute path correction while maintaining walk mode (Left-Alt + W)"""
-        action = correction['action']
-        reason = correction['reason']
-        offset = correction['offset']
-        
-        print(f"   🛤️ {action} correction - {reason} (maintaining walk mode)")
-        
-        # Determine correction strength based on offset
-        if offset > 60:
-            correction_duration = 0.4  # Strong correction
-        elif offset > 40:
-            correction_duration = 0.3  # Medium correction
-        else:
-            correction_duration = 0.2  # Light correction
-        
-        # Execute steering while maintaining Left-Alt + W
-        if action == 'left':
-            # Add left steering while keeping walk mode active
-            pydirectinput.keyDown(self.KEYS['left'])
-            time.sleep(correction_duration)
-            pydirectinput.keyUp(self.KEYS['left'])
-            print(f"   ↖️ Left steering for {correction_duration:.1f}s")
-        elif action == 'right':
-            # Add right steering while keeping walk mode active
-            pydirectinput.keyDown(self.KEYS['right'])
-            time.sleep(correction_duration)
-            pydirectinput.keyUp(self.KEYS['right'])
-            print(f"   ↗️ Right steering for {correction_duration:.1f}s")
-        
-        # Note: Left-Alt and W remain held throughout the entire process
-    
     def _start_keyboard_listener(self):
         """Start keyboard listener for End key"""
         try:
@@ -676,10 +675,12 @@ class SpiderManScenarioScripts(SpiderManKeyboardControls):
             if key == Key.end:
                 print("\n🛑 End key pressed - stopping system...")
                 self.auto_walk_running = False
+                self._halt_threat_reaction()
                 return False  # Stop the listener
             elif key == Key.esc:
                 print("\n🛑 Escape key pressed - stopping system...")
                 self.auto_walk_running = False
+                self._halt_threat_reaction()
                 return False  # Stop the listener
         except Exception as e:
             print(f"⚠️ Error handling key press: {e}")
@@ -701,9 +702,14 @@ def get_spiderman_scenario_scripts_commands(gamepad):
         
         # Path-Following Scenarios
         "path follow": lambda: spiderman._start_path_following(),
+        "path follow snow": lambda: spiderman._start_path_following('snow'),
         "stop path follow": lambda: spiderman._stop_auto_walk(),  # Uses same stop method
         
         # AI-Powered Scenarios
         "auto swing": lambda: spiderman._start_auto_swing(),
         "stop auto swing": lambda: spiderman._stop_auto_swing(),
+        
+        # Combat Scenarios
+        "threat reaction": lambda: spiderman._start_threat_reaction(),
+        "stop threat reaction": lambda: spiderman._stop_threat_reaction(),
     }
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Skyline Estimation
+Column-wise sky segmentation on a small pyramid level. For each column the
+first non-sky row from the top is the skyline; columns whose skyline rises well
+above Spider-Man have something to attach a web to. Per-sector anchor coverage
+decides swing versus run, and when the skyline alone settles that decision the
+auto-swing loop skips YOLO for the frame.
+"""
+
+from typing import Dict, Optional
+
+import cv2
+import numpy as np
+
+from buffer_pool import BufferPool, pooled
+from image_pyramid import pyramid_down, pyramid_scale
+from obstacle_analysis import SECTOR_NAMES, SECTOR_CENTER
+
+# Pyramid level for the skyline (1/8: 240x135 at 1080p)
+SKYLINE_PYRAMID_LEVEL = 3
+
+# Sky pixels: bright, and not warmer than they are blue (daylight sky, haze, clouds)
+SKY_MIN_VALUE = 150
+SKY_MAX_RED_EXCESS = 10
+
+# Non-sky runs shorter than this (rows at full resolution) are wires, birds or HUD text
+SKYLINE_MIN_RUN = 24
+
+# A column offers an anchor when its skyline is above this fraction of the frame height
+ANCHOR_ROW_FRACTION = 0.35
+
+# Fraction of a sector's columns with anchors for the sector to count as available
+ANCHOR_MIN_COVERAGE = 0.15
+
+# The centre is open when its skyline stays below this fraction of the frame height
+OPEN_ROW_FRACTION = 0.5
+
+
+def sky_mask(image: np.ndarray, buffers: Optional[BufferPool] = None) -> np.ndarray:
+    """Binary (0/255) mask of sky-coloured pixels in a BGR image"""
+    shape = image.shape[:2]
+    blue, green, red = cv2.split(image)
+    value = cv2.max(cv2.max(blue, green), red)
+    bright = cv2.compare(value, SKY_MIN_VALUE, cv2.CMP_GE)
+    # red - blue saturates at 0, so this keeps pixels with red <= blue + SKY_MAX_RED_EXCESS
+    cool = cv2.compare(cv2.subtract(red, blue), SKY_MAX_RED_EXCESS, cv2.CMP_LE)
+    return cv2.bitwise_and(bright, cool, dst=pooled(buffers, 'sky', shape))
+
+
+def skyline_rows(image: np.ndarray, scale: int = 1, buffers: Optional[BufferPool] = None) -> np.ndarray:
+    """First non-sky row of each column in frame pixels (frame height where the column is all sky)
+
+    image is the frame downscaled by scale; thin non-sky runs are opened away first.
+    """
+    height = image.shape[0]
+    structure = cv2.bitwise_not(sky_mask(image, buffers), dst=pooled(buffers, 'structure', image.shape[:2]))
+    run = max(1, SKYLINE_MIN_RUN // scale)
+    structure = cv2.morphologyEx(structure, cv2.MORPH_OPEN, np.ones((run, 1), np.uint8), dst=structure)
+
+    present = structure.any(axis=0)
+    first = np.where(present, structure.argmax(axis=0), height)
+    return first * scale
+
+
+def estimate_skyline(frame: np.ndarray, level: int = SKYLINE_PYRAMID_LEVEL,
+                     buffers: Optional[BufferPool] = None) -> Dict:
+    """Skyline, per-sector anchor availability and, when it settles it, the swing decision
+
+    settled is True when the skyline alone decides the frame: no anchors anywhere
+    (run), or anchors on some side with nothing tall ahead (keep swinging forward).
+    Otherwise action is None and the buildings ahead need detecting.
+    """
+    height = frame.shape[0]
+    scale = pyramid_scale(level)
+    skyline = skyline_rows(pyramid_down(frame, level, buffers), scale, buffers)
+
+    # Left, centre and right thirds of the screen
+    columns = len(skyline)
+    sectors = np.arange(columns) * 3 // columns
+    anchor_columns = skyline < ANCHOR_ROW_FRACTION * height
+    coverage = np.bincount(sectors, weights=anchor_columns, minlength=3) / np.bincount(sectors, minlength=3)
+    anchors = coverage >= ANCHOR_MIN_COVERAGE
+    center_open = bool(np.all(skyline[sectors == SECTOR_CENTER] >= OPEN_ROW_FRACTION * height))
+
+    if not anchors.any():
+        action, reason = 'run', 'no_swing_anchors'
+    elif center_open:
+        action, reason = 'forward', 'open_sky_ahead'
+    else:
+        action, reason = None, 'structures_ahead'
+    return {
+        'action': action,
+        'reason': reason,
+        'settled': action is not None,
+        'skyline': skyline,
+        'anchor_coverage': dict(zip(SECTOR_NAMES, coverage.round(2).tolist())),
+        'anchors': [name for name, available in zip(SECTOR_NAMES, anchors) if available],
+    }
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Vision Stage Graph
+Per-frame vision stages declared with their inputs and run on a small thread
+pool. A stage starts as soon as everything it needs is available, so stages
+that do not depend on each other (OpenCV and ONNX Runtime release the GIL)
+overlap, and frame latency approaches the longest chain instead of the sum of
+all stages. Each stage's wall time is recorded per frame and as a running mean.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, List, Tuple
+
+# Worker threads: enough for the independent stages of one frame
+STAGE_WORKERS = 3
+
+# Weight of the newest frame in the running mean timings
+TIMING_SMOOTHING = 0.1
+
+
+class StageGraph:
+    """Named stages with dependencies, run concurrently once per frame"""
+
+    def __init__(self, max_workers: int = STAGE_WORKERS):
+        self._stages: Dict[str, Tuple[Callable, Tuple[str, ...]]] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='vision-stage')
+        self.timings: Dict[str, float] = {}       # Last frame, ms
+        self.mean_timings: Dict[str, float] = {}  # Running mean, ms
+
+    def add(self, name: str, function: Callable, *needs: str) -> 'StageGraph':
+        """Add a stage: function(*needs) where needs are frame inputs or earlier stages"""
+        if name in self._stages:
+            raise ValueError(f"Stage {name} already exists")
+        self._stages[name] = (function, needs)
+        return self
+
+    def run(self, **inputs: Any) -> Dict[str, Any]:
+        """Run every stage for one frame, returns the inputs and each stage's result
+
+        A stage that raises stops the frame: stages already running finish,
+        nothing new starts, and the exception is re-raised.
+        """
+        results: Dict[str, Any] = dict(inputs)
+        missing = {need for _, needs in self._stages.values() for need in needs} - set(results) - set(self._stages)
+        if missing:
+            raise ValueError(f"Missing stage inputs: {sorted(missing)}")
+
+        started = time.perf_counter()
+        waiting = dict(self._stages)
+        running = {}
+        timings: Dict[str, float] = {}
+        error = None
+        while waiting or running:
+            if error is None:
+                for name, (function, needs) in list(waiting.items()):
+                    if all(need in results for need in needs):
+                        del waiting[name]
+                        running[self._executor.submit(self._timed, function, [results[need] for need in needs])] = name
+            if not running:
+                if error is None:
+                    raise ValueError(f"Stages with unmet dependencies: {sorted(waiting)}")
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name], timings[name] = future.result()
+                except Exception as e:
+                    error = error or e
+        timings['frame'] = (time.perf_counter() - started) * 1000
+        self._record(timings)
+        if error is not None:
+            raise error
+        return results
+
+    @staticmethod
+    def _timed(function: Callable, arguments: List[Any]) -> Tuple[Any, float]:
+        """Result and wall time in ms"""
+        started = time.perf_counter()
+        result = function(*arguments)
+        return result, (time.perf_counter() - started) * 1000
+
+    def _record(self, timings: Dict[str, float]):
+        """Keep this frame's timings and update the running means"""
+        self.timings = timings
+        for name, elapsed in timings.items():
+            mean = self.mean_timings.get(name)
+            self.mean_timings[name] = elapsed if mean is None else mean + TIMING_SMOOTHING * (elapsed - mean)
+
+    def timing_report(self) -> str:
+        """One line of mean stage timings"""
+        return " | ".join(f"{name} {elapsed:.1f}ms" for name, elapsed in self.mean_timings.items())
+
+    def shutdown(self):
+        """Stop the worker threads"""
+        self._executor.shutdown(wait=True)
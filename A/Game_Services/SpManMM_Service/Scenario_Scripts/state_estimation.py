@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - State Estimation
+Constant-velocity Kalman filters for the path offset and for obstacle tracks.
+Measurements far outside the predicted uncertainty are rejected, so one noisy
+frame cannot trigger a sharp manoeuvre, and the filtered state coasts between
+frames when perception runs slower or misses a detection.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Measurements further than this many standard deviations from the prediction are outliers
+GATE_SIGMA = 3.0
+
+# After this many outliers in a row the scene really changed: restart from the measurement
+MAX_CONSECUTIVE_REJECTIONS = 3
+
+# Path state: offset/error in px and heading in radians
+PATH_PROCESS_NOISE = np.array([400.0, 0.5])      # Acceleration variance per second
+PATH_MEASUREMENT_NOISE = np.array([100.0, 0.01])  # Measurement variance
+PATH_MAX_COAST_S = 0.5  # Stop predicting the path this long after its last measurement
+
+# Obstacle tracks: centre x/y in px
+OBSTACLE_PROCESS_NOISE = 2000.0
+OBSTACLE_MEASUREMENT_NOISE = 64.0
+OBSTACLE_GATE_PX = 120       # Detections further than this from every track start a new one
+OBSTACLE_MIN_HITS = 2        # Detections needed before a track is reported
+OBSTACLE_MAX_AGE_S = 0.5     # Tracks unseen for this long are dropped
+
+
+class ConstantVelocityFilter:
+    """Kalman filter with independent constant-velocity axes
+
+    Each axis has state (position, velocity) and its own 2x2 covariance, all
+    stored as arrays so every axis is updated in one vectorised step.
+    """
+
+    def __init__(self, measurement, timestamp: float, process_noise, measurement_noise,
+                 gate_sigma: float = GATE_SIGMA):
+        measurement = np.asarray(measurement, dtype=np.float64)
+        self.process_noise = np.broadcast_to(np.asarray(process_noise, dtype=np.float64), measurement.shape)
+        self.measurement_noise = np.broadcast_to(np.asarray(measurement_noise, dtype=np.float64), measurement.shape)
+        self.gate_sigma = gate_sigma
+        self.reset(measurement, timestamp)
+
+    def reset(self, measurement, timestamp: float):
+        """Restart at a measurement with zero velocity and wide velocity uncertainty"""
+        self.position = np.array(measurement, dtype=np.float64)
+        self.velocity = np.zeros_like(self.position)
+        # Covariance terms per axis: position, position-velocity, velocity
+        self.p_pp = self.measurement_noise.copy()
+        self.p_pv = np.zeros_like(self.position)
+        self.p_vv = self.measurement_noise * 100.0
+        self.timestamp = timestamp
+        self.rejections = 0
+
+    def predict(self, timestamp: float) -> np.ndarray:
+        """Advance the state to timestamp, returns the predicted position"""
+        dt = timestamp - self.timestamp
+        if dt <= 0:
+            return self.position
+        self.position = self.position + self.velocity * dt
+        # P = F P F^T + Q for F = [[1, dt], [0, 1]] and white-noise acceleration Q
+        q = self.process_noise
+        self.p_pp = self.p_pp + 2 * dt * self.p_pv + dt * dt * self.p_vv + q * dt ** 3 / 3
+        self.p_pv = self.p_pv + dt * self.p_vv + q * dt ** 2 / 2
+        self.p_vv = self.p_vv + q * dt
+        self.timestamp = timestamp
+        return self.position
+
+    def innovation_sigma(self, measurement) -> np.ndarray:
+        """Per-axis distance of a measurement from the prediction in standard deviations"""
+        return np.abs(np.asarray(measurement) - self.position) / np.sqrt(self.p_pp + self.measurement_noise)
+
+    def update(self, measurement, timestamp: float) -> bool:
+        """Predict to timestamp and fuse a measurement, returns False if it was rejected"""
+        self.predict(timestamp)
+        measurement = np.asarray(measurement, dtype=np.float64)
+        if np.any(self.innovation_sigma(measurement) > self.gate_sigma):
+            self.rejections += 1
+            if self.rejections >= MAX_CONSECUTIVE_REJECTIONS:
+                self.reset(measurement, timestamp)
+                return True
+            return False
+
+        self.rejections = 0
+        innovation = measurement - self.position
+        s = self.p_pp + self.measurement_noise
+        gain_p, gain_v = self.p_pp / s, self.p_pv / s
+        self.position = self.position + gain_p * innovation
+        self.velocity = self.velocity + gain_v * innovation
+        # P = (I - K H) P
+        self.p_vv = self.p_vv - gain_v * self.p_pv
+        self.p_pv = (1 - gain_p) * self.p_pv
+        self.p_pp = (1 - gain_p) * self.p_pp
+        return True
+
+
+class PathStateFilter:
+    """Filtered path steering error and heading"""
+
+    def __init__(self, max_coast: float = PATH_MAX_COAST_S):
+        self.max_coast = max_coast
+        self.filter: Optional[ConstantVelocityFilter] = None
+        self.measured_at: Optional[float] = None
+
+    def update(self, error: float, heading: float, timestamp: float) -> Dict:
+        """Fuse a path measurement, returns the filtered state"""
+        if self.filter is None or timestamp - self.measured_at > self.max_coast:
+            self.filter = ConstantVelocityFilter([error, heading], timestamp,
+                                                 PATH_PROCESS_NOISE, PATH_MEASUREMENT_NOISE)
+            accepted = True
+        else:
+            accepted = self.filter.update([error, heading], timestamp)
+        if accepted:
+            self.measured_at = timestamp
+        return self._state(accepted)
+
+    def predict(self, timestamp: float) -> Optional[Dict]:
+        """Coast without a measurement, None once the path has been lost too long"""
+        if self.filter is None or timestamp - self.measured_at > self.max_coast:
+            return None
+        self.filter.predict(timestamp)
+        return self._state(False)
+
+    def reset(self):
+        """Forget the path"""
+        self.filter = None
+        self.measured_at = None
+
+    def _state(self, accepted: bool) -> Dict:
+        """Current estimate as a dict"""
+        error, heading = self.filter.position
+        return {
+            'error': float(error),
+            'heading': float(heading),
+            'error_rate': float(self.filter.velocity[0]),
+            'accepted': accepted,
+        }
+
+
+class ObstacleTracker:
+    """Tracks obstacle centres across frames and reports confirmed, filtered obstacles"""
+
+    def __init__(self, gate_px: float = OBSTACLE_GATE_PX, min_hits: int = OBSTACLE_MIN_HITS,
+                 max_age: float = OBSTACLE_MAX_AGE_S):
+        self.gate_px = gate_px
+        self.min_hits = min_hits
+        self.max_age = max_age
+        self.tracks: List[Dict] = []
+        self._next_id = 0
+
+    def update(self, obstacles: List[Dict], timestamp: float) -> List[Dict]:
+        """Associate this frame's detections with tracks, returns the confirmed obstacles"""
+        for track in self.tracks:
+            track['filter'].predict(timestamp)
+
+        unmatched = self._associate(obstacles, timestamp)
+        for obstacle in unmatched:
+            self._start_track(obstacle, timestamp)
+
+        self.tracks = [track for track in self.tracks if timestamp - track['last_seen'] <= self.max_age]
+        return self.confirmed()
+
+    def confirmed(self) -> List[Dict]:
+        """Obstacles of confirmed tracks at their filtered positions"""
+        obstacles = []
+        for track in self.tracks:
+            if track['hits'] < self.min_hits:
+                continue
+            obstacle = dict(track['obstacle'])
+            center_x, center_y = track['filter'].position
+            width, height = obstacle['size']
+            x1, y1 = int(center_x - width / 2), int(center_y - height / 2)
+            obstacle.update(
+                bbox=(x1, y1, x1 + width, y1 + height),
+                center=(int(center_x), int(center_y)),
+                velocity=tuple(float(v) for v in track['filter'].velocity),
+                track_id=track['id'],
+                hits=track['hits'],
+            )
+            obstacles.append(obstacle)
+        return obstacles
+
+    def reset(self):
+        """Drop every track"""
+        self.tracks = []
+
+    def _associate(self, obstacles: List[Dict], timestamp: float) -> List[Dict]:
+        """Greedy nearest-neighbour matching within the gate, returns unmatched detections"""
+        if not obstacles or not self.tracks:
+            return list(obstacles)
+
+        detections = np.array([obstacle['center'] for obstacle in obstacles], dtype=np.float64)
+        predictions = np.array([track['filter'].position for track in self.tracks])
+        distances = np.linalg.norm(detections[:, None, :] - predictions[None, :, :], axis=2)
+        # Only the same class can continue a track
+        classes = np.array([obstacle['class'] for obstacle in obstacles])
+        track_classes = np.array([track['obstacle']['class'] for track in self.tracks])
+        distances[classes[:, None] != track_classes[None, :]] = np.inf
+
+        matched_detections, matched_tracks = set(), set()
+        for flat_index in np.argsort(distances, axis=None):
+            detection_index, track_index = np.unravel_index(flat_index, distances.shape)
+            if distances[detection_index, track_index] > self.gate_px:
+                break  # Sorted, so every remaining pair is outside the gate
+            if detection_index in matched_detections or track_index in matched_tracks:
+                continue
+            track = self.tracks[track_index]
+            obstacle = obstacles[detection_index]
+            # A gated-out (outlier) detection is consumed without moving the track
+            if track['filter'].update(obstacle['center'], timestamp):
+                track['obstacle'] = obstacle
+                track['hits'] += 1
+                track['last_seen'] = timestamp
+            matched_detections.add(detection_index)
+            matched_tracks.add(track_index)
+        return [obstacle for index, obstacle in enumerate(obstacles) if index not in matched_detections]
+
+    def _start_track(self, obstacle: Dict, timestamp: float):
+        """New tentative track for an unmatched detection"""
+        self.tracks.append({
+            'id': self._next_id,
+            'filter': ConstantVelocityFilter(obstacle['center'], timestamp,
+                                             OBSTACLE_PROCESS_NOISE, OBSTACLE_MEASUREMENT_NOISE),
+            'obstacle': obstacle,
+            'hits': 1,
+            'last_seen': timestamp,
+        })
+        self._next_id += 1
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Steering Controller
+Continuous PID steering for path following and auto-walk. Perception loops feed
+the latest path offset and heading; a separate fixed-tick thread turns the PID
+output into a left/right key duty cycle, or sets it directly on an analogue
+stick, so steering never blocks detection.
+"""
+
+import time
+import threading
+from typing import Callable, Dict, Optional
+
+from frame_pacer import FramePacer
+
+# Key output rate: the steering key state can change once per tick
+STEERING_TICK_HZ = 25
+
+# Measurements older than this release the keys (perception stalled or lost the path)
+STALE_MEASUREMENT_S = 0.5
+
+# Stick output changes smaller than this are not sent
+STICK_RESOLUTION = 0.01
+
+# Gain profiles per terrain. Output is a duty cycle in [-1, 1] (negative = left)
+#   kp/ki/kd: PID gains on the lateral offset in pixels
+#   heading_gain: feed-forward on the path heading (radians) to anticipate turns
+#   deadband_px: offsets smaller than this are treated as centred
+#   integral_limit: anti-windup clamp on the integral term (pixel-seconds)
+STEERING_PROFILES = {
+    'path': {'kp': 0.010, 'ki': 0.004, 'kd': 0.0015, 'heading_gain': 1.2, 'deadband_px': 8, 'integral_limit': 60.0},
+    'park': {'kp': 0.014, 'ki': 0.0, 'kd': 0.002, 'heading_gain': 0.0, 'deadband_px': 15, 'integral_limit': 0.0},
+    'snow': {'kp': 0.007, 'ki': 0.002, 'kd': 0.0025, 'heading_gain': 0.8, 'deadband_px': 12, 'integral_limit': 80.0},
+}
+
+
+class SteeringController:
+    """Fixed-tick PID steering that drives the left/right keys with a duty cycle
+
+    With a stick callable (output in [-1, 1]) the output is sent to it instead
+    and the keys are left alone.
+    """
+
+    def __init__(self, key_down: Callable[[str], None], key_up: Callable[[str], None],
+                 left_key: str = 'a', right_key: str = 'd', profile: str = 'path',
+                 tick_hz: float = STEERING_TICK_HZ, stick: Optional[Callable[[float], None]] = None):
+        self.key_down = key_down
+        self.key_up = key_up
+        self.stick = stick
+        self.keys = {'left': left_key, 'right': right_key}
+        self.tick_interval = 1.0 / tick_hz
+        self.pacer = FramePacer(tick_hz, 'Steering')
+        self.gains: Dict[str, float] = {}
+        self.set_profile(profile)
+
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        # Latest measurement (error = -offset: positive means steer right)
+        self._error = 0.0
+        self._error_rate = 0.0
+        self._heading = 0.0
+        self._measured_at: Optional[float] = None
+
+        self._integral = 0.0
+        self._accumulator = 0.0  # Sigma-delta state for the duty cycle
+        self._held_key: Optional[str] = None
+        self._stick_value = 0.0
+        self.output = 0.0
+
+    def set_profile(self, profile: str):
+        """Switch to a terrain gain profile"""
+        if profile not in STEERING_PROFILES:
+            raise ValueError(f"Unknown steering profile: {profile}")
+        self.profile = profile
+        self.gains = dict(STEERING_PROFILES[profile])
+
+    # === MEASUREMENTS ===
+
+    def update(self, offset: float, heading: float = 0.0, timestamp: Optional[float] = None):
+        """Feed a measurement: offset in px (positive = too far right), heading in radians"""
+        now = time.perf_counter() if timestamp is None else timestamp
+        error = -offset
+        with self._lock:
+            if self._measured_at is not None and now > self._measured_at:
+                self._error_rate = (error - self._error) / (now - self._measured_at)
+            self._error = error
+            self._heading = heading
+            self._measured_at = now
+
+    # === CONTROL ===
+
+    def tick(self, now: Optional[float] = None) -> float:
+        """Run one control step and update the held key, returns the duty cycle"""
+        now = time.perf_counter() if now is None else now
+        with self._lock:
+            error, error_rate, heading, measured_at = self._error, self._error_rate, self._heading, self._measured_at
+
+        if measured_at is None or now - measured_at > STALE_MEASUREMENT_S:
+            self._integral = 0.0
+            self.output = 0.0
+            self._release()
+            return 0.0
+
+        gains = self.gains
+        if abs(error) < gains['deadband_px']:
+            error = 0.0
+            error_rate = 0.0
+
+        limit = gains['integral_limit']
+        self._integral = max(-limit, min(limit, self._integral + error * self.tick_interval))
+
+        output = (gains['kp'] * error + gains['ki'] * self._integral
+                  + gains['kd'] * error_rate + gains['heading_gain'] * heading)
+        self.output = max(-1.0, min(1.0, output))
+        self._drive(self.output)
+        return self.output
+
+    def _drive(self, output: float):
+        """Set the stick to the output, or hold the steering key on a fraction |output| of ticks"""
+        if self.stick is not None:
+            self._set_stick(output)
+            return
+        self._accumulator += abs(output)
+        if self._accumulator >= 1.0:
+            self._accumulator -= 1.0
+            self._set_key('right' if output > 0 else 'left')
+        else:
+            self._set_key(None)
+
+    def _set_key(self, direction: Optional[str]):
+        """Press the key for a direction (None releases), only sending changes"""
+        key = self.keys.get(direction)
+        if key == self._held_key:
+            return
+        if self._held_key is not None:
+            self.key_up(self._held_key)
+        if key is not None:
+            self.key_down(key)
+        self._held_key = key
+
+    def _set_stick(self, value: float):
+        """Move the stick, only sending changes of at least the stick resolution"""
+        if value == self._stick_value or (value and abs(value - self._stick_value) < STICK_RESOLUTION):
+            return
+        self.stick(value)
+        self._stick_value = value
+
+    def _release(self):
+        """Centre the stick or release the steering keys"""
+        if self.stick is not None:
+            self._set_stick(0.0)
+        else:
+            self._set_key(None)
+
+    # === TIMER THREAD ===
+
+    def start(self):
+        """Start steering on its own fixed-tick thread"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the tick thread and release the steering keys (or centre the stick)"""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._release()
+        self._integral = 0.0
+        self._accumulator = 0.0
+
+    def _run(self):
+        """Tick at a fixed rate using absolute deadlines so timing does not drift"""
+        self.pacer.reset()
+        while self._running:
+            self.pacer.wait()
+            try:
+                self.tick()
+            except Exception as e:
+                print(f"❌ Steering tick failed: {e}")
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Threat Reaction
+Dodges on the game's spider-sense indicator without waiting for YOLO: the
+dodge window is shorter than one inference. Each tick probes a small region
+around Miles, downscaled, for the indicator's saturated orange-red and reacts
+as soon as that colour rises clearly above its running background level, which
+keeps adapting (slowly) during a threat so red that stays in view is absorbed. The
+replay harness plays recorded or synthetic frames back as a simulated screen
+and measures the end-to-end latency from the indicator appearing to the dodge.
+"""
+
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from buffer_pool import BufferPool, pooled
+from image_pyramid import pyramid_down
+from frame_pacer import FramePacer
+
+# Region around Miles probed for the indicator (fractions of width and height)
+THREAT_ROI = (0.35, 0.1, 0.65, 0.75)
+FULL_FRAME = (0.0, 0.0, 1.0, 1.0)
+
+# Pyramid level of the probe (1/4: 144x175 for the 1080p region)
+THREAT_PYRAMID_LEVEL = 2
+
+# Spider-sense indicator colour in OpenCV HSV (hue 0-180, red wraps around)
+THREAT_HSV_RANGES = (((0, 150, 170), (18, 255, 255)), ((168, 150, 170), (180, 255, 255)))
+
+# Indicator pixels (at the probe level) above the background level that count as a threat
+THREAT_MIN_PIXELS = 30
+# Weight of each quiet frame in the background level (red clothing, signs, HUD)
+BACKGROUND_SMOOTHING = 0.05
+# Weight of each threat frame: slower, so an indicator is not absorbed while it is up,
+# but red that stays in view (a parked car, a sign) still becomes background
+THREAT_BACKGROUND_SMOOTHING = 0.02
+# Red that stays above the background this long is scenery, not the indicator
+MAX_THREAT_S = 1.0
+
+# Probe rate and the end-to-end latency budget (indicator on screen -> dodge key down)
+THREAT_RATE_HZ = 60
+REACTION_BUDGET_MS = 50
+
+# One dodge per threat: the indicator stays up while the dodge plays out
+DODGE_COOLDOWN_S = 0.6
+
+
+class ThreatProbe:
+    """Counts indicator-coloured pixels in a downscaled region around Miles"""
+
+    def __init__(self, roi: Tuple[float, float, float, float] = THREAT_ROI, level: int = THREAT_PYRAMID_LEVEL,
+                 min_pixels: int = THREAT_MIN_PIXELS, buffers: Optional[BufferPool] = None,
+                 max_threat_s: float = MAX_THREAT_S):
+        self.roi = roi
+        self.level = level
+        self.min_pixels = min_pixels
+        self.buffers = BufferPool() if buffers is None else buffers
+        self.max_threat_s = max_threat_s
+        self.background: Optional[float] = None
+        self._threat_since: Optional[float] = None
+
+    def reset(self):
+        """Forget the background level"""
+        self.background = None
+        self._threat_since = None
+
+    def probe(self, frame: np.ndarray, timestamp: Optional[float] = None) -> Dict:
+        """Indicator pixel count of this frame (captured at timestamp) and whether it is a threat"""
+        height, width = frame.shape[:2]
+        x1, y1, x2, y2 = self.roi
+        crop = frame[int(y1 * height):int(y2 * height), int(x1 * width):int(x2 * width)]
+        small = pyramid_down(crop, self.level, self.buffers)
+        shape = small.shape[:2]
+        hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV, dst=pooled(self.buffers, 'threat_hsv', shape + (3,)))
+
+        mask = pooled(self.buffers, 'threat_mask', shape)
+        band = pooled(self.buffers, 'threat_band', shape)
+        mask.fill(0)
+        for lower, upper in THREAT_HSV_RANGES:
+            cv2.inRange(hsv, lower, upper, dst=band)
+            cv2.bitwise_or(mask, band, dst=mask)
+        pixels = cv2.countNonZero(mask)
+
+        now = time.perf_counter() if timestamp is None else timestamp
+        background = pixels if self.background is None else self.background
+        threat = pixels - background >= self.min_pixels
+        if not threat:
+            self._threat_since = None
+        elif self._threat_since is None:
+            self._threat_since = now
+        if threat and now - self._threat_since >= self.max_threat_s:
+            # Up for longer than any indicator: absorb it instead of dodging on forever
+            self.background = pixels
+            self._threat_since = None
+            threat = False
+        else:
+            smoothing = THREAT_BACKGROUND_SMOOTHING if threat else BACKGROUND_SMOOTHING
+            self.background = background + smoothing * (pixels - background)
+        return {'threat': threat, 'pixels': pixels, 'background': background}
+
+
+class ThreatReactor:
+    """Probes frames and calls react (which must not block) once per threat"""
+
+    def __init__(self, react: Callable[[], None], probe: Optional[ThreatProbe] = None,
+                 cooldown: float = DODGE_COOLDOWN_S):
+        self.react = react
+        self.probe = ThreatProbe() if probe is None else probe
+        self.cooldown = cooldown
+        self.reactions: List[float] = []   # perf_counter time of each reaction
+        self.latencies: List[float] = []   # Capture to reaction, seconds
+        self._last_reaction = -float('inf')
+
+    def step(self, frame: np.ndarray, captured_at: float) -> Dict:
+        """Probe one frame captured at captured_at (perf_counter), react if threatened"""
+        result = self.probe.probe(frame, captured_at)
+        result['reacted'] = False
+        if result['threat'] and captured_at - self._last_reaction >= self.cooldown:
+            self.react()
+            reacted_at = time.perf_counter()
+            self._last_reaction = reacted_at
+            self.reactions.append(reacted_at)
+            self.latencies.append(reacted_at - captured_at)
+            result['reacted'] = True
+        return result
+
+
+class ThreatReactionLoop:
+    """Captures and probes at a fixed rate on its own thread"""
+
+    def __init__(self, capture: Callable[[], Optional[np.ndarray]], react: Callable[[], None],
+                 probe: Optional[ThreatProbe] = None, rate_hz: float = THREAT_RATE_HZ):
+        self.capture = capture
+        self.reactor = ThreatReactor(react, probe)
+        self.pacer = FramePacer(rate_hz, 'Threat reaction')
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self):
+        """Start probing on a daemon thread"""
+        if self._running:
+            return
+        self._running = True
+        self.pacer.reset()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop probing (safe to call from any thread but the loop's own)"""
+        self._running = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while self._running:
+            self.pacer.wait()
+            try:
+                captured_at = time.perf_counter()
+                frame = self.capture()
+                if frame is not None:
+                    self.reactor.step(frame, captured_at)
+            except Exception as e:
+                print(f"❌ Threat reaction error: {e}")
+
+    def report(self) -> str:
+        """Reactions and their capture-to-dodge latency"""
+        latencies = self.reactor.latencies
+        if not latencies:
+            return f"🕷️ No threats reacted to | {self.pacer.report()}"
+        return (f"🕷️ {len(latencies)} dodges, latency {1000 * np.median(latencies):.1f} ms median, "
+                f"{1000 * max(latencies):.1f} ms max | {self.pacer.report()}")
+
+
+# === REPLAY HARNESS ===
+
+class ReplayScreen:
+    """Plays frames back in real time: capture() returns whatever is on screen now"""
+
+    def __init__(self, frames: Sequence[np.ndarray], fps: float):
+        self.frames = frames
+        self.fps = fps
+        self.started_at: Optional[float] = None
+
+    def start(self):
+        self.started_at = time.perf_counter()
+
+    def presented_at(self, index: int) -> float:
+        """perf_counter time at which frame index appears"""
+        return self.started_at + index / self.fps
+
+    @property
+    def finished(self) -> bool:
+        return time.perf_counter() >= self.presented_at(len(self.frames))
+
+    def capture(self) -> Optional[np.ndarray]:
+        index = int((time.perf_counter() - self.started_at) * self.fps)
+        return self.frames[index] if index < len(self.frames) else None
+
+
+def replay_threats(frames: Sequence[np.ndarray], fps: float, onsets: Sequence[int] = (),
+                   probe: Optional[ThreatProbe] = None, rate_hz: float = THREAT_RATE_HZ) -> Dict:
+    """Run the reaction loop against frames played back at fps, returns the reaction report
+
+    onsets are the frame indices where an indicator appears. Each reaction is
+    matched to the latest onset before it; latency is from that frame being
+    presented to the dodge, reactions with no onset are false, and onsets
+    without a reaction within the cooldown are missed.
+    """
+    screen = ReplayScreen(frames, fps)
+    loop = ThreatReactionLoop(screen.capture, lambda: None, probe, rate_hz)
+    screen.start()
+    loop.start()
+    while not screen.finished:
+        time.sleep(0.005)
+    loop.stop()
+
+    onset_times = [screen.presented_at(index) for index in onsets]
+    latencies, false_reactions, answered = [], 0, set()
+    for reacted_at in loop.reactor.reactions:
+        earlier = [index for index, onset in enumerate(onset_times) if onset <= reacted_at]
+        if not earlier or earlier[-1] in answered or reacted_at - onset_times[earlier[-1]] > DODGE_COOLDOWN_S:
+            false_reactions += 1
+            continue
+        answered.add(earlier[-1])
+        latencies.append((reacted_at - onset_times[earlier[-1]]) * 1000)
+    return {
+        'reactions': len(loop.reactor.reactions),
+        'latencies_ms': latencies,
+        'max_latency_ms': max(latencies, default=0.0),
+        'missed': [onsets[index] for index in range(len(onsets)) if index not in answered],
+        'false_reactions': false_reactions,
+        'within_budget': bool(latencies) and max(latencies) <= REACTION_BUDGET_MS,
+        'pacing': loop.pacer.stats(),
+    }
+
+
+def load_recording(path: str) -> Tuple[List[np.ndarray], float]:
+    """Frames and frame rate of a screen recording"""
+    capture = cv2.VideoCapture(path)
+    fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+    frames = []
+    while True:
+        ok, frame = capture.read()
+        if not ok:
+            break
+        frames.append(frame)
+    capture.release()
+    return frames, fps
+
+
+if __name__ == "__main__":
+    # Replay a screen recording: python threat_reaction.py recording.mp4 [onset frame ...]
+    if len(sys.argv) < 2:
+        print("Usage: python threat_reaction.py <recording> [onset frame ...]")
+        sys.exit(1)
+    frames, fps = load_recording(sys.argv[1])
+    print(f"🎞️ Replaying {len(frames)} frames at {fps:.0f} FPS...")
+    report = replay_threats(frames, fps, [int(onset) for onset in sys.argv[2:]])
+    print(f"🕷️ {report['reactions']} reactions, {report['false_reactions']} false, missed onsets {report['missed']}")
+    if report['latencies_ms']:
+        verdict = "✅ within" if report['within_budget'] else "❌ over"
+        print(f"{verdict} the {REACTION_BUDGET_MS} ms budget: max {report['max_latency_ms']:.1f} ms")
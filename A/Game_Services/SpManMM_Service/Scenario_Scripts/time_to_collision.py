@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Time to Collision
+Estimates how soon each tracked obstacle will be reached from two cues: the
+growth of its box (looming) and the bottom edge sliding down the screen (a
+ground-plane proxy). Under a constant approach speed both grow in proportion to
+1/distance, so their relative rates of change are 1/TTC without knowing the
+object's real size or distance. Static far-away objects barely change and are
+never a threat, while an obstacle ahead is flagged seconds before it is close.
+"""
+
+import math
+from typing import Dict, List, Optional
+
+# Screen row (fraction of height) where the ground meets the horizon in the walking camera
+HORIZON_FRACTION = 0.45
+
+# Weight of the newest frame in the smoothed approach rate (box sizes are noisy)
+TTC_SMOOTHING = 0.4
+
+# Approach rates (1/s) below this are not approaching at all
+MIN_APPROACH_RATE = 0.05
+
+# Obstacles further than this in time are ignored; urgency rises to 1 at the danger time
+TTC_HORIZON_S = 3.0
+TTC_CLOSE_S = 1.5
+TTC_DANGER_S = 0.7
+
+# Decision proximities from the least to the most urgent
+PROXIMITY_ORDER = ('safe', 'medium', 'close', 'danger')
+
+
+def ttc_proximity(ttc: float) -> str:
+    """Proximity class of a time to collision"""
+    if ttc <= TTC_DANGER_S:
+        return 'danger'
+    if ttc <= TTC_CLOSE_S:
+        return 'close'
+    return 'medium' if ttc <= TTC_HORIZON_S else 'safe'
+
+
+def most_urgent(*proximities: str) -> str:
+    """The most urgent of several proximity classes"""
+    return max(proximities, key=PROXIMITY_ORDER.index)
+
+
+def collision_threats(obstacles: List[Dict]) -> List[Dict]:
+    """Obstacles that will be reached within the TTC horizon, confidence scaled by urgency
+
+    Urgency is 0 at the horizon and 1 from the danger time on, so obstacles that
+    are still far away in time push the free-space heading gently. Obstacles
+    without a TTC (not tracked yet) pass through unchanged.
+    """
+    threats = []
+    for obstacle in obstacles:
+        ttc = obstacle.get('ttc')
+        if ttc is None:
+            threats.append(obstacle)
+        elif ttc < TTC_HORIZON_S:
+            urgency = min(1.0, (TTC_HORIZON_S - ttc) / (TTC_HORIZON_S - TTC_DANGER_S))
+            threats.append(dict(obstacle, confidence=obstacle['confidence'] * urgency, urgency=urgency))
+    return threats
+
+
+class TimeToCollisionEstimator:
+    """Smoothed time to collision per obstacle track"""
+
+    def __init__(self, horizon_fraction: float = HORIZON_FRACTION, smoothing: float = TTC_SMOOTHING):
+        self.horizon_fraction = horizon_fraction
+        self.smoothing = smoothing
+        self._tracks: Dict[int, Dict] = {}
+
+    def reset(self):
+        """Forget every track's history"""
+        self._tracks = {}
+
+    def update(self, obstacles: List[Dict], frame_shape, timestamp: float) -> List[Dict]:
+        """Copies of the tracked obstacles with 'ttc' in seconds (inf when not approaching)
+
+        Obstacles without a track_id are returned without a TTC.
+        """
+        frame_height = frame_shape[0]
+        horizon = frame_height * self.horizon_fraction
+        annotated, seen = [], set()
+        for obstacle in obstacles:
+            track_id = obstacle.get('track_id')
+            if track_id is None:
+                annotated.append(obstacle)
+                continue
+            seen.add(track_id)
+            rate = self._update_track(track_id, obstacle['bbox'], frame_height, horizon, timestamp)
+            ttc = 1.0 / rate if rate is not None and rate > MIN_APPROACH_RATE else math.inf
+            annotated.append(dict(obstacle, ttc=ttc))
+
+        self._tracks = {track_id: state for track_id, state in self._tracks.items() if track_id in seen}
+        return annotated
+
+    def _update_track(self, track_id: int, bbox, frame_height: int, horizon: float,
+                      timestamp: float) -> Optional[float]:
+        """Smoothed approach rate (1/TTC) of one track after this frame's box"""
+        _, y1, _, y2 = bbox
+        height = y2 - y1
+        # A box cut off by the screen bottom neither grows nor descends any more
+        clipped = y2 >= frame_height - 1
+        ground = y2 - horizon
+        state = self._tracks.get(track_id)
+        self._tracks[track_id] = {'height': height, 'ground': ground, 'clipped': clipped, 'timestamp': timestamp,
+                                  'rate': None if state is None else state['rate']}
+        if state is None or clipped or state['clipped'] or timestamp <= state['timestamp'] or height <= 0:
+            return self._tracks[track_id]['rate']
+
+        elapsed = timestamp - state['timestamp']
+        rates = [(height - state['height']) / (elapsed * height)]
+        if ground > 0 and state['ground'] > 0:
+            rates.append((ground - state['ground']) / (elapsed * ground))
+        rate = sum(rates) / len(rates)
+        if state['rate'] is not None:
+            rate = state['rate'] + self.smoothing * (rate - state['rate'])
+        self._tracks[track_id]['rate'] = rate
+        return rate
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Virtual Gamepad Steering
+Drives the left stick of a vgamepad controller with a continuous steering
+value, so steering is proportional instead of chopped into key presses.
+RecordingGamepad is a local stand-in with the same interface that records
+every report sent, for tests and dry runs without the virtual bus driver.
+"""
+
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Steer with the keys (duty cycle) or the gamepad's left stick: WEPLAY_STEERING=keys|stick
+STEERING_OUTPUT = os.environ.get('WEPLAY_STEERING', 'keys')
+
+STICK_MAX = 32767
+
+# XInput's default left stick dead zone (7849 / 32767): smaller deflections do nothing in game
+STICK_DEADZONE = 0.24
+
+
+def create_gamepad():
+    """Virtual Xbox 360 controller (needs vgamepad and its bus driver)"""
+    import vgamepad as vg
+    return vg.VX360Gamepad()
+
+
+class GamepadStick:
+    """Callable that sets the left stick's x axis from a steering value in [-1, 1]
+
+    Non-zero values are rescaled past the game's dead zone so small corrections
+    still turn; forward is the constant y deflection (0 leaves moving to the keys).
+    """
+
+    def __init__(self, gamepad, forward: float = 0.0, deadzone: float = STICK_DEADZONE):
+        self.gamepad = gamepad
+        self.forward = forward
+        self.deadzone = deadzone
+
+    def __call__(self, value: float):
+        value = max(-1.0, min(1.0, value))
+        if value:
+            value = (self.deadzone + (1 - self.deadzone) * abs(value)) * (1 if value > 0 else -1)
+        self.gamepad.left_joystick(x_value=int(value * STICK_MAX), y_value=int(self.forward * STICK_MAX))
+        self.gamepad.update()
+
+
+class RecordingGamepad:
+    """vgamepad stand-in: keeps the controller state and records it on every update()"""
+
+    def __init__(self):
+        self.left = (0, 0)
+        self.right = (0, 0)
+        self.triggers = (0, 0)
+        self.buttons = set()
+        self.reports: List[Dict] = []
+
+    def left_joystick(self, x_value: int, y_value: int):
+        self.left = (x_value, y_value)
+
+    def right_joystick(self, x_value: int, y_value: int):
+        self.right = (x_value, y_value)
+
+    def left_trigger(self, value: int):
+        self.triggers = (value, self.triggers[1])
+
+    def right_trigger(self, value: int):
+        self.triggers = (self.triggers[0], value)
+
+    def press_button(self, button):
+        self.buttons.add(button)
+
+    def release_button(self, button):
+        self.buttons.discard(button)
+
+    def reset(self):
+        """Neutral sticks and triggers, no buttons (sent on the next update)"""
+        self.left = self.right = self.triggers = (0, 0)
+        self.buttons.clear()
+
+    def update(self, timestamp: Optional[float] = None):
+        """Record the current state, as the real pad would send it"""
+        self.reports.append({
+            'time': time.perf_counter() if timestamp is None else timestamp,
+            'left': self.left,
+            'right': self.right,
+            'triggers': self.triggers,
+            'buttons': frozenset(self.buttons),
+        })
+
+    def left_stick_x(self) -> List[Tuple[float, float]]:
+        """(time, x in [-1, 1]) of every report"""
+        return [(report['time'], report['left'][0] / STICK_MAX) for report in self.reports]
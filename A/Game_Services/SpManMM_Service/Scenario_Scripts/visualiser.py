@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Detection Visualiser
+Debug overlays as an opt-in subscriber. The detection loop publishes each
+frame's detections and analysis, which only stores references; when enabled, a
+separate thread renders the latest snapshot at a capped frame rate and shows it.
+Switched off, publishing returns immediately and nothing is copied or drawn.
+"""
+
+import os
+import time
+import threading
+from typing import Callable, Dict, List, Optional
+
+import cv2
+import numpy as np
+
+# Enable with WEPLAY_VISUALISE=1 (or DetectionVisualiser.enable())
+VISUALISE = os.environ.get('WEPLAY_VISUALISE', '0') == '1'
+
+# Overlays are rendered at most this often, whatever the detection rate
+VISUALISER_MAX_FPS = 10
+
+WINDOW_NAME = 'Building Detection'
+
+
+def show_in_window(image: np.ndarray):
+    """Default sink: an OpenCV window, created and pumped by the rendering thread"""
+    cv2.imshow(WINDOW_NAME, image)
+    cv2.waitKey(1)
+
+
+def close_window():
+    """Close the default sink's window (on the rendering thread that created it)"""
+    cv2.destroyWindow(WINDOW_NAME)
+
+
+class DetectionVisualiser:
+    """Renders the latest published detections on its own thread, off by default
+
+    render(frame, detections, analysis) draws the overlay (it must not modify
+    frame in place); sink(image) displays it.
+    """
+
+    def __init__(self, render: Callable[[np.ndarray, List[Dict], Dict], np.ndarray],
+                 sink: Callable[[np.ndarray], None] = show_in_window, max_fps: float = VISUALISER_MAX_FPS,
+                 on_close: Optional[Callable[[], None]] = close_window):
+        self.render = render
+        self.sink = sink
+        self.on_close = on_close
+        self.frame_interval = 1.0 / max_fps
+
+        self._lock = threading.Lock()
+        self._published = threading.Event()
+        self._snapshot = None
+        self._thread: Optional[threading.Thread] = None
+        self.enabled = False
+        self.rendered = 0
+
+    def publish(self, frame: np.ndarray, detections: List[Dict], analysis: Dict):
+        """Offer this frame's results; a no-op unless enabled
+
+        Only references are kept (the newest replaces any unrendered one), so
+        the caller must not reuse frame's memory for the next capture.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._snapshot = (frame, detections, analysis)
+        self._published.set()
+
+    # === RENDER THREAD ===
+
+    def enable(self):
+        """Start rendering published frames"""
+        if self.enabled:
+            return
+        self.enabled = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def disable(self):
+        """Stop rendering and close the display
+
+        Safe to call from any thread (e.g. a key listener): the render thread
+        closes its own window on its way out, as HighGUI windows must be
+        destroyed by the thread that created them.
+        """
+        if not self.enabled:
+            return
+        self.enabled = False
+        self._published.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            self._snapshot = None
+
+    def _run(self):
+        """Render the newest snapshot, then wait out the rest of the frame interval
+
+        Closes the window it showed frames in once disabled.
+        """
+        shown = 0
+        try:
+            while self.enabled:
+                self._published.wait()
+                with self._lock:
+                    self._published.clear()
+                    snapshot, self._snapshot = self._snapshot, None
+                if snapshot is None:
+                    continue
+
+                started = time.perf_counter()
+                try:
+                    self.sink(self.render(*snapshot))
+                    self.rendered += 1
+                    shown += 1
+                except Exception as e:
+                    print(f"❌ Visualisation failed: {e}")
+                delay = self.frame_interval - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+        finally:
+            if self.on_close is not None and shown:
+                try:
+                    self.on_close()
+                except Exception as e:
+                    print(f"⚠️ Failed to close visualisation: {e}")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Spider-Man: Miles Morales - Walk Avoidance
+The auto-walk loop's decision for one frame: this frame's obstacles are tracked
+(one-frame false detections are never confirmed), their time to collision is
+estimated, the free-space policy steers around the ones that will be reached
+soon, and the decision is voted on once per frame before the loop acts on it.
+"""
+
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from action_voting import ActionVoter
+from free_space import FreeSpacePolicy
+from state_estimation import ObstacleTracker
+from time_to_collision import TimeToCollisionEstimator, collision_threats, ttc_proximity, most_urgent
+
+
+class WalkAvoidance:
+    """Per-frame avoidance decisions of the auto-walk loop"""
+
+    def __init__(self, policy: Optional[FreeSpacePolicy] = None):
+        self.policy = FreeSpacePolicy('walk') if policy is None else policy
+        self.tracker = ObstacleTracker()
+        self.collision = TimeToCollisionEstimator()
+        self.voter = ActionVoter()
+
+    def reset(self):
+        """Forget tracks, approach rates and votes (e.g. after a stall recovery changed the view)"""
+        self.tracker.reset()
+        self.collision.reset()
+        self.voter.reset()
+
+    def decide(self, obstacles: List[Dict], frame_shape, edges: Optional[np.ndarray] = None,
+               path: Optional[np.ndarray] = None) -> Dict:
+        """Unvoted decision from the free-space map of approaching obstacles, edges and path
+
+        Obstacles with a time to collision only count once they will be reached
+        within the TTC horizon, and sooner ones weigh more.
+        """
+        threats = collision_threats(obstacles)
+        decision = self.policy.decide(threats, frame_shape, edges, path)
+        decision['ttc'] = min((obstacle['ttc'] for obstacle in threats if 'ttc' in obstacle), default=math.inf)
+        if decision['ttc'] < math.inf:
+            decision['proximity'] = most_urgent(decision['proximity'], ttc_proximity(decision['ttc']))
+        return decision
+
+    def step(self, detections: List[Dict], frame_shape, timestamp: float, edges: Optional[np.ndarray] = None,
+             path: Optional[np.ndarray] = None) -> Dict:
+        """Confirmed decision for this frame's detections (one vote per frame)
+
+        'obstacles' is the number of confirmed obstacle tracks behind it.
+        """
+        obstacles = self.collision.update(self.tracker.update(detections, timestamp), frame_shape, timestamp)
+        decision = self.voter.vote(self.decide(obstacles, frame_shape, edges, path))
+        decision['obstacles'] = len(obstacles)
+        return decision
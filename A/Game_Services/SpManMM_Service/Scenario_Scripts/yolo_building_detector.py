@@ -12,7 +12,6 @@ import cv2
 import numpy as np
 import pyautogui
 import pydirectinput
-from ultralytics import YOLO
 from typing import List, Dict, Tuple, Optional
 import win32gui
 import win32con
@@ -24,14 +23,42 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from spiderman_keyboard_controls import SpiderManKeyboardControls
 
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from building_edges import edge_map, buildings_from_edges, EDGE_PYRAMID_LEVEL
+from buffer_pool import BufferPool
+from image_pyramid import pyramid_down, pyramid_scale
+from obstacle_analysis import fuse_detections
+from free_space import FreeSpacePolicy
+from skyline import estimate_skyline
+from actuator import ManoeuvreActuator, submit_swing_action, REDIRECT_AFTER_S
+from visualiser import DetectionVisualiser, VISUALISE
+from stage_graph import StageGraph
+from frame_pacer import FramePacer
+from action_voting import ActionVoter
+from game_capture import GameWindow
+
+# Print the mean vision stage timings this often (seconds)
+TIMING_REPORT_INTERVAL_S = 10.0
+
+# Auto-swing perception rate
+AUTO_SWING_RATE_HZ = 30
+
+# Add Model Management to path for the shared model registry
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(os.path.join(project_root, 'B', 'Model_Management'))
+from model_registry import get_model_registry
+
 class YOLOBuildingDetector:
     """YOLOv8n building detection system for Spider-Man automation"""
     
     def __init__(self):
         print("Initializing YOLOv8 Building Detector...")
         
-        # Initialize YOLOv8n model
-        self.model = YOLO('yolov8n.pt')
+        # Initialize YOLOv8n model through the shared registry, which applies
+        # this host's auto-tuned backend, thread count and image size
+        registry = get_model_registry()
+        registry.register('generic', 'yolov8n.pt')
+        self.model = registry.get('generic')
         
         # Building-related classes in COCO dataset
         self.building_classes = [
@@ -48,83 +75,60 @@ class YOLOBuildingDetector:
         # Detection parameters
         self.confidence_threshold = 0.5
         self.iou_threshold = 0.45
-        
-        # Game window detection
-        self.game_window = None
-        self.game_rect = None
+        # Pyramid level for the edge-detection backup (1 = half resolution)
+        self.edge_pyramid_level = EDGE_PYRAMID_LEVEL
+        # Reused edge-detection arrays (resized only when the window size changes)
+        self.edge_buffers = BufferPool()
+        # Free-space map of buildings and edge density (shared with auto-walk)
+        self.free_space_policy = FreeSpacePolicy('swing', actions=('left_swing', 'forward', 'right_swing'))
+        self.last_edge_map = None  # Edge map of the last detect_buildings_edges frame
+        # Skyline arrays (own pool: its pyramid levels would overwrite the edge ones)
+        self.skyline_buffers = BufferPool()
+        
+        # Game window detection and capture
+        self.window = GameWindow()
         
         print("✅ YOLOv8 Building Detector initialized!")
     
+    @property
+    def game_window(self):
+        """Handle of the game window (None until found)"""
+        return self.window.hwnd
+    
+    @property
+    def game_rect(self):
+        """Screen rectangle of the game window (None until found)"""
+        return self.window.rect
+    
     def find_game_window(self) -> bool:
         """Find Spider-Man: Miles Morales game window"""
-        def enum_windows_callback(hwnd, windows):
-            if win32gui.IsWindowVisible(hwnd):
-                window_title = win32gui.GetWindowText(hwnd)
-                if 'spider-man' in window_title.lower() or 'miles morales' in window_title.lower():
-                    windows.append((hwnd, window_title))
-            return True
-        
-        windows = []
-        win32gui.EnumWindows(enum_windows_callback, windows)
-        
-        if windows:
-            self.game_window = windows[0][0]
-            self.game_rect = win32gui.GetWindowRect(self.game_window)
-            print(f"✅ Found game window: {win32gui.GetWindowText(self.game_window)}")
-            return True
-        else:
-            print("❌ Spider-Man: Miles Morales not found")
-            return False
+        return self.window.find()
     
-    def capture_game_screen(self) -> Optional[np.ndarray]:
-        """Capture the game window screen"""
-        if not self.game_window or not self.game_rect:
-            return None
-        
-        try:
-            # Focus game window
-            win32gui.SetForegroundWindow(self.game_window)
-            time.sleep(0.1)
-            
-            # Capture window region
-            x, y, x2, y2 = self.game_rect
-            screenshot = pyautogui.screenshot(region=(x, y, x2-x, y2-y))
-            
-            # Convert to OpenCV format
-            frame = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
-            return frame
-            
-        except Exception as e:
-            print(f"❌ Failed to capture screen: {e}")
-            return None
+    def capture_game_screen(self, region: Optional[Tuple[float, float, float, float]] = None) -> Optional[np.ndarray]:
+        """Capture the game window screen, or only a region of it (fractions x1, y1, x2, y2)"""
+        return self.window.capture(region)
     
     def detect_buildings_yolo(self, frame: np.ndarray) -> List[Dict]:
         """Detect buildings using YOLOv8n"""
         try:
             # Run YOLO detection
-            results = self.model(frame, conf=self.confidence_threshold, iou=self.iou_threshold)
+            results = self.model.detect(frame, conf=self.confidence_threshold, iou=self.iou_threshold)
             
             buildings = []
-            for result in results:
-                boxes = result.boxes
-                if boxes is not None:
-                    for box in boxes:
-                        # Get bounding box coordinates
-                        x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                        confidence = box.conf[0].cpu().numpy()
-                        class_id = int(box.cls[0].cpu().numpy())
-                        class_name = self.model.names[class_id]
-                        
-                        # Filter for building-related objects
-                        if self._is_building_related(class_name, confidence):
-                            buildings.append({
-                                'bbox': (int(x1), int(y1), int(x2), int(y2)),
-                                'confidence': float(confidence),
-                                'class': class_name,
-                                'class_id': class_id,
-                                'center': ((int(x1) + int(x2)) // 2, (int(y1) + int(y2)) // 2),
-                                'size': (int(x2 - x1), int(y2 - y1))
-                            })
+            for x1, y1, x2, y2, confidence, class_id in results:
+                class_id = int(class_id)
+                class_name = self.model.names[class_id]
+                
+                # Filter for building-related objects
+                if self._is_building_related(class_name, confidence):
+                    buildings.append({
+                        'bbox': (int(x1), int(y1), int(x2), int(y2)),
+                        'confidence': float(confidence),
+                        'class': class_name,
+                        'class_id': class_id,
+                        'center': ((int(x1) + int(x2)) // 2, (int(y1) + int(y2)) // 2),
+                        'size': (int(x2 - x1), int(y2 - y1))
+                    })
             
             return buildings
             
@@ -136,29 +140,23 @@ class YOLOBuildingDetector:
         """Detect people specifically for super_jump trigger"""
         try:
             # Run YOLO detection
-            results = self.model(frame, conf=self.confidence_threshold, iou=self.iou_threshold)
+            results = self.model.detect(frame, conf=self.confidence_threshold, iou=self.iou_threshold)
             
             people = []
-            for result in results:
-                boxes = result.boxes
-                if boxes is not None:
-                    for box in boxes:
-                        # Get bounding box coordinates
-                        x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                        confidence = box.conf[0].cpu().numpy()
-                        class_id = int(box.cls[0].cpu().numpy())
-                        class_name = self.model.names[class_id]
-                        
-                        # Check specifically for people
-                        if class_name == 'person' and confidence > 0.6:  # Higher confidence for people
-                            people.append({
-                                'bbox': (int(x1), int(y1), int(x2), int(y2)),
-                                'confidence': float(confidence),
-                                'class': class_name,
-                                'class_id': class_id,
-                                'center': ((int(x1) + int(x2)) // 2, (int(y1) + int(y2)) // 2),
-                                'size': (int(x2 - x1), int(y2 - y1))
-                            })
+            for x1, y1, x2, y2, confidence, class_id in results:
+                class_id = int(class_id)
+                class_name = self.model.names[class_id]
+                
+                # Check specifically for people
+                if class_name == 'person' and confidence > 0.6:  # Higher confidence for people
+                    people.append({
+                        'bbox': (int(x1), int(y1), int(x2), int(y2)),
+                        'confidence': float(confidence),
+                        'class': class_name,
+                        'class_id': class_id,
+                        'center': ((int(x1) + int(x2)) // 2, (int(y1) + int(y2)) // 2),
+                        'size': (int(x2 - x1), int(y2 - y1))
+                    })
             
             return people
             
@@ -201,42 +199,25 @@ class YOLOBuildingDetector:
     def detect_buildings_edges(self, frame: np.ndarray) -> List[Dict]:
         """Detect buildings using edge detection (backup method)"""
         try:
-            # Convert to grayscale
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            
-            # Apply Gaussian blur
-            blurred = cv2.GaussianBlur(gray, (5, 5), 0)
-            
-            # Edge detection
-            edges = cv2.Canny(blurred, 50, 150)
-            
-            # Find contours
-            contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            
-            buildings = []
-            for contour in contours:
-                # Filter contours by area and aspect ratio
-                area = cv2.contourArea(contour)
-                if area > 5000:  # Minimum building size
-                    x, y, w, h = cv2.boundingRect(contour)
-                    
-                    # Check if it looks like a building (taller than wide)
-                    if h > w and h > 100:  # Building-like proportions
-                        buildings.append({
-                            'bbox': (x, y, x + w, y + h),
-                            'confidence': 0.7,  # Fixed confidence for edge detection
-                            'class': 'building_edge',
-                            'class_id': -1,
-                            'center': (x + w // 2, y + h // 2),
-                            'size': (w, h)
-                        })
-            
-            return buildings
+            # Runs on a downscaled pyramid level, boxes come back in frame pixels
+            scale = pyramid_scale(self.edge_pyramid_level)
+            small = pyramid_down(frame, self.edge_pyramid_level, self.edge_buffers)
+            self.last_edge_map = edge_map(small, scale, self.edge_buffers)
+            return buildings_from_edges(self.last_edge_map, scale)
             
         except Exception as e:
             print(f"❌ Edge detection failed: {e}")
             return []
     
+    def detect_skyline(self, frame: np.ndarray) -> Optional[Dict]:
+        """Skyline and swing-anchor availability per sector (a fraction of a YOLO pass)"""
+        try:
+            return estimate_skyline(frame, buffers=self.skyline_buffers)
+            
+        except Exception as e:
+            print(f"❌ Skyline estimation failed: {e}")
+            return None
+    
     def _is_building_related(self, class_name: str, confidence: float) -> bool:
         """Check if detected object is building-related"""
         # Since COCO doesn't have explicit building class, we use context clues
@@ -249,121 +230,9 @@ class YOLOBuildingDetector:
         
         return class_name in building_context and confidence > self.confidence_threshold
     
-    def analyze_building_positions(self, buildings: List[Dict], frame_shape: Tuple[int, int]) -> Dict:
-        """Analyze building positions relative to player with proximity filtering"""
-        if not buildings:
-            return {'action': 'forward', 'reason': 'no_buildings'}
-        
-        height, width = frame_shape[:2]
-        center_x = width // 2
-        
-        # Spider-Man is always centered on screen by the camera
-        spiderman_x = center_x
-        spiderman_y = height // 2  # Spider-Man is at the vertical center
-        
-        # Proximity thresholds based on actual distance
-        danger_distance = 150  # Very close - immediate danger
-        close_distance = 250   # Close - need to avoid
-        medium_distance = 400  # Medium - light steering
-        
-        # Filter buildings by actual distance from Spider-Man
-        close_buildings = []
-        medium_buildings = []
-        far_buildings = []
-        debug_distances = []
-        
-        for building in buildings:
-            x, y, x2, y2 = building['bbox']
-            building_center_x = (x + x2) // 2
-            building_center_y = (y + y2) // 2
-            
-            # Calculate actual distance from Spider-Man
-            distance = ((building_center_x - spiderman_x) ** 2 + (building_center_y - spiderman_y) ** 2) ** 0.5
-            debug_distances.append(int(distance))
-            
-            if distance <= danger_distance:
-                close_buildings.append(building)
-            elif distance <= close_distance:
-                close_buildings.append(building)
-            elif distance <= medium_distance:
-                medium_buildings.append(building)
-            else:
-                far_buildings.append(building)
-        
-        # Only act on close and medium buildings
-        relevant_buildings = close_buildings + medium_buildings
-        
-        if not relevant_buildings:
-            return {'action': 'forward', 'reason': 'no_close_buildings', 'buildings': len(far_buildings), 'debug_distances': debug_distances}
-        
-        # Categorize relevant buildings by horizontal position
-        left_buildings = []
-        right_buildings = []
-        center_buildings = []
-        
-        for building in relevant_buildings:
-            x, y, x2, y2 = building['bbox']
-            center_building_x = (x + x2) // 2
-            
-            if center_building_x < center_x - 80:  # Left side (reduced from 100)
-                left_buildings.append(building)
-            elif center_building_x > center_x + 80:  # Right side (reduced from 100)
-                right_buildings.append(building)
-            else:
-                center_buildings.append(building)
-        
-        # Enhanced decision logic with proximity weighting and turn balancing
-        close_center = len([b for b in center_buildings if b in close_buildings])
-        close_left = len([b for b in left_buildings if b in close_buildings])
-        close_right = len([b for b in right_buildings if b in close_buildings])
-        
-        # Immediate danger - buildings very close in center (randomize direction)
-        if close_center > 0:
-            # Balance turns - if last turn was left, try right, and vice versa
-            last_turn = getattr(self, 'controller', None) and self.controller.last_turn
-            if last_turn == 'left_swing':
-                action = 'right_swing'
-                reason = 'immediate_center_danger_right'
-            elif last_turn == 'right_swing':
-                action = 'left_swing'
-                reason = 'immediate_center_danger_left'
-            else:
-                # First time or no previous turn - go forward initially
-                action = 'forward'
-                reason = 'initial_center_danger_forward'
-            return {'action': action, 'reason': reason, 'buildings': close_center, 'proximity': 'danger', 'debug_distances': debug_distances}
-        
-        # Center blocked by medium distance buildings (randomize direction)
-        elif len(center_buildings) > 1:
-            # Balance turns - if last turn was left, try right, and vice versa
-            last_turn = getattr(self, 'controller', None) and self.controller.last_turn
-            if last_turn == 'left_swing':
-                action = 'right_swing'
-                reason = 'center_blocked_right'
-            elif last_turn == 'right_swing':
-                action = 'left_swing'
-                reason = 'center_blocked_left'
-            else:
-                # First time or no previous turn - go forward initially
-                action = 'forward'
-                reason = 'initial_center_blocked_forward'
-            return {'action': action, 'reason': reason, 'buildings': len(center_buildings), 'proximity': 'medium', 'debug_distances': debug_distances}
-        
-        # Close buildings on one side - avoid that side
-        elif close_left > close_right and close_left > 0:
-            return {'action': 'right_swing', 'reason': 'avoid_close_left', 'buildings': close_left, 'proximity': 'close', 'debug_distances': debug_distances}
-        elif close_right > close_left and close_right > 0:
-            return {'action': 'left_swing', 'reason': 'avoid_close_right', 'buildings': close_right, 'proximity': 'close', 'debug_distances': debug_distances}
-        
-        # Medium distance buildings - lighter steering
-        elif len(left_buildings) > len(right_buildings) + 1:
-            return {'action': 'right_swing', 'reason': 'steer_away_left', 'buildings': len(left_buildings), 'proximity': 'medium', 'debug_distances': debug_distances}
-        elif len(right_buildings) > len(left_buildings) + 1:
-            return {'action': 'left_swing', 'reason': 'steer_away_right', 'buildings': len(right_buildings), 'proximity': 'medium', 'debug_distances': debug_distances}
-        
-        # Clear path or balanced obstacles
-        else:
-            return {'action': 'forward', 'reason': 'clear_path', 'buildings': len(relevant_buildings), 'proximity': 'safe', 'debug_distances': debug_distances}
+    def analyze_free_space(self, buildings: List[Dict], frame_shape: Tuple[int, int]) -> Dict:
+        """Swing action toward the best free heading of buildings and the last edge map"""
+        return self.free_space_policy.decide(buildings, frame_shape, edges=self.last_edge_map)
     
     def visualize_detections(self, frame: np.ndarray, buildings: List[Dict], analysis: Dict) -> np.ndarray:
         """Visualize building detections and analysis"""
@@ -405,6 +274,14 @@ class AutoSwingController(SpiderManKeyboardControls):
         self.swing_thread = None
         self.keyboard_listener = None
         self.last_turn = None  # Track last turn direction for balancing
+        # Manoeuvres play on their own thread so perception never stops
+        self.actuator = ManoeuvreActuator(
+            key_down=lambda key: pydirectinput.keyDown(key, _pause=False),
+            key_up=lambda key: pydirectinput.keyUp(key, _pause=False),
+        )
+        
+        # Debug overlays: off unless WEPLAY_VISUALISE=1 or show_detections() is called
+        self.visualiser = DetectionVisualiser(self.detector.visualize_detections)
         
         # Pass the controller reference to the detector for turn tracking
         self.detector.controller = self
@@ -420,6 +297,9 @@ class AutoSwingController(SpiderManKeyboardControls):
         # Start keyboard listener for End key
         self._start_keyboard_listener()
         
+        self.actuator.start()
+        if VISUALISE:
+            self.visualiser.enable()
         self.swing_thread = threading.Thread(target=self._auto_swing_loop)
         self.swing_thread.start()
         print("🚀 Auto-swing system started!")
@@ -435,68 +315,114 @@ class AutoSwingController(SpiderManKeyboardControls):
         
         if self.swing_thread:
             self.swing_thread.join()
+        # Abort any manoeuvre in progress and release its keys
+        self.actuator.stop()
+        self.visualiser.disable()
         print("🛑 Auto-swing system stopped!")
     
+    def show_detections(self, enabled: bool = True):
+        """Switch the detection overlay window on or off while auto-swing runs"""
+        if enabled:
+            self.visualiser.enable()
+        else:
+            self.visualiser.disable()
+    
+    def _build_vision_graph(self) -> StageGraph:
+        """Per-frame detection stages: the edge pass overlaps the YOLO passes"""
+        detector = self.detector
+        return (StageGraph()
+                .add('yolo', detector.detect_buildings_yolo, 'frame')
+                .add('edges', detector.detect_buildings_edges, 'frame')
+                # Not every YOLO runtime is thread-safe, so the people pass follows the buildings pass
+                .add('people', lambda frame, _: detector.detect_people(frame), 'frame', 'yolo')
+                # Fuse both sources so one structure is only counted once
+                .add('fused', lambda yolo, edges: fuse_detections({'yolo': yolo, 'edge': edges}), 'yolo', 'edges')
+                # One free-space map of buildings and edge density picks the heading
+                .add('analysis', lambda buildings, frame: detector.analyze_free_space(buildings, frame.shape),
+                     'fused', 'frame'))
+    
     def _auto_swing_loop(self):
         """Main loop for automated swinging"""
-        last_swing_time = 0
-        swing_cooldown = 1.0  # Minimum time between swings
+        swing_cooldown = 1.0  # Minimum idle time between manoeuvres
+        vision = self._build_vision_graph()
+        pacer = FramePacer(AUTO_SWING_RATE_HZ, 'Auto-swing')
+        # A manoeuvre costs 1-2s, so one frame's false detection must not start one
+        voter = ActionVoter()
+        last_report = time.perf_counter()
         
         while self.is_running:
+            # Paced against absolute deadlines, so processing time does not lower the rate
+            pacer.wait()
             try:
-                current_time = time.time()
-                
                 # Capture game screen
                 frame = self.detector.capture_game_screen()
                 if frame is None:
                     time.sleep(0.1)
                     continue
                 
-                # Check for people first - if detected, just continue swinging normally
-                people = self.detector.detect_people(frame)
-                if people and current_time - last_swing_time > swing_cooldown:
-                    print(f"👥 Person detected - continuing normal swing... ({len(people)} people)")
-                    # Continue with normal building detection instead of super_jump
-                
-                # Detect buildings using both methods
-                yolo_buildings = self.detector.detect_buildings_yolo(frame)
-                edge_buildings = self.detector.detect_buildings_edges(frame)
-                
-                # Combine detections
-                all_buildings = yolo_buildings + edge_buildings
+                # Skyline first: no anchors means run, open sky ahead means keep swinging,
+                # and either way YOLO is skipped for this frame
+                skyline = self.detector.detect_skyline(frame)
+                if skyline is not None and skyline['settled']:
+                    analysis, all_buildings = skyline, []
+                else:
+                    # YOLO and edge detection run concurrently, then fusion and analysis
+                    stages = vision.run(frame=frame)
+                    all_buildings, analysis = stages['fused'], stages['analysis']
+                    
+                    # People detected - just continue swinging normally
+                    if stages['people'] and not self.actuator.busy:
+                        print(f"👥 Person detected - continuing normal swing... ({len(stages['people'])} people)")
+                    
+                    if time.perf_counter() - last_report > TIMING_REPORT_INTERVAL_S:
+                        print(f"⏱️ Vision stages: {vision.timing_report()}")
+                        print(pacer.report())
+                        last_report = time.perf_counter()
                 
-                # Analyze building positions
-                analysis = self.detector.analyze_building_positions(all_buildings, frame.shape)
+                analysis = voter.vote(analysis)
                 
-                # Execute swing if needed and cooldown allows
-                if (analysis['action'] != 'forward' and 
-                    current_time - last_swing_time > swing_cooldown):
-                    
+                # Perception keeps running during manoeuvres: start one after the cooldown,
+                # or queue/redirect while one is running
+                if analysis['action'] == 'forward':
+                    self._submit_manoeuvre('forward')
+                elif self.actuator.busy or self.actuator.idle_for() > swing_cooldown:
                     self._execute_swing_action(analysis)
-                    last_swing_time = current_time
                 
-                # Visualize (optional - for debugging)
-                if len(all_buildings) > 0:
-                    vis_frame = self.detector.visualize_detections(frame, all_buildings, analysis)
-                    # Uncomment to show visualization window
-                    # cv2.imshow('Building Detection', vis_frame)
-                    # cv2.waitKey(1)
-                
-                # Frame rate control
-                time.sleep(1/30)  # 30 FPS processing
+                # Visualize (optional - for debugging): free unless the overlay is switched on
+                self.visualiser.publish(frame, all_buildings, analysis)
                 
             except Exception as e:
                 print(f"❌ Auto-swing loop error: {e}")
                 time.sleep(1.0)
+        
+        vision.shutdown()
+        print(pacer.report())
+        print(f"🗳️ {voter.suppressed} unconfirmed swing frames ignored")
     
     def _execute_swing_action(self, analysis: Dict):
-        """Execute the determined swing action"""
+        """Hand the determined swing action to the actuator (returns immediately)"""
         action = analysis['action']
         reason = analysis['reason']
         buildings_count = analysis.get('buildings', 0)
         proximity = analysis.get('proximity', 'unknown')
         
-        print(f"🎯 Executing {action} - {reason} ({proximity} proximity, {buildings_count} buildings)")
+        # Already doing (or about to do) this manoeuvre
+        if action in (self.actuator.current, self.actuator.pending):
+            return
+        
+        # Redirect a running manoeuvre once it has had a moment to take effect,
+        # otherwise queue this one to run next
+        preempt = self.actuator.current is not None and self.actuator.elapsed() >= REDIRECT_AFTER_S
+        if self.actuator.current is not None and not preempt:
+            self._submit_manoeuvre(action)
+            return
+        
+        verb = "Redirecting to" if preempt else "Executing"
+        print(f"🎯 {verb} {action} - {reason} ({proximity} proximity, {buildings_count} buildings)")
+        if 'heading' in analysis:
+            print(f"   🧭 Free heading {np.degrees(analysis['heading']):+.0f}° (ahead cost {analysis['ahead_cost']:.2f})")
+        if 'anchor_coverage' in analysis:
+            print(f"   🏙️ Anchor coverage: {analysis['anchor_coverage']}")
         
         # Debug: Show distance calculations for first few buildings
         if buildings_count > 0:
@@ -506,47 +432,11 @@ class AutoSwingController(SpiderManKeyboardControls):
         
         # Track last turn for balancing
         self.last_turn = action
-        
-        if action == 'left_swing':
-            self._swing_left()
-        elif action == 'right_swing':
-            self._swing_right()
-        else:
-            self.web_swing_combo()  # Default forward swing
+        self._submit_manoeuvre(action, preempt)
     
-    def _swing_left(self):
-        """Execute left swing maneuver"""
-        print("   Executing left swing...")
-        
-        # Hold left movement + swing for turn duration
-        pydirectinput.keyDown(self.KEYS['left'])
-        pydirectinput.keyDown(self.KEYS['swing'])
-        time.sleep(1.0)  # Turn for 1 second
-        pydirectinput.keyUp(self.KEYS['left'])
-        
-        # Continue forward motion after turn
-        print("   Resuming forward motion...")
-        pydirectinput.keyDown(self.KEYS['forward'])
-        time.sleep(1.0)  # Forward motion for 1 second
-        pydirectinput.keyUp(self.KEYS['forward'])
-        pydirectinput.keyUp(self.KEYS['swing'])
-    
-    def _swing_right(self):
-        """Execute right swing maneuver"""
-        print("   Executing right swing...")
-        
-        # Hold right movement + swing for turn duration
-        pydirectinput.keyDown(self.KEYS['right'])
-        pydirectinput.keyDown(self.KEYS['swing'])
-        time.sleep(1.0)  # Turn for 1 second
-        pydirectinput.keyUp(self.KEYS['right'])
-        
-        # Continue forward motion after turn
-        print("   Resuming forward motion...")
-        pydirectinput.keyDown(self.KEYS['forward'])
-        time.sleep(1.0)  # Forward motion for 1 second
-        pydirectinput.keyUp(self.KEYS['forward'])
-        pydirectinput.keyUp(self.KEYS['swing'])
+    def _submit_manoeuvre(self, action: str, preempt: bool = False):
+        """Queue the manoeuvre for an action, or start it now with preempt ('forward' only drops the queue)"""
+        submit_swing_action(self.actuator, self.KEYS, action, preempt)
     
     def _start_keyboard_listener(self):
         """Start keyboard listener for End key"""
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Benchmark for pyramid-level edge and path detection
+Times path following and edge-based building detection at each pyramid level and
+reports how often the decisions agree with full resolution.
+
+Usage:
+    python benchmark_pyramid_levels.py --frames <dir of recorded .png/.jpg frames>
+    python benchmark_pyramid_levels.py --record <dir> --count 100   (needs the game window)
+
+Without --frames, synthetic park frames are used.
+"""
+
+import sys
+import os
+import glob
+import time
+import argparse
+
+import cv2
+import numpy as np
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+from path_detection import (fit_path_centreline, path_steering_error, find_dark_span,
+                            CORRECTION_THRESHOLD_PX)
+from building_edges import detect_building_edges
+from free_space import FreeSpacePolicy
+
+LEVELS = [0, 1, 2]
+FRAME_EXTENSIONS = ('*.png', '*.jpg', '*.jpeg')
+MATCH_IOU = 0.5
+
+
+def load_frames(frames_dir: str):
+    """Recorded BGR frames from a directory, sorted by name"""
+    paths = sorted(path for pattern in FRAME_EXTENSIONS for path in glob.glob(os.path.join(frames_dir, pattern)))
+    frames = [cv2.imread(path) for path in paths]
+    return [frame for frame in frames if frame is not None]
+
+
+def record_frames(frames_dir: str, count: int, interval: float = 0.2) -> int:
+    """Capture frames from the game window into a directory, returns how many were saved"""
+    from yolo_building_detector import YOLOBuildingDetector
+
+    detector = YOLOBuildingDetector()
+    if not detector.find_game_window():
+        print("❌ Game window not found")
+        return 0
+
+    os.makedirs(frames_dir, exist_ok=True)
+    saved = 0
+    for index in range(count):
+        frame = detector.capture_game_screen()
+        if frame is not None:
+            cv2.imwrite(os.path.join(frames_dir, f"frame_{index:05d}.png"), frame)
+            saved += 1
+        time.sleep(interval)
+    print(f"✅ Recorded {saved} frames to {frames_dir}")
+    return saved
+
+
+def synthetic_frames(count: int = 60, width: int = 1920, height: int = 1080, seed: int = 0):
+    """Noisy park frames with a bending path and a few tall buildings"""
+    rng = np.random.default_rng(seed)
+    rows = np.arange(height)[:, None]
+    columns = np.arange(width)[None, :]
+    frames = []
+    for _ in range(count):
+        frame = np.full((height, width, 3), 215, dtype=np.uint8)
+        centre_at_feet = rng.uniform(800, 1120)
+        bend = rng.uniform(-0.003, 0.003)
+        half_width = rng.uniform(110, 200)
+        centres = centre_at_feet + bend * (height // 2 + 12 - rows) ** 2
+        frame[np.abs(columns - centres) < half_width] = (40, 40, 45)
+
+        for _ in range(rng.integers(0, 4)):
+            w = int(rng.uniform(80, 260))
+            h = int(rng.uniform(250, 500))
+            x = int(rng.uniform(0, width - w))
+            y = int(rng.uniform(0, height // 2 - h // 3))
+            frame[y:y + h, x:x + w] = int(rng.uniform(90, 170))
+
+        noise = rng.integers(-25, 25, frame.shape)
+        frames.append(np.clip(frame.astype(np.int16) + noise, 0, 255).astype(np.uint8))
+    return frames
+
+
+def path_decision(frame: np.ndarray, level: int) -> str:
+    """Left/right/forward the same way path following decides it"""
+    height, width = frame.shape[:2]
+    center_x = width // 2
+    feet_y = height // 2 + 12
+
+    path_model = fit_path_centreline(frame, center_x, feet_y, level=level)
+    if path_model is not None:
+        error = path_steering_error(path_model, center_x)
+    else:
+        span = find_dark_span(frame, feet_y)
+        if span is None:
+            return 'forward'
+        error = center_x - (span[0] + span[1]) / 2
+    if abs(error) > CORRECTION_THRESHOLD_PX:
+        return 'left' if error > 0 else 'right'
+    return 'forward'
+
+
+def _box_iou(a, b) -> float:
+    """IoU of two xyxy boxes"""
+    width = min(a[2], b[2]) - max(a[0], b[0])
+    height = min(a[3], b[3]) - max(a[1], b[1])
+    if width <= 0 or height <= 0:
+        return 0.0
+    intersection = width * height
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - intersection
+    return intersection / union
+
+
+def building_agreement(reference, candidate) -> float:
+    """F1 of candidate buildings against the full-resolution ones (greedy IoU matching)"""
+    if not reference and not candidate:
+        return 1.0
+    unmatched = [building['bbox'] for building in reference]
+    matches = 0
+    for building in candidate:
+        ious = [_box_iou(building['bbox'], box) for box in unmatched]
+        if ious and max(ious) >= MATCH_IOU:
+            unmatched.pop(int(np.argmax(ious)))
+            matches += 1
+    return 2 * matches / (len(reference) + len(candidate))
+
+
+def swing_action(buildings, frame_shape) -> str:
+    """Auto-swing action for one frame's buildings (fresh policy: no heading carried over)"""
+    return FreeSpacePolicy('swing', ('left_swing', 'forward', 'right_swing')).decide(buildings, frame_shape)['action']
+
+
+def _time_ms(function, frames, level) -> float:
+    """Mean milliseconds per frame"""
+    start = time.perf_counter()
+    for frame in frames:
+        function(frame, level)
+    return (time.perf_counter() - start) * 1000 / len(frames)
+
+
+def run_benchmark(frames, levels=LEVELS):
+    """Time each level and compare its decisions with level 0, returns one row per level"""
+    reference_paths = [path_decision(frame, 0) for frame in frames]
+    reference_buildings = [detect_building_edges(frame, 0) for frame in frames]
+
+    rows = []
+    for level in levels:
+        paths = [path_decision(frame, level) for frame in frames]
+        buildings = [detect_building_edges(frame, level) for frame in frames]
+        row = {
+            'level': level,
+            'path_ms': _time_ms(path_decision, frames, level),
+            'edges_ms': _time_ms(detect_building_edges, frames, level),
+            'path_agreement': float(np.mean([a == b for a, b in zip(paths, reference_paths)])),
+            'box_agreement': float(np.mean([building_agreement(reference, candidate)
+                                            for reference, candidate in zip(reference_buildings, buildings)])),
+            'building_agreement': float(np.mean([
+                swing_action(candidate, frame.shape) == swing_action(reference, frame.shape)
+                for frame, reference, candidate in zip(frames, reference_buildings, buildings)
+            ])),
+        }
+        rows.append(row)
+    return rows
+
+
+def print_report(rows, frame_count: int, source: str):
+    """Print speed-up and agreement per level"""
+    base = rows[0]
+    print(f"\n📊 Pyramid levels on {frame_count} {source} frames")
+    print(f"   {'Level':<8} {'Path ms':>9} {'Speed-up':>9} {'Agree':>7} "
+          f"{'Edges ms':>9} {'Speed-up':>9} {'Box F1':>7} {'Decision':>9}")
+    for row in rows:
+        print(f"   1/{2 ** row['level']:<6} {row['path_ms']:>9.2f} {base['path_ms'] / row['path_ms']:>8.1f}x "
+              f"{row['path_agreement']:>7.0%} {row['edges_ms']:>9.2f} {base['edges_ms'] / row['edges_ms']:>8.1f}x "
+              f"{row['box_agreement']:>7.0%} {row['building_agreement']:>9.0%}")
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark pyramid levels for edge and path detection")
+    parser.add_argument('--frames', help="Directory of recorded frames (synthetic frames if omitted)")
+    parser.add_argument('--record', help="Record frames from the game window into this directory first")
+    parser.add_argument('--count', type=int, default=100, help="Frames to record")
+    args = parser.parse_args()
+
+    if args.record:
+        record_frames(args.record, args.count)
+        args.frames = args.record
+
+    if args.frames:
+        frames, source = load_frames(args.frames), 'recorded'
+        if not frames:
+            print(f"❌ No frames found in {args.frames}")
+            return
+    else:
+        print("⚠️ No recorded frames given, using synthetic park frames")
+        frames, source = synthetic_frames(), 'synthetic'
+
+    print_report(run_benchmark(frames), len(frames), source)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test script for multi-frame action voting
+Checks that one-frame false positives are held back and real threats get through
+"""
+
+import sys
+import os
+import time
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+from action_voting import ActionVoter
+from free_space import FreeSpacePolicy
+
+
+def _decision(action, proximity='close', reason='free_space'):
+    """Policy decision as the loops see it"""
+    return {'action': action, 'reason': reason, 'proximity': proximity}
+
+
+def test_single_frame_false_positive_ignored():
+    """A bench seen in one frame never starts a manoeuvre"""
+    print("🧪 Testing one-frame false positive...")
+    voter = ActionVoter()
+    actions = [voter.vote(_decision(action))['action']
+               for action in ('forward', 'left', 'forward', 'forward', 'forward')]
+    assert actions == ['forward'] * 5 and voter.suppressed == 1
+    print("✅ Single-frame detection suppressed")
+
+
+def test_persistent_obstacle_confirmed():
+    """K of the last N frames commits the action, gaps within the window are tolerated"""
+    print("🧪 Testing confirmation...")
+    voter = ActionVoter()
+    first = voter.vote(_decision('right'))
+    assert first['action'] == 'forward' and first['candidate'] == 'right' and first['votes'] == 1
+    assert first['reason'] == 'confirming_free_space'
+    assert voter.vote(_decision('right'))['action'] == 'right'
+
+    # Medium proximity needs 3 of 5, even with a missed detection in between
+    voter = ActionVoter()
+    actions = [voter.vote(_decision(action, 'medium'))['action'] for action in ('left', 'forward', 'left', 'left')]
+    assert actions == ['forward', 'forward', 'forward', 'left']
+    print("✅ Close confirmed in 2 frames, medium in 3 of 5")
+
+
+def test_danger_bypasses_voting():
+    """An immediate danger is acted on in the first frame"""
+    print("🧪 Testing danger bypass...")
+    voter = ActionVoter()
+    assert voter.vote(_decision('left_swing', 'danger'))['action'] == 'left_swing'
+    assert voter.suppressed == 0
+    print("✅ Danger acted on at once")
+
+
+def test_free_space_decisions_carry_proximity():
+    """Free-space decisions report how close the blockage ahead is"""
+    print("🧪 Testing free-space proximity...")
+    policy = FreeSpacePolicy('swing', ('left_swing', 'forward', 'right_swing'))
+    shape = (1080, 1920, 3)
+    clear = policy.decide([], shape)
+    wall = policy.decide([{'bbox': (860, 240, 1060, 840), 'confidence': 0.9, 'class_id': 0}], shape)
+    assert clear['proximity'] == 'safe' and clear['action'] == 'forward'
+    assert wall['proximity'] == 'danger' and wall['action'] != 'forward'
+    assert ActionVoter().vote(wall)['action'] == wall['action']
+    print(f"✅ Wall ahead (cost {wall['ahead_cost']:.2f}) is a danger")
+
+
+def main():
+    """Run all action voting tests"""
+    print("🗳️ Action Voting Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_single_frame_false_positive_ignored()
+    test_persistent_obstacle_confirmed()
+    test_danger_bypasses_voting()
+    test_free_space_decisions_carry_proximity()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Test script for the manoeuvre actuator
+Records key events from a fake keyboard and checks manoeuvres never block the caller
+"""
+
+import sys
+import os
+import time
+import threading
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+from actuator import (ManoeuvreActuator, timeline, swing_turn_steps, run_steps, web_swing_combo_steps,
+                      swing_manoeuvre_steps, submit_swing_action)
+
+KEYS = {'forward': 'w', 'left': 'a', 'right': 'd', 'swing': 'shift', 'jump': 'space'}
+
+
+class FakeKeyboard:
+    """Records key events and which keys are down"""
+
+    def __init__(self):
+        self.events = []
+        self.down = set()
+        self.lock = threading.Lock()
+
+    def key_down(self, key):
+        with self.lock:
+            self.events.append(('down', key, time.perf_counter()))
+            self.down.add(key)
+
+    def key_up(self, key):
+        with self.lock:
+            self.events.append(('up', key, time.perf_counter()))
+            self.down.discard(key)
+
+
+def _actuator():
+    """Started actuator on a fake keyboard"""
+    keyboard = FakeKeyboard()
+    actuator = ManoeuvreActuator(keyboard.key_down, keyboard.key_up)
+    actuator.start()
+    return actuator, keyboard
+
+
+def _wait_until(condition, timeout=2.0):
+    """Poll until condition() is true, returns whether it became true"""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if condition():
+            return True
+        time.sleep(0.002)
+    return condition()
+
+
+def test_timeline_orders_events():
+    """Timed events become key steps with the waits between them"""
+    print("🧪 Testing timeline steps...")
+    steps = timeline([(1.0, 'up', 'a'), (0, 'down', 'a'), (0, 'down', 'b'), (2.5, 'up', 'b')])
+    assert steps == [('down', 'a'), ('down', 'b'), ('wait', 1.0), ('up', 'a'), ('wait', 1.5), ('up', 'b')]
+    combo = web_swing_combo_steps(KEYS)
+    assert sum(value for action, value in combo if action == 'wait') == 10
+    print("✅ Overlapping holds flattened into one step list")
+
+
+def test_submit_does_not_block():
+    """The caller gets control back at once while the manoeuvre plays out"""
+    print("🧪 Testing non-blocking submit...")
+    actuator, keyboard = _actuator()
+    try:
+        start = time.perf_counter()
+        actuator.submit('left_swing', swing_turn_steps(KEYS, 'left'))
+        submit_ms = (time.perf_counter() - start) * 1000
+        assert submit_ms < 5
+        assert _wait_until(lambda: actuator.current == 'left_swing')
+        assert actuator.busy and {'a', 'shift'} <= keyboard.down
+    finally:
+        actuator.stop()
+    assert not keyboard.down
+    print(f"✅ Submit returned in {submit_ms:.2f} ms, stop released every key")
+
+
+def test_preempt_redirects_within_a_frame():
+    """A pre-empting manoeuvre aborts the current one, releases its keys and starts at once"""
+    print("🧪 Testing redirect...")
+    actuator, keyboard = _actuator()
+    try:
+        actuator.submit('left_swing', swing_turn_steps(KEYS, 'left'))
+        assert _wait_until(lambda: 'a' in keyboard.down)
+        redirect_at = time.perf_counter()
+        actuator.submit('right_swing', swing_turn_steps(KEYS, 'right'), preempt=True)
+        assert _wait_until(lambda: 'd' in keyboard.down)
+
+        latency_ms = (keyboard.events[-1][2] - redirect_at) * 1000
+        left_released = [event for event in keyboard.events if event[:2] == ('up', 'a')]
+        assert latency_ms < 1000 / 30  # Within one 30 FPS frame
+        assert left_released and left_released[0][2] < keyboard.events[-1][2]
+        assert actuator.current == 'right_swing' and actuator.aborted == 1
+    finally:
+        actuator.stop()
+    print(f"✅ Redirected in {latency_ms:.1f} ms instead of after the 2 s swing")
+
+
+def test_queued_manoeuvre_runs_next():
+    """Without preempt the latest queued manoeuvre runs after the current one"""
+    print("🧪 Testing queued manoeuvres...")
+    actuator, keyboard = _actuator()
+    short = lambda key: [('down', key), ('wait', 0.05), ('up', key)]
+    try:
+        actuator.submit('first', short('a'))
+        assert _wait_until(lambda: actuator.current == 'first')
+        actuator.submit('second', short('b'))
+        actuator.submit('third', short('c'))  # Replaces 'second': the latest decision wins
+        assert actuator.pending == 'third'
+        assert _wait_until(lambda: not actuator.busy)
+    finally:
+        actuator.stop()
+    pressed = [key for action, key, _ in keyboard.events if action == 'down']
+    assert pressed == ['a', 'c'] and actuator.aborted == 0
+    print("✅ Current manoeuvre finished, latest queued one followed")
+
+
+def test_cancel_pending_keeps_current():
+    """Cancelling the queue leaves the running manoeuvre alone"""
+    print("🧪 Testing cancel pending...")
+    actuator, keyboard = _actuator()
+    try:
+        actuator.submit('first', [('down', 'a'), ('wait', 0.05), ('up', 'a')])
+        assert _wait_until(lambda: actuator.current == 'first')
+        actuator.submit('second', [('down', 'b')])
+        actuator.cancel_pending()
+        assert _wait_until(lambda: not actuator.busy)
+        assert actuator.idle_for() < 1.0
+    finally:
+        actuator.stop()
+    assert [key for action, key, _ in keyboard.events if action == 'down'] == ['a']
+    print("✅ Queue dropped, current manoeuvre completed")
+
+
+
+def test_forward_decision_submits_nothing():
+    """Auto-swing actions map to manoeuvres; 'forward' keeps the current swing and drops the queue"""
+    print("🧪 Testing swing decisions...")
+    assert swing_manoeuvre_steps(KEYS, 'left_swing') == swing_turn_steps(KEYS, 'left')
+    assert swing_manoeuvre_steps(KEYS, 'right_swing') == swing_turn_steps(KEYS, 'right')
+    assert swing_manoeuvre_steps(KEYS, 'run') == run_steps(KEYS)
+    assert swing_manoeuvre_steps(KEYS, 'forward') is None
+
+    actuator, keyboard = _actuator()
+    try:
+        submit_swing_action(actuator, KEYS, 'left_swing')
+        assert _wait_until(lambda: actuator.current == 'left_swing')
+        submit_swing_action(actuator, KEYS, 'run')
+        assert actuator.pending == 'run'
+        submit_swing_action(actuator, KEYS, 'forward')
+        assert actuator.current == 'left_swing' and actuator.pending is None
+    finally:
+        actuator.stop()
+    # Only the left swing's keys were pressed: no run and no web-swing combo (jump)
+    assert {key for action, key, _ in keyboard.events if action == 'down'} == {'a', 'shift'}
+    print("✅ Forward submitted no manoeuvre and dropped the queued run")
+
+
+def main():
+    """Run all actuator tests"""
+    print("🕹️ Manoeuvre Actuator Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_timeline_orders_events()
+    test_submit_does_not_block()
+    test_preempt_redirects_within_a_frame()
+    test_queued_manoeuvre_runs_next()
+    test_cancel_pending_keeps_current()
+    test_forward_decision_submits_nothing()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
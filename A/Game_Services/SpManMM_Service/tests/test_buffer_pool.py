@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test script for the classical-CV buffer pool
+Uses tracemalloc to check that steady-state detection reuses its arrays
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+
+import numpy as np
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+from buffer_pool import BufferPool
+from building_edges import detect_building_edges
+from path_detection import fit_path_centreline, find_dark_span, PATH_PYRAMID_LEVEL
+
+WARMUP_FRAMES = 50
+MEASURED_FRAMES = 100
+
+# Per-frame allocations left are the fit's handful of 8-element arrays; any
+# pooled image stage allocating again would exceed this by orders of magnitude
+MAX_TRANSIENT_BYTES = 64 * 1024
+
+
+def _path_frames(count=4, width=1920, height=1080):
+    """Park frames with the path at a few different positions"""
+    rows = np.arange(height)[:, None]
+    columns = np.arange(width)[None, :]
+    frames = []
+    for index in range(count):
+        frame = np.full((height, width, 3), 220, dtype=np.uint8)
+        centres = 900 + 40 * index + 0.001 * (552 - rows) ** 2
+        frame[np.abs(columns - centres) < 150] = (40, 40, 45)
+        frames.append(frame)
+    return frames
+
+
+def _path_step(frame, buffers):
+    """One path-following perception step, as the scenario loop runs it"""
+    model = fit_path_centreline(frame, 960, 552, level=PATH_PYRAMID_LEVEL, buffers=buffers)
+    find_dark_span(frame, 552, buffers=buffers)
+    return model
+
+
+def _measure(step, frames, buffers):
+    """Warm up, then return (net traced growth, peak transient bytes) over the measured frames"""
+    for index in range(WARMUP_FRAMES):
+        step(frames[index % len(frames)], buffers)
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        for index in range(MEASURED_FRAMES):
+            step(frames[index % len(frames)], buffers)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current - baseline, peak - baseline
+
+
+def test_pool_reuses_until_shape_changes():
+    """Buffers are reallocated only when the requested shape changes"""
+    print("🧪 Testing buffer reuse...")
+    pool = BufferPool()
+    first = pool.get('mask', (540, 960))
+    assert pool.get('mask', (540, 960)) is first
+    assert pool.get('mask', (720, 1280)) is not first
+    assert pool.allocations == 2
+    print("✅ Reallocated only on geometry change")
+
+
+def test_path_loop_steady_state_allocations():
+    """The path loop allocates no frame-sized arrays once the pool is warm"""
+    print("🧪 Measuring path loop allocations...")
+    frames = _path_frames()
+    buffers = BufferPool()
+    growth, transient = _measure(_path_step, frames, buffers)
+    allocations = buffers.allocations
+
+    assert _path_step(frames[0], buffers) is not None
+    assert buffers.allocations == allocations
+    assert growth <= 1024, f"traced memory grew by {growth} bytes"
+    assert transient < MAX_TRANSIENT_BYTES, f"{transient} bytes allocated within a frame"
+
+    # Without a pool the same step allocates every stage afresh
+    _, unpooled = _measure(lambda frame, _: _path_step(frame, None), frames, None)
+    print(f"✅ Path loop: {growth} B retained, {transient} B transient per frame "
+          f"(unpooled: {unpooled / 1024:.0f} KB)")
+
+
+def test_edge_detection_reuses_buffers():
+    """Edge detection image stages reuse the pool across frames"""
+    print("🧪 Measuring edge detection allocations...")
+    frames = _path_frames()
+    buffers = BufferPool()
+    growth, transient = _measure(lambda frame, pool: detect_building_edges(frame, 1, pool), frames, buffers)
+    allocations = buffers.allocations
+
+    detect_building_edges(frames[0], 1, buffers)
+    assert buffers.allocations == allocations
+    # A half-resolution gray image alone would be 960 x 540 bytes
+    assert transient < 960 * 540, f"{transient} bytes allocated within a frame"
+    print(f"✅ Edge detection: {growth} B retained, {transient} B transient per frame")
+
+
+def test_pooled_results_match():
+    """Pooled and unpooled runs give the same answers"""
+    print("🧪 Comparing pooled and unpooled results...")
+    buffers = BufferPool()
+    for frame in _path_frames():
+        pooled_model = fit_path_centreline(frame, 960, 552, level=1, buffers=buffers)
+        model = fit_path_centreline(frame, 960, 552, level=1)
+        assert np.allclose(pooled_model['coefficients'], model['coefficients'])
+        assert find_dark_span(frame, 552, buffers=buffers) == find_dark_span(frame, 552)
+        assert detect_building_edges(frame, 1, buffers) == detect_building_edges(frame, 1)
+    print("✅ Pooled results identical")
+
+
+def main():
+    """Run all buffer pool tests"""
+    print("♻️ Buffer Pool Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_pool_reuses_until_shape_changes()
+    test_path_loop_steady_state_allocations()
+    test_edge_detection_reuses_buffers()
+    test_pooled_results_match()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
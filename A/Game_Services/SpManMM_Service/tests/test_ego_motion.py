@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script for ego-motion estimation
+Warps a textured scene to simulate standing still, turning and walking forward
+"""
+
+import sys
+import os
+import time
+
+import cv2
+import numpy as np
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+from ego_motion import EgoMotionEstimator, MOVING, STALLED, ROTATING, UNKNOWN, STUCK_AFTER_S
+
+FRAME_INTERVAL = 0.05  # 20 FPS perception
+
+_rng = np.random.default_rng(0)
+SCENE = cv2.GaussianBlur(_rng.integers(0, 255, (1400, 2400, 3), dtype=np.uint8), (0, 0), 3)
+
+
+def _view(shift_x=0.0, zoom=1.0, character=None):
+    """1080p crop of the scene after a camera pan (shift_x) and forward motion (zoom)"""
+    transform = cv2.getRotationMatrix2D((1200, 700), 0, zoom)
+    transform[0, 2] += shift_x
+    frame = cv2.warpAffine(SCENE, transform, (2400, 1400))[160:1240, 240:2160].copy()
+    if character is not None:
+        # Animated character at the screen centre (its flow must be ignored)
+        frame[400:800, 860:1060] = character
+    return frame
+
+
+def _run(frames):
+    """Feed frames at the perception rate, returns every result"""
+    estimator = EgoMotionEstimator()
+    return [estimator.update(frame, index * FRAME_INTERVAL) for index, frame in enumerate(frames)]
+
+
+def test_first_frame_unknown():
+    """One frame has no flow yet"""
+    print("🧪 Testing first frame...")
+    result = EgoMotionEstimator().update(_view(), 0.0)
+    assert result['state'] == UNKNOWN and not result['stuck']
+    print("✅ Unknown until a second frame arrives")
+
+
+def test_pinned_player_is_stuck():
+    """Static scene with an animated character: stalled, then stuck after the grace period"""
+    print("🧪 Testing stall detection...")
+    rng = np.random.default_rng(1)
+    frames = [_view(character=rng.integers(0, 255, (400, 200, 3), dtype=np.uint8)) for _ in range(20)]
+    results = _run(frames)
+    assert all(result['state'] == STALLED for result in results[1:])
+    stuck_at = next(index for index, result in enumerate(results) if result['stuck'])
+    assert abs((stuck_at - 1) * FRAME_INTERVAL - STUCK_AFTER_S) <= FRAME_INTERVAL
+    print(f"✅ Stuck after {(stuck_at - 1) * FRAME_INTERVAL:.2f}s of stalled frames")
+
+
+def test_turning_is_rotating():
+    """A uniform horizontal pan is camera rotation, not forward motion"""
+    print("🧪 Testing rotation...")
+    results = _run([_view(shift_x=8 * index) for index in range(10)])
+    assert all(result['state'] == ROTATING for result in results[1:])
+    assert abs(results[-1]['translation'][0] - 8 / FRAME_INTERVAL) < 10
+    print(f"✅ Pan of {results[-1]['translation'][0]:.0f} px/s seen as rotation")
+
+
+def test_walking_forward_is_moving():
+    """Expansion around the centre (walking forward) is movement and clears the stall timer"""
+    print("🧪 Testing forward motion...")
+    frames = [_view() for _ in range(8)] + [_view(zoom=1 + 0.01 * index) for index in range(10)]
+    results = _run(frames)
+    assert results[7]['state'] == STALLED and results[7]['stalled_for'] > 0
+    assert all(result['state'] == MOVING for result in results[9:])
+    assert not results[-1]['stuck'] and results[-1]['stalled_for'] == 0.0
+    print(f"✅ Parallax {results[-1]['parallax']:.0f} px/s while walking")
+
+
+def test_estimation_cost():
+    """A few milliseconds per 1080p frame"""
+    print("🧪 Timing ego-motion...")
+    frames = [_view(zoom=1 + 0.01 * index) for index in range(20)]
+    estimator = EgoMotionEstimator()
+    start = time.perf_counter()
+    for index, frame in enumerate(frames):
+        estimator.update(frame, index * FRAME_INTERVAL)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / len(frames)
+    assert elapsed_ms < 25
+    print(f"✅ {elapsed_ms:.2f} ms per frame")
+
+
+def main():
+    """Run all ego-motion tests"""
+    print("🎥 Ego-Motion Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_first_frame_unknown()
+    test_pinned_player_is_stuck()
+    test_turning_is_rotating()
+    test_walking_forward_is_moving()
+    test_estimation_cost()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test script for the deadline-based frame pacer
+Checks the achieved rate under varying work, overrun handling and the report
+"""
+
+import sys
+import os
+import time
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+from frame_pacer import FramePacer
+
+
+def _loop(pacer, work, frames):
+    """Run a paced loop doing work(index) seconds of work, returns the wall time"""
+    start = time.perf_counter()
+    for index in range(frames):
+        pacer.wait()
+        time.sleep(work(index))
+    return time.perf_counter() - start
+
+
+def test_first_wait_returns_at_once():
+    """Nothing to wait for before the first iteration"""
+    print("🧪 Testing first wait...")
+    pacer = FramePacer(10)
+    start = time.perf_counter()
+    assert pacer.wait() == 0.0
+    assert time.perf_counter() - start < 0.01 and pacer.frames == 1
+    print("✅ First iteration starts immediately")
+
+
+def test_rate_independent_of_work():
+    """Varying work below the period does not lower the rate (a fixed sleep would)"""
+    print("🧪 Testing achieved rate...")
+    pacer = FramePacer(50, 'test')
+    elapsed = _loop(pacer, lambda index: 0.004 + 0.005 * (index % 3), 51)
+    stats = pacer.stats()
+    # 50 periods of 20 ms: a fixed 20 ms sleep after the work would take about 1.4s
+    assert abs(elapsed - 1.0) < 0.1, elapsed
+    assert abs(stats['achieved_hz'] - 50) < 3 and stats['overruns'] == 0
+    print(f"✅ {stats['achieved_hz']:.1f} Hz over {elapsed:.2f}s, jitter {stats['jitter_ms']:.2f} ms")
+
+
+def test_overruns_are_not_made_up():
+    """A slow iteration is counted and the loop does not sprint afterwards to catch up"""
+    print("🧪 Testing overruns...")
+    pacer = FramePacer(50)
+    periods = []
+    last = None
+    for index in range(12):
+        pacer.wait()
+        now = time.perf_counter()
+        if last is not None:
+            periods.append(now - last)
+        last = now
+        time.sleep(0.1 if index == 5 else 0.002)
+    assert pacer.overruns == 1
+    # Iterations after the overrun are paced normally, not back to back
+    assert all(period > 0.015 for period in periods[6:]), periods
+    print(f"✅ {pacer.overruns} overrun, next periods {min(periods[6:]) * 1000:.1f} ms or more")
+
+
+def test_report_and_reset():
+    """Stats line names the loop, reset starts pacing afresh"""
+    print("🧪 Testing report...")
+    pacer = FramePacer(100, 'Auto-walk')
+    _loop(pacer, lambda index: 0.001, 10)
+    report = pacer.report()
+    assert report.startswith("⏱️ Auto-walk:") and "/100 Hz" in report and "in 10 frames" in report
+    pacer.reset()
+    assert pacer.stats() == {'target_hz': 100, 'achieved_hz': 0.0, 'jitter_ms': 0.0, 'overruns': 0, 'frames': 0}
+    print(f"✅ {report}")
+
+
+def main():
+    """Run all frame pacer tests"""
+    print("⏱️ Frame Pacer Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_first_wait_returns_at_once()
+    test_rate_independent_of_work()
+    test_overruns_are_not_made_up()
+    test_report_and_reset()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test script for the free-space map
+Checks the best free heading against hand-built detections, edge and path layers
+"""
+
+import sys
+import os
+import time
+import math
+
+import numpy as np
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+from free_space import FreeSpaceMap, FreeSpacePolicy, frame_layers, MIN_TURN_HEADING
+from buffer_pool import BufferPool
+
+FRAME_SHAPE = (1080, 1920, 3)
+
+
+def _box(x1, y1, x2, y2, confidence=0.9):
+    """Detection dict with just the fields the map reads"""
+    return {'bbox': (x1, y1, x2, y2), 'confidence': confidence, 'class_id': 0}
+
+
+def test_clear_scene_goes_straight():
+    """No detections or layers: forward, heading zero"""
+    print("🧪 Testing empty scene...")
+    decision = FreeSpacePolicy().decide([], FRAME_SHAPE)
+    assert decision['action'] == 'forward' and decision['reason'] == 'clear_ahead'
+    assert decision['heading'] == 0.0 and decision['clearance'] == 1.0
+    print("✅ Straight ahead when nothing is in the way")
+
+
+def test_steers_around_obstacle_ahead():
+    """An obstacle just left of centre sends the heading right, and the other way round"""
+    print("🧪 Testing obstacle avoidance heading...")
+    right = FreeSpacePolicy().decide([_box(800, 350, 1000, 750)], FRAME_SHAPE)
+    left = FreeSpacePolicy().decide([_box(920, 350, 1120, 750)], FRAME_SHAPE)
+    assert right['action'] == 'right' and right['heading'] > MIN_TURN_HEADING
+    assert left['action'] == 'left' and left['heading'] < -MIN_TURN_HEADING
+    # The target column is clear of the box
+    assert right['target_x'] > 1000 and left['target_x'] < 920
+    print(f"✅ Headings {math.degrees(right['heading']):+.1f}° and {math.degrees(left['heading']):+.1f}°")
+
+
+def test_heading_is_continuous():
+    """Moving the obstacle a few pixels moves the heading smoothly, not cell by cell"""
+    print("🧪 Testing continuous heading...")
+    headings = []
+    for shift in range(0, 60, 10):
+        free_space = FreeSpaceMap()
+        headings.append(free_space.update(FRAME_SHAPE, [_box(780 + shift, 350, 1000 + shift, 750)])['heading'])
+    steps = np.diff(headings)
+    assert np.all(steps >= 0) and len(set(np.round(headings, 6))) == len(headings)
+    print(f"✅ Heading moves {math.degrees(headings[-1] - headings[0]):.1f}° in {len(headings)} distinct steps")
+
+
+def test_edge_density_blocks_headings():
+    """Dense edges (e.g. a wall) on the right and ahead push the heading left"""
+    print("🧪 Testing edge density layer...")
+    edges = np.zeros((270, 480), dtype=np.uint8)
+    edges[:, 220::2] = 255  # Half the pixels are edges from just left of centre to the right
+    decision = FreeSpacePolicy('swing', ('left_swing', 'forward', 'right_swing')).decide([], FRAME_SHAPE, edges)
+    assert decision['action'] == 'left_swing' and decision['target_x'] < 880
+    print(f"✅ Edges push the heading to {math.degrees(decision['heading']):+.1f}°")
+
+
+def test_path_mask_attracts_walking_only():
+    """Off-path cells cost when walking, not when swinging"""
+    print("🧪 Testing path mask layer...")
+    path = np.zeros((270, 480), dtype=np.uint8)
+    path[:, 60:180] = 255  # Path well left of Spider-Man
+    walk = FreeSpaceMap('walk').update(FRAME_SHAPE, [], path=path)
+    swing = FreeSpaceMap('swing').update(FRAME_SHAPE, [], path=path)
+    assert walk['heading'] < -MIN_TURN_HEADING and 240 <= walk['target_x'] <= 720
+    assert swing['heading'] == 0.0
+    print(f"✅ Walking heads {math.degrees(walk['heading']):+.1f}° toward the path, swinging ignores it")
+
+
+def test_hysteresis_keeps_chosen_side():
+    """With two equal gaps, the map keeps the side it already chose"""
+    print("🧪 Testing heading hysteresis...")
+    symmetric = [_box(760, 300, 1160, 800)]
+    free_space = FreeSpaceMap()
+    free_space.heading = math.radians(20)
+    assert free_space.update(FRAME_SHAPE, symmetric)['heading'] > 0
+    free_space.heading = math.radians(-20)
+    assert free_space.update(FRAME_SHAPE, symmetric)['heading'] < 0
+    print("✅ No flip-flopping between equal gaps")
+
+
+def test_map_speed():
+    """Layers and map update for a 1080p frame with many detections stay cheap"""
+    print("🧪 Timing free-space map...")
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 255, FRAME_SHAPE, dtype=np.uint8)
+    corners = rng.uniform((0, 0), (1800, 1000), (300, 2))
+    detections = [_box(x, y, x + 100, y + 80, 0.6) for x, y in corners]
+    buffers = BufferPool()
+    policy = FreeSpacePolicy()
+    runs = 20
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        edges, path = frame_layers(frame, buffers=buffers)
+    layers_ms = (time.perf_counter() - start) * 1000 / runs
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        policy.decide(detections, FRAME_SHAPE, edges, path)
+    map_ms = (time.perf_counter() - start) * 1000 / runs
+
+    assert edges.shape == path.shape == (270, 480)
+    assert map_ms < 20
+    print(f"✅ Layers {layers_ms:.2f} ms, map with 300 detections {map_ms:.2f} ms")
+
+
+def main():
+    """Run all free-space map tests"""
+    print("🗺️ Free-Space Map Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_clear_scene_goes_straight()
+    test_steers_around_obstacle_ahead()
+    test_heading_is_continuous()
+    test_edge_density_blocks_headings()
+    test_path_mask_attracts_walking_only()
+    test_hysteresis_keeps_chosen_side()
+    test_map_speed()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
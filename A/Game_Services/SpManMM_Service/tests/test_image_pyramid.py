@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test script for pyramid-level edge and path detection
+Checks that downscaled results come back in full-frame coordinates
+"""
+
+import sys
+import os
+import time
+
+import numpy as np
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+from image_pyramid import pyramid_down, to_full_resolution
+from building_edges import detect_building_edges
+from path_detection import fit_path_centreline, path_edge_band, find_path_edges
+
+
+def _curved_path_frame(center_at_feet, bend, feet_y=552, width=1920, height=1080, half_width=150):
+    """Frame with a dark path whose centre is center_at_feet + bend * d^2, d = rows ahead of the feet"""
+    rows = np.arange(height)[:, None]
+    columns = np.arange(width)[None, :]
+    frame = np.full((height, width, 3), 220, dtype=np.uint8)
+    frame[np.abs(columns - (center_at_feet + bend * (feet_y - rows) ** 2)) < half_width] = (40, 40, 45)
+    return frame
+
+
+def test_pyramid_down_alignment():
+    """Pyramid pixels map back to the centre of the pixels they cover"""
+    print("🧪 Testing pyramid alignment...")
+    frame = np.zeros((1081, 1921, 3), dtype=np.uint8)
+    frame[:, 1000:] = 255
+
+    half = pyramid_down(frame, 1)
+    quarter = pyramid_down(frame, 2)
+    assert half.shape == (540, 960, 3) and quarter.shape == (270, 480, 3)
+    assert half[0, 499, 0] == 0 and half[0, 500, 0] == 255
+    assert to_full_resolution(500, 1) == 1000.5 and to_full_resolution(250, 2) == 1001.5
+    print("✅ Odd edges cropped, coordinates aligned")
+
+
+def test_path_levels_agree():
+    """Centreline offset and curvature match full resolution at 1/2 and 1/4"""
+    print("🧪 Testing centreline across pyramid levels...")
+    for center_at_feet, bend in [(1000, 0.0), (960, 0.002), (880, -0.0015)]:
+        frame = _curved_path_frame(center_at_feet, bend)
+        full = fit_path_centreline(frame, 960, 552)
+        for level in (1, 2):
+            model = fit_path_centreline(frame, 960, 552, level=level)
+            assert model is not None
+            assert abs(model['offset'] - full['offset']) <= 2 ** level
+            assert abs(model['curvature'] - full['curvature']) < 0.0005
+    print("✅ Downscaled fits agree with full resolution")
+
+
+def test_edge_band_level():
+    """Edges found on a pyramid band are within one pyramid pixel of the full-resolution ones"""
+    print("🧪 Testing edge band at half resolution...")
+    frame = _curved_path_frame(950, 0.0)
+    full_left, full_right = find_path_edges(path_edge_band(frame, 552), 960)
+    left, right = find_path_edges(path_edge_band(frame, 552, level=1), 480)
+    assert abs(to_full_resolution(left, 1) - full_left) <= 2
+    assert abs(to_full_resolution(right, 1) - full_right) <= 2
+    print("✅ Band edges scale back to frame pixels")
+
+
+def test_building_edges_levels():
+    """Edge-detected buildings keep their full-frame boxes at every level"""
+    print("🧪 Testing building edges across pyramid levels...")
+    frame = np.full((1080, 1920, 3), 210, dtype=np.uint8)
+    frame[100:500, 300:460] = 90
+    frame[200:440, 1400:1480] = 120
+    # Too small to be a building at any level
+    frame[700:760, 900:940] = 60
+
+    for level in (0, 1, 2):
+        boxes = sorted(building['bbox'] for building in detect_building_edges(frame, level))
+        assert len(boxes) == 2
+        for box, expected in zip(boxes, [(300, 100, 460, 500), (1400, 200, 1480, 440)]):
+            assert all(abs(a - b) <= 2 ** level + 1 for a, b in zip(box, expected))
+    print("✅ Same buildings at 1/1, 1/2 and 1/4")
+
+
+def test_pyramid_speed():
+    """Report edge detection time per level"""
+    print("🧪 Timing building edges per level...")
+    frame = _curved_path_frame(960, 0.001)
+    runs = 20
+    for level in (0, 1, 2):
+        start = time.perf_counter()
+        for _ in range(runs):
+            detect_building_edges(frame, level)
+        elapsed_ms = (time.perf_counter() - start) * 1000 / runs
+        print(f"✅ Level {level}: {elapsed_ms:.2f} ms per 1920x1080 frame")
+
+
+def main():
+    """Run all pyramid tests"""
+    print("🔺 Image Pyramid Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_pyramid_down_alignment()
+    test_path_levels_agree()
+    test_edge_band_level()
+    test_building_edges_levels()
+    test_pyramid_speed()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
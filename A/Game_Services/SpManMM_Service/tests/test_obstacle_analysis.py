@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test script for obstacle analysis
+Packs detections into arrays and fuses the same structure seen by several detectors
+"""
+
+import sys
+import os
+import time
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+from obstacle_analysis import detection_array, fuse_detections
+from free_space import FreeSpacePolicy
+
+FRAME_SHAPE = (1080, 1920, 3)
+
+
+def _building(bbox, confidence, name, class_id):
+    """Building detection dict as the detectors report them"""
+    x1, y1, x2, y2 = bbox
+    return {'bbox': bbox, 'confidence': confidence, 'class': name, 'class_id': class_id,
+            'center': ((x1 + x2) // 2, (y1 + y2) // 2), 'size': (x2 - x1, y2 - y1)}
+
+
+def test_fusion_merges_duplicate_structure():
+    """The same structure from YOLO and edges becomes one detection, weighted towards YOLO"""
+    print("🧪 Testing detection fusion...")
+    yolo = [_building((900, 150, 1020, 260), 0.8, 'truck', 7)]
+    edges = [_building((890, 140, 1040, 280), 0.7, 'building_edge', -1),
+             _building((100, 100, 200, 400), 0.7, 'building_edge', -1)]
+
+    fused = fuse_detections({'yolo': yolo, 'edge': edges})
+    assert len(fused) == 2
+    merged = next(detection for detection in fused if len(detection['sources']) == 2)
+    assert merged['class'] == 'truck' and merged['sources'] == ['edge', 'yolo']
+    # Score-weighted mean: 0.8 (YOLO) against 0.7 * 0.6 (edge)
+    assert 890 < merged['bbox'][0] < 900 and 1020 < merged['bbox'][2] < 1030
+    assert merged['center'] == ((merged['bbox'][0] + merged['bbox'][2]) // 2,
+                                (merged['bbox'][1] + merged['bbox'][3]) // 2)
+    print("✅ Duplicate merged, separate structure kept")
+
+
+def test_fusion_prevents_duplicate_counts():
+    """One building seen twice no longer counts twice in the free-space policy"""
+    print("🧪 Testing fused counts...")
+    yolo = [_building((930, 200, 990, 280), 0.6, 'bus', 5)]
+    edges = [_building((925, 195, 995, 285), 0.7, 'building_edge', -1)]
+
+    duplicated = FreeSpacePolicy('swing').decide(yolo + edges, FRAME_SHAPE)
+    fused = FreeSpacePolicy('swing').decide(fuse_detections({'yolo': yolo, 'edge': edges}), FRAME_SHAPE)
+    assert duplicated['buildings'] == 2 and fused['buildings'] == 1
+    print("✅ Concatenated sources count twice, fused sources once")
+
+
+def test_detection_array():
+    """Detection dicts become one structured row each, arrays pass through"""
+    print("🧪 Testing detection array...")
+    array = detection_array([_building((10, 20, 110, 220), 0.9, 'truck', 7),
+                             _building((300, 40, 360, 90), 0.5, 'building_edge', -1)])
+    assert array['x2'].tolist() == [110, 360] and array['class_id'].tolist() == [7, -1]
+    assert detection_array(array) is array
+    assert len(detection_array([])) == 0
+    print("✅ Rows packed from dicts")
+
+
+def main():
+    """Run all obstacle analysis tests"""
+    print("🧭 Obstacle Analysis Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_fusion_merges_duplicate_structure()
+    test_fusion_prevents_duplicate_counts()
+    test_detection_array()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
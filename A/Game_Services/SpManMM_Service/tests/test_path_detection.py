@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Test script for vectorised path detection
+Compares against the original per-column scan on synthetic frames
+"""
+
+import sys
+import os
+import time
+
+import cv2
+import numpy as np
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+import path_detection
+from path_detection import path_edge_band, find_path_edges, find_dark_span, fit_path_centreline, path_mask
+
+
+def _park_frame(width=1920, height=1080, path_left=800, path_right=1100):
+    """Snowy frame with a dark path between two columns"""
+    frame = np.full((height, width, 3), 220, dtype=np.uint8)
+    frame[:, path_left:path_right] = (40, 40, 45)
+    return frame
+
+
+def _reference_edges(frame, y_position):
+    """Original full-frame segmentation and per-column scan"""
+    height, width = frame.shape[:2]
+    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+    path_mask = cv2.inRange(hsv, np.array([0, 0, 20]), np.array([180, 255, 80]))
+    kernel = np.ones((3, 3), np.uint8)
+    path_mask = cv2.morphologyEx(path_mask, cv2.MORPH_CLOSE, kernel)
+    path_mask = cv2.morphologyEx(path_mask, cv2.MORPH_OPEN, kernel)
+    edges = cv2.Canny(path_mask, 50, 150)
+    edge_slice = edges[max(0, y_position - 50):min(height, y_position + 50), :]
+
+    left = next((x for x in range(width // 2, 0, -1) if np.any(edge_slice[:, x])), None)
+    right = next((x for x in range(width // 2, width) if np.any(edge_slice[:, x])), None)
+    return left, right
+
+
+def test_matches_per_column_scan():
+    """Vectorised search finds the same edges as the original loop"""
+    print("🧪 Testing edge search against original scan...")
+    rng = np.random.default_rng(0)
+    for path_left, path_right in [(800, 1100), (200, 1700), (1000, 1400), (100, 900)]:
+        frame = _park_frame(path_left=path_left, path_right=path_right)
+        # Noise so the band crop has to reproduce real filter behaviour
+        frame = np.clip(frame.astype(np.int16) + rng.integers(-30, 30, frame.shape), 0, 255).astype(np.uint8)
+        y_position = 552
+
+        band = path_edge_band(frame, y_position)
+        assert find_path_edges(band, 960) == _reference_edges(frame, y_position)
+    print("✅ Same edges as per-column scan")
+
+
+def test_no_edges_returns_none():
+    """Uniform frames have no path edges"""
+    print("🧪 Testing empty frame...")
+    frame = np.full((1080, 1920, 3), 220, dtype=np.uint8)
+    assert find_path_edges(path_edge_band(frame, 552), 960) == (None, None)
+    print("✅ No edges found on uniform frame")
+
+
+def test_dark_span_fallback():
+    """Fallback returns the outermost dark pixels on the scanline"""
+    print("🧪 Testing fallback scanline...")
+    assert find_dark_span(_park_frame(), 552) == (800, 1099)
+    # Narrower than the minimum path width
+    assert find_dark_span(_park_frame(path_left=900, path_right=940), 552) is None
+    print("✅ Fallback span matches path columns")
+
+
+def _curved_path_frame(center_at_feet, bend, feet_y=552, width=1920, height=1080, half_width=150):
+    """Frame with a dark path whose centre is center_at_feet + bend * d^2, d = rows ahead of the feet"""
+    frame = np.full((height, width, 3), 220, dtype=np.uint8)
+    for y in range(height):
+        distance = feet_y - y
+        centre = int(round(center_at_feet + bend * distance ** 2))
+        frame[y, max(0, centre - half_width):max(0, centre + half_width)] = (40, 40, 45)
+    return frame
+
+
+def test_centreline_straight_offset():
+    """A straight path right of centre gives a negative offset and no heading"""
+    print("🧪 Testing centreline offset...")
+    model = fit_path_centreline(_curved_path_frame(1000, 0.0), 960, 552)
+
+    assert model is not None
+    assert abs(model['offset'] - (-40)) < 2
+    assert abs(model['heading']) < 0.02 and abs(model['curvature']) < 1e-4
+    print("✅ Straight path offset measured")
+
+
+def test_centreline_anticipates_curve():
+    """A path bending right ahead has positive curvature while centred at the feet"""
+    print("🧪 Testing centreline curvature...")
+    model = fit_path_centreline(_curved_path_frame(960, 0.002), 960, 552)
+
+    assert model is not None
+    assert abs(model['offset']) < 3
+    assert abs(model['curvature'] - 0.004) < 0.001
+    print("✅ Curve ahead detected before it reaches the feet")
+
+
+def test_centreline_rejects_outlier_row():
+    """A dark blob on one sampled row does not drag the fit"""
+    print("🧪 Testing robust fit...")
+    frame = _curved_path_frame(960, 0.0)
+    # Widen the path on one look-ahead row band to fake a side track
+    frame[465:490, 1110:1500] = (40, 40, 45)
+    model = fit_path_centreline(frame, 960, 552)
+
+    assert model is not None
+    assert abs(model['offset']) < 3 and abs(model['heading']) < 0.02
+    assert model['inliers'] < 8
+    print("✅ Outlier row down-weighted")
+
+
+def _hsv_mask(image, lower, upper):
+    """Reference mask from a full HSV conversion"""
+    return cv2.inRange(cv2.cvtColor(image, cv2.COLOR_BGR2HSV), np.array(lower), np.array(upper))
+
+
+def test_lut_mask_matches_hsv():
+    """The max(B, G, R) lookup table gives exactly the HSV inRange mask"""
+    print("🧪 Testing lookup-table segmentation...")
+    assert path_detection.PATH_MASK_LUT is not None
+    image = np.random.default_rng(1).integers(0, 256, (200, 640, 3), dtype=np.uint8)
+    assert np.array_equal(path_mask(image), _hsv_mask(image, [0, 0, 20], [180, 255, 80]))
+    print("✅ Lookup table matches HSV segmentation")
+
+
+def test_calibration_rebuilds_lut():
+    """Recalibrating rebuilds the table, and hue-constrained ranges fall back to HSV"""
+    print("🧪 Testing path recalibration...")
+    image = np.random.default_rng(2).integers(0, 256, (200, 640, 3), dtype=np.uint8)
+    try:
+        path_detection.set_path_calibration([0, 0, 40], [180, 255, 120])
+        assert path_detection.PATH_MASK_LUT is not None
+        assert np.array_equal(path_mask(image), _hsv_mask(image, [0, 0, 40], [180, 255, 120]))
+
+        path_detection.set_path_calibration([10, 50, 40], [30, 255, 200])
+        assert path_detection.PATH_MASK_LUT is None
+        assert np.array_equal(path_mask(image), _hsv_mask(image, [10, 50, 40], [30, 255, 200]))
+    finally:
+        path_detection.set_path_calibration([0, 0, 20], [180, 255, 80])
+    print("✅ Calibration changes only rebuild the table")
+
+
+def test_detection_speed():
+    """Report path detection time per frame"""
+    print("🧪 Timing path detection...")
+    frame = _park_frame()
+    runs = 200
+    start = time.perf_counter()
+    for _ in range(runs):
+        find_path_edges(path_edge_band(frame, 552), 960)
+        find_dark_span(frame, 552)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / runs
+    print(f"✅ Path detection: {elapsed_ms:.3f} ms per 1920x1080 frame")
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        fit_path_centreline(frame, 960, 552)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / runs
+    print(f"✅ Centreline fit: {elapsed_ms:.3f} ms per 1920x1080 frame")
+
+    strip = frame[400:600]
+    start = time.perf_counter()
+    for _ in range(runs):
+        path_mask(strip)
+    lut_ms = (time.perf_counter() - start) * 1000 / runs
+    start = time.perf_counter()
+    for _ in range(runs):
+        _hsv_mask(strip, [0, 0, 20], [180, 255, 80])
+    hsv_ms = (time.perf_counter() - start) * 1000 / runs
+    print(f"✅ Path mask: {lut_ms:.3f} ms lookup table vs {hsv_ms:.3f} ms HSV per 1920x200 strip")
+
+
+def main():
+    """Run all path detection tests"""
+    print("🛤️ Path Detection Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_matches_per_column_scan()
+    test_no_edges_returns_none()
+    test_dark_span_fallback()
+    test_centreline_straight_offset()
+    test_centreline_anticipates_curve()
+    test_centreline_rejects_outlier_row()
+    test_lut_mask_matches_hsv()
+    test_calibration_rebuilds_lut()
+    test_detection_speed()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
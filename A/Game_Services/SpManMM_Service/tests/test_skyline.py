@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test script for skyline estimation
+Builds synthetic city frames and checks skyline rows, anchors and the settled decision
+"""
+
+import sys
+import os
+import time
+
+import numpy as np
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+from skyline import estimate_skyline, skyline_rows, SKYLINE_PYRAMID_LEVEL
+from buffer_pool import BufferPool
+from image_pyramid import pyramid_down, pyramid_scale
+
+SKY = (235, 205, 170)       # BGR daylight blue
+BUILDING = (95, 100, 110)
+STREET = (60, 65, 70)
+
+
+def _frame(buildings=(), horizon=620, noise=8, seed=0):
+    """Sky over a street, with (x1, x2, top) building rectangles"""
+    rng = np.random.default_rng(seed)
+    frame = np.empty((1080, 1920, 3), dtype=np.uint8)
+    frame[:] = SKY
+    frame[horizon:] = STREET
+    for x1, x2, top in buildings:
+        frame[top:, x1:x2] = BUILDING
+    noisy = frame.astype(np.int16) + rng.integers(-noise, noise, frame.shape)
+    return np.clip(noisy, 0, 255).astype(np.uint8)
+
+
+def test_skyline_rows_follow_rooftops():
+    """Each column's skyline is the building top, or the horizon between buildings"""
+    print("🧪 Testing skyline rows...")
+    frame = _frame([(200, 600, 150), (1300, 1500, 300)])
+    scale = pyramid_scale(SKYLINE_PYRAMID_LEVEL)
+    skyline = skyline_rows(pyramid_down(frame, SKYLINE_PYRAMID_LEVEL), scale)
+    assert skyline.shape == (1920 // scale,)
+    assert np.all(np.abs(skyline[240 // scale:560 // scale] - 150) <= scale)
+    assert np.all(np.abs(skyline[1340 // scale:1460 // scale] - 300) <= scale)
+    assert np.all(np.abs(skyline[700 // scale:1200 // scale] - 620) <= scale)
+    print("✅ Rooftops and horizon found to within one pyramid pixel")
+
+
+def test_thin_structures_ignored():
+    """A power line across the sky does not count as a skyline"""
+    print("🧪 Testing thin-structure filtering...")
+    frame = _frame()
+    frame[200:206] = BUILDING
+    assert estimate_skyline(frame)['reason'] == 'no_swing_anchors'
+    print("✅ Six-pixel wire opened away")
+
+
+def test_open_street_runs():
+    """No tall structures anywhere: run, without detecting buildings"""
+    print("🧪 Testing open street...")
+    estimate = estimate_skyline(_frame())
+    assert estimate['settled'] and estimate['action'] == 'run'
+    assert estimate['anchors'] == []
+    print("✅ Run decided from the skyline alone")
+
+
+def test_side_anchors_with_open_centre():
+    """Buildings on the sides only: keep swinging forward, settled"""
+    print("🧪 Testing side anchors...")
+    estimate = estimate_skyline(_frame([(0, 450, 100), (1500, 1920, 200)]))
+    assert estimate['settled'] and estimate['action'] == 'forward'
+    assert estimate['anchors'] == ['left', 'right']
+    print(f"✅ Anchors {estimate['anchor_coverage']}, forward without YOLO")
+
+
+def test_structure_ahead_needs_detection():
+    """A tall building ahead is left to the detectors"""
+    print("🧪 Testing structure ahead...")
+    estimate = estimate_skyline(_frame([(850, 1100, 120)]))
+    assert not estimate['settled'] and estimate['action'] is None
+    assert 'center' in estimate['anchors']
+    print("✅ Unsettled: buildings ahead need detecting")
+
+
+def test_skyline_speed():
+    """Skyline estimation costs a couple of milliseconds at 1080p"""
+    print("🧪 Timing skyline estimation...")
+    frame = _frame([(200, 600, 150), (850, 1100, 120)])
+    buffers = BufferPool()
+    estimate_skyline(frame, buffers=buffers)
+    allocations = buffers.allocations
+    runs = 50
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        estimate_skyline(frame, buffers=buffers)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / runs
+
+    assert buffers.allocations == allocations
+    assert elapsed_ms < 20
+    print(f"✅ {elapsed_ms:.2f} ms per frame")
+
+
+def main():
+    """Run all skyline tests"""
+    print("🏙️ Skyline Estimation Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_skyline_rows_follow_rooftops()
+    test_thin_structures_ignored()
+    test_open_street_runs()
+    test_side_anchors_with_open_centre()
+    test_structure_ahead_needs_detection()
+    test_skyline_speed()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
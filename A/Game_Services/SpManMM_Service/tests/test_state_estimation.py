@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Test script for path and obstacle state estimation
+Feeds simulated noisy measurements through the Kalman filters and tracker
+"""
+
+import sys
+import os
+import time
+
+import numpy as np
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+from state_estimation import ConstantVelocityFilter, PathStateFilter, ObstacleTracker, PATH_MAX_COAST_S
+from path_detection import CORRECTION_THRESHOLD_PX
+
+FRAME_INTERVAL = 0.05  # 20 FPS perception
+
+
+def _obstacle(center, name='bench', size=(80, 60)):
+    """Detection dict like _detect_central_park_obstacles returns"""
+    x, y = center
+    width, height = size
+    return {
+        'bbox': (x - width // 2, y - height // 2, x + width // 2, y + height // 2),
+        'confidence': 0.8, 'class': name, 'class_id': 13,
+        'center': (x, y), 'size': size,
+    }
+
+
+def test_filter_tracks_constant_velocity():
+    """The filter follows a drifting offset and smooths measurement noise"""
+    print("🧪 Testing constant-velocity filter...")
+    rng = np.random.default_rng(0)
+    truth = 10.0 + 40.0 * np.arange(100) * FRAME_INTERVAL  # Drifting 40 px/s
+    measurements = truth + rng.normal(0, 10, truth.shape)
+
+    kalman = ConstantVelocityFilter([measurements[0]], 0.0, 400.0, 100.0)
+    estimates, velocities = [], []
+    for index, measurement in enumerate(measurements):
+        kalman.update([measurement], index * FRAME_INTERVAL)
+        estimates.append(kalman.position[0])
+        velocities.append(kalman.velocity[0])
+
+    settled = slice(20, None)
+    raw_error = np.abs(measurements[settled] - truth[settled]).mean()
+    filtered_error = np.abs(np.array(estimates)[settled] - truth[settled]).mean()
+    assert filtered_error < raw_error * 0.7
+    assert abs(np.mean(velocities[settled]) - 40.0) < 5.0
+    print(f"✅ Mean error {raw_error:.1f}px raw -> {filtered_error:.1f}px filtered")
+
+
+def test_single_outlier_rejected():
+    """One wild measurement is gated out, a persistent jump is accepted"""
+    print("🧪 Testing outlier rejection...")
+    path_filter = PathStateFilter()
+    timestamp = 0.0
+    for _ in range(20):
+        path_filter.update(0.0, 0.0, timestamp)
+        timestamp += FRAME_INTERVAL
+
+    state = path_filter.update(250.0, 0.0, timestamp)
+    assert not state['accepted'] and abs(state['error']) < 5.0
+
+    # The path really moved: after a few consistent frames the filter follows
+    for _ in range(3):
+        timestamp += FRAME_INTERVAL
+        state = path_filter.update(250.0, 0.0, timestamp)
+    assert state['accepted'] and abs(state['error'] - 250.0) < 5.0
+    print("✅ Spike ignored, real change followed")
+
+
+def test_noisy_frames_do_not_trigger_turns():
+    """Centred walking with sporadic bad frames stays under the correction threshold"""
+    print("🧪 Testing spurious manoeuvres...")
+    rng = np.random.default_rng(1)
+    measurements = rng.normal(0, 8, 200)
+    bad_frames = rng.choice(200, 12, replace=False)
+    measurements[bad_frames] = rng.choice([-1, 1], 12) * rng.uniform(60, 200, 12)
+
+    path_filter = PathStateFilter()
+    raw_turns = filtered_turns = 0
+    for index, measurement in enumerate(measurements):
+        state = path_filter.update(measurement, 0.0, index * FRAME_INTERVAL)
+        raw_turns += abs(measurement) > CORRECTION_THRESHOLD_PX
+        filtered_turns += abs(state['error']) > CORRECTION_THRESHOLD_PX
+
+    assert raw_turns >= 12 and filtered_turns == 0
+    print(f"✅ {raw_turns} raw turn triggers -> {filtered_turns} filtered")
+
+
+def test_path_filter_coasts_then_expires():
+    """Without measurements the path state is predicted, then dropped"""
+    print("🧪 Testing path coasting...")
+    path_filter = PathStateFilter()
+    for index in range(20):
+        path_filter.update(20.0 * index * FRAME_INTERVAL, 0.0, index * FRAME_INTERVAL)
+    last = 19 * FRAME_INTERVAL
+
+    coasted = path_filter.predict(last + 0.2)
+    assert coasted is not None and coasted['error'] > 19.0 * FRAME_INTERVAL * 20.0
+    assert path_filter.predict(last + PATH_MAX_COAST_S + 0.1) is None
+    print("✅ Coasts through gaps, expires when lost")
+
+
+def test_tracker_confirms_and_drops():
+    """Single-frame detections are not reported; persistent ones keep their track id"""
+    print("🧪 Testing obstacle tracker...")
+    tracker = ObstacleTracker()
+    timestamp = 0.0
+
+    assert tracker.update([_obstacle((960, 600)), _obstacle((400, 500), 'person')], timestamp) == []
+    timestamp += FRAME_INTERVAL
+    # The bench is seen again (moving), the person was a false detection
+    confirmed = tracker.update([_obstacle((970, 605))], timestamp)
+    assert len(confirmed) == 1 and confirmed[0]['class'] == 'bench'
+    track_id, last_x = confirmed[0]['track_id'], confirmed[0]['center'][0]
+
+    # Missed for a frame: the track coasts at its predicted position
+    timestamp += FRAME_INTERVAL
+    confirmed = tracker.update([], timestamp)
+    assert [obstacle['track_id'] for obstacle in confirmed] == [track_id]
+    assert confirmed[0]['center'][0] > last_x
+
+    timestamp += FRAME_INTERVAL
+    confirmed = tracker.update([_obstacle((990, 615))], timestamp)
+    assert [obstacle['track_id'] for obstacle in confirmed] == [track_id]
+
+    # Gone for longer than the maximum age
+    assert tracker.update([], timestamp + 1.0) == []
+    print("✅ False detections filtered, tracks coast and expire")
+
+
+def test_tracker_keeps_classes_apart():
+    """Nearby detections of different classes never share a track"""
+    print("🧪 Testing class-aware association...")
+    tracker = ObstacleTracker()
+    tracker.update([_obstacle((900, 600)), _obstacle((930, 600), 'person')], 0.0)
+    confirmed = tracker.update([_obstacle((905, 600)), _obstacle((925, 600), 'person')], FRAME_INTERVAL)
+    assert sorted(obstacle['class'] for obstacle in confirmed) == ['bench', 'person']
+    assert len({obstacle['track_id'] for obstacle in confirmed}) == 2
+    print("✅ One track per class")
+
+
+def main():
+    """Run all state estimation tests"""
+    print("📈 State Estimation Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_filter_tracks_constant_velocity()
+    test_single_outlier_rejected()
+    test_noisy_frames_do_not_trigger_turns()
+    test_path_filter_coasts_then_expires()
+    test_tracker_confirms_and_drops()
+    test_tracker_keeps_classes_apart()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
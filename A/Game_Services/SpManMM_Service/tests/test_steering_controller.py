@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Test script for the PID steering controller
+Drives the controller with manual ticks and a recording key output or virtual pad
+"""
+
+import sys
+import os
+import time
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+from steering_controller import SteeringController, STALE_MEASUREMENT_S
+from virtual_pad import GamepadStick, RecordingGamepad, STICK_DEADZONE
+
+
+def _make_controller(profile='path'):
+    """Controller that records key presses instead of sending them"""
+    events = []
+    controller = SteeringController(
+        key_down=lambda key: events.append(('down', key)),
+        key_up=lambda key: events.append(('up', key)),
+        profile=profile,
+    )
+    return controller, events
+
+
+def _make_stick_controller(profile='park'):
+    """Controller steering a recording virtual pad's left stick"""
+    gamepad = RecordingGamepad()
+    controller, events = _make_controller(profile)
+    controller.stick = GamepadStick(gamepad, deadzone=0.0)
+    return controller, events, gamepad
+
+
+def _held_ticks(controller, offset, heading=0.0, ticks=100):
+    """Feed a constant measurement and count ticks each key is held"""
+    held = {'a': 0, 'd': 0, None: 0}
+    now = 0.0
+    for _ in range(ticks):
+        controller.update(offset, heading, timestamp=now)
+        controller.tick(now)
+        held[controller._held_key] += 1
+        now += controller.tick_interval
+    return held
+
+
+def test_duty_cycle_follows_offset():
+    """Larger offsets hold the steering key for more of the time"""
+    print("🧪 Testing duty cycle...")
+    small, _ = _make_controller()
+    large, _ = _make_controller()
+
+    small_held = _held_ticks(small, 30)  # Too far right -> steer left
+    large_held = _held_ticks(large, 90)
+
+    assert small_held['d'] == 0 and large_held['d'] == 0
+    assert 0 < small_held['a'] < large_held['a']
+    print(f"✅ Left key held {small_held['a']}% at 30px, {large_held['a']}% at 90px")
+
+
+def test_deadband_and_heading():
+    """Centred offsets do nothing, a path bending right steers right"""
+    print("🧪 Testing deadband and heading feed-forward...")
+    controller, events = _make_controller()
+    assert _held_ticks(controller, 3)['a'] == 0 and not events
+
+    controller, _ = _make_controller()
+    held = _held_ticks(controller, 0, heading=0.3)
+    assert held['d'] > 0 and held['a'] == 0
+    print("✅ Deadband respected, heading anticipates turn")
+
+
+def test_stale_measurement_releases_keys():
+    """Keys are released when perception stops feeding the controller"""
+    print("🧪 Testing stale measurement release...")
+    controller, events = _make_controller()
+    controller.update(200, timestamp=0.0)
+    controller.tick(0.0)
+    assert controller._held_key == 'a'
+
+    controller.tick(STALE_MEASUREMENT_S + 0.1)
+    assert controller._held_key is None and events[-1] == ('up', 'a')
+    print("✅ Keys released on stale measurement")
+
+
+def test_tick_thread_does_not_block_updates():
+    """update() returns immediately while the tick thread runs"""
+    print("🧪 Testing tick thread...")
+    controller, events = _make_controller()
+    controller.start()
+    try:
+        start = time.perf_counter()
+        for _ in range(1000):
+            controller.update(120)
+        assert (time.perf_counter() - start) < 0.1
+        time.sleep(0.2)
+    finally:
+        controller.stop()
+    assert ('down', 'a') in events and controller._held_key is None
+    print("✅ Steering ran on its own thread and released keys on stop")
+
+
+def test_stick_is_proportional():
+    """The stick deflects in proportion to the offset, with one report per change and no keys"""
+    print("🧪 Testing analogue stick...")
+    deflections = []
+    for offset in (30, 60):
+        controller, events, gamepad = _make_stick_controller()
+        _held_ticks(controller, offset)
+        deflections.append(gamepad.left_stick_x()[-1][1])
+        assert len(gamepad.reports) == 1 and not events
+    assert deflections[0] < 0 and abs(deflections[1] / deflections[0] - 2) < 0.05
+    print(f"✅ Stick at {deflections[0]:+.2f} for 30px, {deflections[1]:+.2f} for 60px")
+
+
+def test_stick_needs_fewer_corrections():
+    """A steady correction is one stick report instead of a stream of key presses"""
+    print("🧪 Testing correction events...")
+    keys, key_events = _make_controller('park')
+    _held_ticks(keys, 40)
+    stick, _, gamepad = _make_stick_controller()
+    _held_ticks(stick, 40)
+    assert len(gamepad.reports) == 1 and len(key_events) > 20
+    print(f"✅ 1 stick report instead of {len(key_events)} key events")
+
+
+def test_stick_dead_zone_and_release():
+    """Small outputs clear the game's dead zone, stale measurements centre the stick"""
+    print("🧪 Testing stick dead zone...")
+    gamepad = RecordingGamepad()
+    GamepadStick(gamepad)(0.05)
+    assert abs(gamepad.left_stick_x()[-1][1] - (STICK_DEADZONE + (1 - STICK_DEADZONE) * 0.05)) < 1e-3
+
+    controller, _, gamepad = _make_stick_controller()
+    controller.update(200, timestamp=0.0)
+    controller.tick(0.0)
+    controller.tick(STALE_MEASUREMENT_S + 0.1)
+    assert [x for _, x in gamepad.left_stick_x()] == [-1.0, 0.0]
+    print("✅ Dead zone skipped, stick centred when perception stalls")
+
+
+def main():
+    """Run all steering controller tests"""
+    print("🎮 Steering Controller Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_duty_cycle_follows_offset()
+    test_deadband_and_heading()
+    test_stale_measurement_releases_keys()
+    test_tick_thread_does_not_block_updates()
+    test_stick_is_proportional()
+    test_stick_needs_fewer_corrections()
+    test_stick_dead_zone_and_release()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
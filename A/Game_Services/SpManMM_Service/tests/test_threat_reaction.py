@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test script for the threat-reaction loop
+Synthetic frames of Miles in his red suit, with and without the spider-sense
+indicator, probed directly and replayed in real time through the harness
+"""
+
+import sys
+import os
+import time
+
+import cv2
+import numpy as np
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+from threat_reaction import (ThreatProbe, ThreatReactor, replay_threats, REACTION_BUDGET_MS, DODGE_COOLDOWN_S,
+                             MAX_THREAT_S)
+
+REPLAY_FPS = 30
+
+_rng = np.random.default_rng(0)
+_street = cv2.GaussianBlur(_rng.integers(40, 140, (1080, 1920, 3), dtype=np.uint8), (0, 0), 4)
+# Miles at the screen centre: black suit with red panels (BGR)
+_street[450:850, 900:1020] = (25, 25, 25)
+_street[500:650, 920:1000] = (30, 20, 200)
+QUIET = _street
+
+THREAT = QUIET.copy()
+# Spider-sense indicator: orange-red strokes around Miles' head
+for angle in range(-60, 61, 30):
+    tip = (int(960 + 110 * np.sin(np.radians(angle))), int(470 - 110 * np.cos(np.radians(angle))))
+    cv2.line(THREAT, (960, 440), tip, (0, 90, 255), 8)
+
+# A red car parked next to Miles: indicator-coloured, but it stays in view
+PARKED = QUIET.copy()
+PARKED[700:780, 1050:1200] = (0, 0, 230)
+PARKED_THREAT = PARKED.copy()
+PARKED_THREAT[THREAT != QUIET] = THREAT[THREAT != QUIET]
+
+
+def test_indicator_is_a_threat():
+    """The indicator is a threat, the red suit on its own is not"""
+    print("🧪 Testing probe...")
+    probe = ThreatProbe()
+    quiet = [probe.probe(QUIET) for _ in range(5)]
+    assert not any(result['threat'] for result in quiet) and quiet[-1]['pixels'] > 0
+    threat = probe.probe(THREAT)
+    assert threat['threat'] and threat['pixels'] > quiet[-1]['pixels']
+    print(f"✅ {threat['pixels']} indicator pixels against a background of {threat['background']:.0f}")
+
+
+def test_one_dodge_per_threat():
+    """A lingering indicator triggers one dodge per cooldown"""
+    print("🧪 Testing dodge cooldown...")
+    dodges = []
+    reactor = ThreatReactor(lambda: dodges.append(time.perf_counter()))
+    reactor.step(QUIET, time.perf_counter())
+    for _ in range(10):
+        reactor.step(THREAT, time.perf_counter())
+    assert len(dodges) == 1 and len(reactor.latencies) == 1
+    reactor._last_reaction -= DODGE_COOLDOWN_S
+    assert reactor.step(THREAT, time.perf_counter())['reacted']
+    print(f"✅ One dodge per threat, {1000 * reactor.latencies[0]:.2f} ms to react")
+
+
+def test_lasting_red_becomes_background():
+    """Red that stays in view stops being a threat, and the indicator still shows above it"""
+    print("🧪 Testing lasting red...")
+    probe = ThreatProbe()
+    for index in range(5):
+        probe.probe(QUIET, index / 60)
+    threats = [probe.probe(PARKED, 5 / 60 + index / 60)['threat'] for index in range(120)]
+    lasted_s = threats.index(False) / 60
+    assert threats[0] and lasted_s <= MAX_THREAT_S + 2 / 60 and not any(threats[threats.index(False):])
+    assert probe.probe(PARKED_THREAT, 3.0)['threat']
+    print(f"✅ Parked car absorbed after {lasted_s:.2f}s, indicator seen over it")
+
+
+def test_replay_reacts_within_budget():
+    """End to end in real time: indicator on screen to dodge within the latency budget"""
+    print("🧪 Testing replay harness...")
+    frames = [QUIET] * 15 + [THREAT] * 8 + [QUIET] * 20 + [THREAT] * 8 + [QUIET] * 9
+    report = replay_threats(frames, REPLAY_FPS, onsets=[15, 43])
+    assert report['missed'] == [] and report['false_reactions'] == 0
+    assert report['within_budget'], report['latencies_ms']
+    print(f"✅ {report['reactions']} dodges, max {report['max_latency_ms']:.1f} ms "
+          f"(budget {REACTION_BUDGET_MS} ms)")
+
+
+def test_replay_lasting_red_stops_dodging():
+    """Replay a red car parked in view for three seconds, then a real indicator over it"""
+    print("🧪 Testing replay with lasting red...")
+    frames = [QUIET] * 15 + [PARKED] * 90 + [PARKED_THREAT] * 8 + [PARKED] * 10
+    report = replay_threats(frames, REPLAY_FPS, onsets=[15, 105])
+    # One dodge for the car, at most one more before it is absorbed, one for the indicator
+    assert report['reactions'] <= 3 and report['false_reactions'] <= 1, report
+    assert report['missed'] == [], report
+    print(f"✅ {report['reactions']} dodges over 3 s of lasting red and an indicator")
+
+
+def test_probe_is_far_cheaper_than_inference():
+    """The probe costs a millisecond or two per 1080p frame"""
+    print("🧪 Timing probe...")
+    probe = ThreatProbe()
+    probe.probe(QUIET)
+    start = time.perf_counter()
+    for _ in range(50):
+        probe.probe(QUIET)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / 50
+    assert elapsed_ms < 5
+    print(f"✅ {elapsed_ms:.2f} ms per probe")
+
+
+def main():
+    """Run all threat-reaction tests"""
+    print("🕷️ Threat Reaction Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_indicator_is_a_threat()
+    test_one_dodge_per_threat()
+    test_lasting_red_becomes_background()
+    test_replay_reacts_within_budget()
+    test_replay_lasting_red_stops_dodging()
+    test_probe_is_far_cheaper_than_inference()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for time-to-collision estimation
+Projects obstacles approached at walking speed and checks the estimated TTC
+"""
+
+import sys
+import os
+import math
+import time
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+from time_to_collision import (TimeToCollisionEstimator, collision_threats, ttc_proximity, most_urgent,
+                               HORIZON_FRACTION, TTC_HORIZON_S)
+
+FRAME_SHAPE = (1080, 1920, 3)
+FRAME_INTERVAL = 0.05  # 20 FPS perception
+FOCAL = 960            # 90 degree field of view at 1920px
+CAMERA_HEIGHT = 1.6    # Metres above the ground
+
+
+def _obstacle(distance, track_id=0, height=1.0, x=1000):
+    """Tracked obstacle of a real height (m) standing on the ground at a distance (m)"""
+    bottom = int(1080 * HORIZON_FRACTION + FOCAL * CAMERA_HEIGHT / distance)
+    top = bottom - int(FOCAL * height / distance)
+    return {'bbox': (x - 40, top, x + 40, bottom), 'confidence': 0.8, 'class': 'bench', 'track_id': track_id}
+
+
+def _approach(start, speed, frames, **obstacle):
+    """Estimates while walking toward an obstacle, returns (true TTC, estimate) per frame"""
+    estimator = TimeToCollisionEstimator()
+    results = []
+    for index in range(frames):
+        distance = start - speed * index * FRAME_INTERVAL
+        annotated = estimator.update([_obstacle(distance, **obstacle)], FRAME_SHAPE, index * FRAME_INTERVAL)
+        results.append((distance / speed, annotated[0]['ttc']))
+    return results
+
+
+def test_approaching_obstacle_ttc():
+    """Walking at 4 m/s toward a bench 12 m away: TTC tracks the truth"""
+    print("🧪 Testing approach...")
+    results = _approach(12.0, 4.0, 30)
+    true_ttc, estimate = results[-1]
+    assert abs(estimate - true_ttc) / true_ttc < 0.25, (true_ttc, estimate)
+    assert all(estimate < math.inf for _, estimate in results[1:])
+    print(f"✅ Estimated {estimate:.2f}s for a true {true_ttc:.2f}s")
+
+
+def test_static_obstacle_never_threatens():
+    """An object that does not come closer has no time to collision"""
+    print("🧪 Testing static obstacle...")
+    estimator = TimeToCollisionEstimator()
+    for index in range(20):
+        annotated = estimator.update([_obstacle(30.0)], FRAME_SHAPE, index * FRAME_INTERVAL)
+    assert annotated[0]['ttc'] == math.inf
+    assert collision_threats(annotated) == []
+    print("✅ Static far object ignored")
+
+
+def test_threats_weighted_by_urgency():
+    """Far-in-time obstacles are dropped, nearer ones weigh more, untracked ones pass"""
+    print("🧪 Testing threat weighting...")
+    obstacles = [dict(_obstacle(10.0), ttc=TTC_HORIZON_S + 1), dict(_obstacle(10.0), ttc=2.0),
+                 dict(_obstacle(10.0), ttc=0.5), {'bbox': (0, 0, 10, 10), 'confidence': 0.8}]
+    threats = collision_threats(obstacles)
+    assert len(threats) == 3
+    assert 0 < threats[0]['confidence'] < threats[1]['confidence'] == 0.8
+    assert threats[2] is obstacles[3]
+    print(f"✅ Confidence {threats[0]['confidence']:.2f} at 2.0s, 0.80 at 0.5s")
+
+
+def test_clipped_box_keeps_estimate():
+    """Once the box reaches the screen bottom the last approach rate is kept"""
+    print("🧪 Testing clipped boxes...")
+    estimator = TimeToCollisionEstimator()
+    for index in range(10):
+        annotated = estimator.update([_obstacle(8.0 - 4.0 * index * FRAME_INTERVAL)], FRAME_SHAPE,
+                                     index * FRAME_INTERVAL)
+    before = annotated[0]['ttc']
+    clipped = dict(_obstacle(2.0), bbox=(960, 500, 1040, 1079))
+    after = estimator.update([clipped], FRAME_SHAPE, 10 * FRAME_INTERVAL)[0]['ttc']
+    assert after == before < math.inf
+    print(f"✅ TTC {after:.2f}s kept for a clipped box")
+
+
+def test_proximity_classes():
+    """TTC maps onto the decision proximities, the most urgent one wins"""
+    print("🧪 Testing proximity...")
+    assert [ttc_proximity(ttc) for ttc in (0.5, 1.0, 2.5, math.inf)] == ['danger', 'close', 'medium', 'safe']
+    assert most_urgent('medium', 'danger', 'safe') == 'danger'
+    print("✅ Proximity classes ordered")
+
+
+def main():
+    """Run all time-to-collision tests"""
+    print("⏳ Time-to-Collision Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_approaching_obstacle_ttc()
+    test_static_obstacle_never_threatens()
+    test_threats_weighted_by_urgency()
+    test_clipped_box_keeps_estimate()
+    test_proximity_classes()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test script for the on-demand detection visualiser
+Checks that publishing is free while disabled and rendering stays off the caller's thread
+"""
+
+import sys
+import os
+import time
+import threading
+
+import numpy as np
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+from visualiser import DetectionVisualiser
+
+FRAME = np.zeros((1080, 1920, 3), dtype=np.uint8)
+
+
+class Recorder:
+    """Render and sink callbacks that record what they were given and on which thread"""
+
+    def __init__(self, render_s=0.0):
+        self.render_s = render_s
+        self.rendered = []
+        self.shown = []
+        self.threads = set()
+        self.closed = 0
+        self.close_threads = set()
+
+    def render(self, frame, detections, analysis):
+        self.threads.add(threading.get_ident())
+        time.sleep(self.render_s)
+        self.rendered.append(analysis['frame'])
+        return frame.copy()
+
+    def sink(self, image):
+        self.shown.append(image.shape)
+
+    def close(self):
+        self.closed += 1
+        self.close_threads.add(threading.get_ident())
+
+
+def _visualiser(recorder, max_fps=100):
+    """Visualiser wired to a recorder"""
+    return DetectionVisualiser(recorder.render, sink=recorder.sink, max_fps=max_fps, on_close=recorder.close)
+
+
+def test_disabled_publish_is_free():
+    """While disabled nothing is rendered and publishing costs next to nothing"""
+    print("🧪 Testing disabled visualiser...")
+    recorder = Recorder()
+    visualiser = _visualiser(recorder)
+    runs = 10000
+
+    start = time.perf_counter()
+    for index in range(runs):
+        visualiser.publish(FRAME, [], {'frame': index})
+    publish_us = (time.perf_counter() - start) * 1e6 / runs
+
+    assert recorder.rendered == [] and visualiser.rendered == 0
+    assert publish_us < 5
+    print(f"✅ {publish_us:.2f} µs per publish, nothing drawn")
+
+
+def test_renders_off_the_caller_thread():
+    """Enabled, the overlay is drawn on the visualiser thread while the caller carries on"""
+    print("🧪 Testing background rendering...")
+    recorder = Recorder(render_s=0.05)
+    visualiser = _visualiser(recorder)
+    visualiser.enable()
+    try:
+        start = time.perf_counter()
+        visualiser.publish(FRAME, [], {'frame': 0})
+        publish_ms = (time.perf_counter() - start) * 1000
+        deadline = time.perf_counter() + 2.0
+        while not recorder.shown and time.perf_counter() < deadline:
+            time.sleep(0.005)
+    finally:
+        visualiser.disable()
+    assert publish_ms < 5  # The 50 ms render did not run here
+    assert recorder.shown == [FRAME.shape]
+    assert threading.get_ident() not in recorder.threads
+    assert recorder.closed == 1
+    print(f"✅ Publish took {publish_ms:.2f} ms, the render ran on its own thread")
+
+
+def test_fps_cap_drops_stale_frames():
+    """Publishing faster than the cap renders only the newest frames, at most max_fps"""
+    print("🧪 Testing FPS cap...")
+    recorder = Recorder()
+    visualiser = _visualiser(recorder, max_fps=20)
+    visualiser.enable()
+    try:
+        start = time.perf_counter()
+        index = 0
+        while time.perf_counter() - start < 0.5:
+            visualiser.publish(FRAME, [], {'frame': index})
+            index += 1
+            time.sleep(0.002)  # ~500 FPS detection loop
+    finally:
+        visualiser.disable()
+    assert index > 100
+    assert 3 <= len(recorder.rendered) <= 12  # 20 FPS for 0.5 s
+    assert recorder.rendered == sorted(recorder.rendered)
+    print(f"✅ {index} frames published, {len(recorder.rendered)} rendered")
+
+
+def test_window_closed_by_render_thread():
+    """Disabled from a key-listener thread, the window is still closed by the thread that showed it"""
+    print("🧪 Testing window close thread...")
+    recorder = Recorder()
+    visualiser = _visualiser(recorder)
+    visualiser.enable()
+    visualiser.publish(FRAME, [], {'frame': 0})
+    deadline = time.perf_counter() + 2.0
+    while not recorder.shown and time.perf_counter() < deadline:
+        time.sleep(0.005)
+
+    listener = threading.Thread(target=visualiser.disable)
+    listener.start()
+    listener.join()
+    assert recorder.closed == 1
+    assert recorder.close_threads == recorder.threads
+    assert listener.ident not in recorder.close_threads
+    print("✅ Window closed on the render thread, not the listener")
+
+
+def main():
+    """Run all visualiser tests"""
+    print("🖼️ Detection Visualiser Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_disabled_publish_is_free()
+    test_renders_off_the_caller_thread()
+    test_fps_cap_drops_stale_frames()
+    test_window_closed_by_render_thread()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test script for the auto-walk avoidance decisions
+Drives the walk loop's per-frame decisions with approaching obstacles and blips
+"""
+
+import sys
+import os
+import time
+
+# Add the Scenario Scripts directory to path
+scenario_scripts_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scenario_Scripts')
+sys.path.append(scenario_scripts_path)
+
+from walk_avoidance import WalkAvoidance
+from time_to_collision import HORIZON_FRACTION
+
+FRAME_SHAPE = (1080, 1920, 3)
+FRAME_INTERVAL = 0.05  # 20 FPS perception
+FOCAL = 960            # 90 degree field of view at 1920px
+CAMERA_HEIGHT = 1.6    # Metres above the ground
+
+
+def _detection(distance, x=1000, height=1.0, width=0.8):
+    """Detection of an obstacle of a real size (m) standing on the ground at a distance (m)"""
+    bottom = min(int(1080 * HORIZON_FRACTION + FOCAL * CAMERA_HEIGHT / distance), 1079)
+    top = bottom - int(FOCAL * height / distance)
+    half = int(FOCAL * width / distance / 2)
+    bbox = (x - half, top, x + half, bottom)
+    return {'bbox': bbox, 'confidence': 0.8, 'class': 'bench', 'class_id': 13,
+            'center': ((bbox[0] + bbox[2]) // 2, (bbox[1] + bbox[3]) // 2), 'size': (bbox[2] - bbox[0], bbox[3] - bbox[1])}
+
+
+def _walk(avoidance, start, speed, frames, seen_frames=None, **obstacle):
+    """Walk loop decisions while approaching an obstacle (detected in the first seen_frames frames)"""
+    decisions = []
+    for index in range(frames):
+        distance = start - speed * index * FRAME_INTERVAL
+        detections = [_detection(distance, **obstacle)] if seen_frames is None or index < seen_frames else []
+        decisions.append(avoidance.step(detections, FRAME_SHAPE, index * FRAME_INTERVAL))
+    return decisions
+
+
+def test_persistent_obstacle_avoided():
+    """Walking at 4 m/s toward a bench 12 m away: the turn is confirmed by a second frame, then taken"""
+    print("🧪 Testing persistent obstacle...")
+    decisions = _walk(WalkAvoidance(), 12.0, 4.0, 45)
+    first_turn = next(index for index, decision in enumerate(decisions) if decision['action'] != 'forward')
+    assert decisions[first_turn - 1]['reason'].startswith('confirming_'), decisions[first_turn - 1]
+    assert decisions[first_turn]['action'] == 'left'
+    assert decisions[first_turn]['obstacles'] == 1
+    print(f"✅ Confirmed in frame {first_turn - 1}, turned {decisions[first_turn]['action']} in frame {first_turn}")
+
+
+def test_looming_blip_ignored():
+    """A three-frame false detection rushing closer never makes the walk turn"""
+    print("🧪 Testing looming blip...")
+    avoidance = WalkAvoidance()
+    decisions = _walk(avoidance, 6.0, 6.0, 12, seen_frames=3, height=1.7, width=0.5)
+    assert all(decision['action'] == 'forward' for decision in decisions), [d['action'] for d in decisions]
+    assert any(decision['reason'].startswith('confirming_') for decision in decisions)
+    assert avoidance.voter.suppressed > 0
+    print(f"✅ Blip held for {avoidance.voter.suppressed} frames and never acted on")
+
+
+def test_stall_reset_forgets_votes():
+    """Resetting after a stall clears the pending votes along with the tracks"""
+    print("🧪 Testing stall reset...")
+    avoidance = WalkAvoidance()
+    decisions = _walk(avoidance, 12.0, 4.0, 45)
+    first_turn = next(index for index, decision in enumerate(decisions) if decision['action'] != 'forward')
+
+    avoidance.reset()
+    # The same view again needs its tracks confirmed and its turn re-voted
+    resumed = avoidance.step([_detection(12.0 - 4.0 * first_turn * FRAME_INTERVAL)], FRAME_SHAPE, 10.0)
+    assert resumed['action'] == 'forward' and resumed['obstacles'] == 0
+    print("✅ Tracks and votes forgotten after a stall")
+
+
+def main():
+    """Run all walk avoidance tests"""
+    print("🚶 Walk Avoidance Test Suite")
+    print("=" * 50)
+
+    start = time.time()
+    test_persistent_obstacle_avoided()
+    test_looming_blip_ignored()
+    test_stall_reset_forgets_votes()
+    print(f"\n🎉 All tests passed in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
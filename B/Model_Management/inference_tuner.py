@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Inference Backend Auto-Tuner
+This module benchmarks every available inference backend, thread count and image
+size for a model once per host, and caches the fastest configuration that stays
+within an accuracy floor of the reference (torch at full resolution).
+Detectors read the cached choice at load time, so each machine in the fleet runs
+the configuration that suits its CPU without manual tuning.
+"""
+
+import os
+import re
+import glob
+import json
+import time
+import shutil
+import hashlib
+import platform
+import importlib.util
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from slim_yolo_runtime import SlimYOLO, box_iou
+
+# Bundled frames used for benchmarking (RuneScape chicken validation set)
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_SAMPLE_FRAMES_DIR = os.path.join(
+    project_root, 'A', 'Game_Services', 'RuneScape_Service', 'Yolo_Training',
+    'Chicken_Training', 'runescape_dataset', 'images', 'val'
+)
+
+# Per-host cache of tuned configurations
+TUNING_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".weplay_inference_tuning.json")
+
+# Candidate settings
+IMGSZ_CANDIDATES = (320, 416, 512, 640)
+REFERENCE_IMGSZ = 640
+ACCURACY_FLOOR = 0.9  # Minimum detection agreement (F1 @ IoU 0.5) with the reference
+
+# Set WEPLAY_AUTOTUNE=0 to skip the first-start benchmark and use torch defaults
+AUTO_TUNE = os.environ.get('WEPLAY_AUTOTUNE', '1') != '0'
+
+# Optimised models (ORT format / TorchScript) are cached next to the weights
+COMPILED_DIR_NAME = '.compiled'
+COMPILED_EXTENSIONS = {'onnxruntime': '.ort', 'torch': '.torchscript'}
+
+DEFAULT_CONFIG = {'backend': 'torch', 'threads': None, 'imgsz': REFERENCE_IMGSZ}
+
+
+def available_backends() -> List[str]:
+    """List inference backends installed on this host"""
+    def installed(module):
+        return importlib.util.find_spec(module) is not None
+
+    backends = []
+    torch_stack = installed('ultralytics') and installed('torch')
+    if torch_stack:
+        backends.append('torch')
+    # ONNX models run on the slim runtime; exporting them needs the torch stack
+    if installed('onnxruntime'):
+        backends.append('onnxruntime')
+    if torch_stack and installed('openvino'):
+        backends.append('openvino')
+    return backends
+
+
+def thread_candidates(backend: str) -> List[Optional[int]]:
+    """Thread counts worth trying for a backend (None = backend default)"""
+    if backend == 'openvino':
+        return [None]  # Thread count is not configurable through ultralytics for OpenVINO
+    cpu_count = os.cpu_count() or 1
+    return sorted({n for n in (1, 2, 4, cpu_count // 2, cpu_count) if 1 <= n <= cpu_count})
+
+
+def host_key() -> str:
+    """Identify this host and CPU generation"""
+    return f"{platform.node()}|{platform.processor() or platform.machine()}|{os.cpu_count()}"
+
+
+_model_hashes: Dict[tuple, str] = {}
+
+
+def model_hash(weights_path: str) -> str:
+    """Hash model weights so retrained models are re-tuned and recompiled"""
+    if not os.path.exists(weights_path):
+        return hashlib.sha256(weights_path.encode()).hexdigest()[:16]
+
+    # Weights are hashed once per process unless the file changes
+    stat = os.stat(weights_path)
+    key = (os.path.abspath(weights_path), stat.st_size, stat.st_mtime_ns)
+    if key not in _model_hashes:
+        digest = hashlib.sha256()
+        with open(weights_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        _model_hashes[key] = digest.hexdigest()[:16]
+    return _model_hashes[key]
+
+
+class TuningCache:
+    """JSON cache of tuned configurations keyed by host and model hash"""
+
+    def __init__(self, path: str = TUNING_CACHE_PATH):
+        self.path = path
+
+    def _read(self) -> Dict:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def lookup(self, weights_hash: str) -> Optional[Dict]:
+        """Get the cached configuration for this host and model"""
+        return self._read().get(host_key(), {}).get(weights_hash)
+
+    def store(self, weights_hash: str, config: Dict):
+        """Save a configuration for this host and model"""
+        data = self._read()
+        data.setdefault(host_key(), {})[weights_hash] = config
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+# === BACKEND LOADING ===
+
+def _export_path(weights_path: str, backend: str, imgsz: int) -> str:
+    """Location of an exported model, keyed by weight hash and image size so retraining re-exports"""
+    stem, _ = os.path.splitext(weights_path)
+    if backend == 'onnxruntime':
+        return f"{stem}-{model_hash(weights_path)}-{imgsz}.onnx"
+    return f"{stem}-{model_hash(weights_path)}-{imgsz}_openvino_model"
+
+
+def compiled_model_path(source_path: str, backend: str, imgsz) -> str:
+    """Location of the optimised form of a model, keyed by weight hash, backend and imgsz
+
+    Stored in a .compiled folder next to the weights so retraining invalidates it.
+    """
+    directory = os.path.join(os.path.dirname(source_path), COMPILED_DIR_NAME)
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    extension = COMPILED_EXTENSIONS[backend]
+    return os.path.join(directory, f"{stem}-{model_hash(source_path)}-{backend}-{imgsz}{extension}")
+
+
+_default_torch_threads = None
+
+
+def _set_torch_threads(threads: Optional[int]):
+    """Set torch's intra-op thread count (None restores the default)"""
+    global _default_torch_threads
+    import torch
+    if _default_torch_threads is None:
+        _default_torch_threads = torch.get_num_threads()
+    threads = threads or _default_torch_threads
+    if torch.get_num_threads() != threads:
+        torch.set_num_threads(threads)
+
+
+class UltralyticsRuntime:
+    """Gives ultralytics models the same detect() interface as SlimYOLO
+
+    torch's thread count is process-wide, so each runtime applies its tuned count
+    before every inference instead of once at load time (where the last model
+    loaded would set it for all of them).
+    """
+
+    def __init__(self, model, imgsz: int, threads: Optional[int] = None):
+        self.model = model
+        self.imgsz = imgsz
+        self.threads = threads
+        self.names = model.names
+
+    def detect(self, frame: np.ndarray, conf: float = 0.25, iou: float = 0.45) -> np.ndarray:
+        """Detect objects in a BGR frame, returns Nx6 (x1, y1, x2, y2, conf, cls) in frame pixels"""
+        _set_torch_threads(self.threads)
+        results = self.model(frame, conf=conf, iou=iou, imgsz=self.imgsz, verbose=False)
+        if not results or results[0].boxes is None:
+            return np.zeros((0, 6), dtype=np.float32)
+        return results[0].boxes.data.cpu().numpy()
+
+
+def _export(weights_path: str, export_format: str, imgsz: int, export_path: str):
+    """Export weights to another format at export_path (needs ultralytics)"""
+    from ultralytics import YOLO
+
+    os.makedirs(os.path.dirname(os.path.abspath(export_path)), exist_ok=True)
+    print(f"📦 Exporting {os.path.basename(weights_path)} to {export_format} (imgsz={imgsz})...")
+    exported = YOLO(weights_path).export(format=export_format, imgsz=imgsz)
+    shutil.move(str(exported), export_path)
+
+
+def load_backend_model(weights_path: str, backend: str, threads: Optional[int], imgsz: int):
+    """Load a model for a backend, exporting it next to the weights if needed
+
+    Returns a runtime with detect(frame, conf, iou) -> Nx6 and names.
+    """
+    if backend == 'onnxruntime':
+        onnx_path = weights_path if weights_path.endswith('.onnx') else _export_path(weights_path, backend, imgsz)
+        if not os.path.exists(onnx_path):
+            _export(weights_path, 'onnx', imgsz, onnx_path)
+        return SlimYOLO(onnx_path, threads=threads,
+                        compiled_path=compiled_model_path(weights_path, backend, imgsz))
+
+    from ultralytics import YOLO
+
+    if backend == 'torch':
+        # Trace once and reuse the TorchScript module on later starts
+        torchscript_path = compiled_model_path(weights_path, backend, imgsz)
+        if not os.path.exists(torchscript_path):
+            try:
+                _export(weights_path, 'torchscript', imgsz, torchscript_path)
+            except Exception as e:
+                print(f"⚠️ TorchScript export failed ({e}), using eager model")
+                return UltralyticsRuntime(YOLO(weights_path), imgsz, threads)
+        return UltralyticsRuntime(YOLO(torchscript_path, task='detect'), imgsz, threads)
+
+    export_path = _export_path(weights_path, backend, imgsz)
+    if not os.path.exists(export_path):
+        _export(weights_path, 'openvino', imgsz, export_path)
+    return UltralyticsRuntime(YOLO(export_path, task='detect'), imgsz)
+
+
+# === ACCURACY ===
+
+def detection_agreement(predicted: np.ndarray, reference: np.ndarray, iou_threshold: float = 0.5) -> float:
+    """F1 score of predicted detections against reference detections"""
+    if len(predicted) == 0 and len(reference) == 0:
+        return 1.0
+    if len(predicted) == 0 or len(reference) == 0:
+        return 0.0
+
+    ious = box_iou(predicted[:, :4], reference[:, :4])
+    ious[predicted[:, 5][:, None] != reference[:, 5][None, :]] = 0.0
+
+    # Greedy one-to-one matching, best overlaps first
+    matched_predicted = set()
+    matched_reference = set()
+    for flat_index in np.argsort(ious, axis=None)[::-1]:
+        p, r = np.unravel_index(flat_index, ious.shape)
+        if ious[p, r] < iou_threshold:
+            break
+        if p in matched_predicted or r in matched_reference:
+            continue
+        matched_predicted.add(p)
+        matched_reference.add(r)
+    matches = len(matched_predicted)
+    return 2 * matches / (len(predicted) + len(reference))
+
+
+# === TUNING ===
+
+class InferenceTuner:
+    """One-shot benchmark of backend / threads / imgsz combinations"""
+
+    def __init__(self, sample_frames_dir: str = DEFAULT_SAMPLE_FRAMES_DIR, max_frames: int = 8,
+                 accuracy_floor: float = ACCURACY_FLOOR, imgsz_candidates=IMGSZ_CANDIDATES,
+                 warmup_runs: int = 2):
+        self.sample_frames_dir = sample_frames_dir
+        self.max_frames = max_frames
+        self.accuracy_floor = accuracy_floor
+        self.imgsz_candidates = imgsz_candidates
+        self.warmup_runs = warmup_runs
+        self.cache = TuningCache()
+
+    def load_sample_frames(self) -> List[np.ndarray]:
+        """Load benchmark frames from the bundled dataset"""
+        import cv2
+        paths = sorted(glob.glob(os.path.join(self.sample_frames_dir, '*.jpg')))
+        frames = [cv2.imread(path) for path in paths[:self.max_frames]]
+        return [frame for frame in frames if frame is not None]
+
+    def _benchmark(self, model, frames: List[np.ndarray]):
+        """Return (median latency ms, detections per frame)"""
+        for frame in frames[:self.warmup_runs]:
+            model.detect(frame)
+
+        latencies = []
+        detections = []
+        for frame in frames:
+            start = time.perf_counter()
+            detections.append(model.detect(frame))
+            latencies.append((time.perf_counter() - start) * 1000)
+        return float(np.median(latencies)), detections
+
+    def tune(self, weights_path: str) -> Dict:
+        """Benchmark all combinations and return the fastest accurate configuration"""
+        frames = self.load_sample_frames()
+        backends = available_backends()
+        if not frames or 'torch' not in backends:
+            print("⚠️ Auto-tune skipped (no sample frames or torch not installed)")
+            return dict(DEFAULT_CONFIG)
+
+        print(f"⏱️ Auto-tuning {os.path.basename(weights_path)} on {len(frames)} frames "
+              f"(backends: {', '.join(backends)})...")
+
+        reference_model = load_backend_model(weights_path, 'torch', None, REFERENCE_IMGSZ)
+        reference_ms, reference = self._benchmark(reference_model, frames)
+        best = dict(DEFAULT_CONFIG, latency_ms=reference_ms, agreement=1.0)
+
+        for backend in backends:
+            for threads in thread_candidates(backend):
+                for imgsz in self.imgsz_candidates:
+                    try:
+                        model = load_backend_model(weights_path, backend, threads, imgsz)
+                        latency_ms, detections = self._benchmark(model, frames)
+                    except Exception as e:
+                        print(f"   ⚠️ {backend} threads={threads} imgsz={imgsz} failed: {e}")
+                        continue
+
+                    agreement = float(np.mean([
+                        detection_agreement(predicted, expected)
+                        for predicted, expected in zip(detections, reference)
+                    ]))
+                    print(f"   {backend:<12} threads={str(threads):<4} imgsz={imgsz:<4} "
+                          f"{latency_ms:7.1f} ms  agreement={agreement:.2f}")
+
+                    if agreement >= self.accuracy_floor and latency_ms < best['latency_ms']:
+                        best = {'backend': backend, 'threads': threads, 'imgsz': imgsz,
+                                'latency_ms': latency_ms, 'agreement': agreement}
+
+        print(f"✅ Fastest accurate config: {best['backend']} threads={best['threads']} "
+              f"imgsz={best['imgsz']} ({best['latency_ms']:.1f} ms)")
+        return best
+
+    def get_config(self, weights_path: str, tune: bool = True) -> Dict:
+        """Get the cached configuration, running the benchmark on first use (unless tune is False)"""
+        weights_hash = model_hash(weights_path)
+        config = self.cache.lookup(weights_hash)
+        if config is not None:
+            return config
+
+        if not (tune and AUTO_TUNE):
+            return dict(DEFAULT_CONFIG)
+
+        config = self.tune(weights_path)
+        try:
+            self.cache.store(weights_hash, config)
+        except OSError as e:
+            print(f"⚠️ Could not save tuning cache: {e}")
+        return config
+
+
+def _load_without_torch(spec):
+    """Load an existing ONNX export on the slim runtime when torch is not installed"""
+    weights_path = spec.weights_path
+    cached = TuningCache().lookup(model_hash(weights_path)) or {}
+    if cached.get('backend') != 'onnxruntime':
+        cached = {}
+
+    if weights_path.endswith('.onnx'):
+        onnx_paths = [weights_path]
+    else:
+        stem, _ = os.path.splitext(weights_path)
+        tuned_path = _export_path(weights_path, 'onnxruntime', cached.get('imgsz', REFERENCE_IMGSZ))
+        # Only exports of these weights count; without the weights on disk any export will do
+        weights_hash = model_hash(weights_path) if os.path.exists(weights_path) else '*'
+        exports = glob.glob(f"{glob.escape(stem)}-{weights_hash}-*.onnx")
+        # Prefer the tuned export, then the largest (most accurate) one available
+        onnx_paths = [tuned_path] + sorted(exports, key=os.path.getsize, reverse=True)
+    onnx_paths = [path for path in onnx_paths if os.path.exists(path)]
+    if not onnx_paths:
+        raise RuntimeError(f"No ONNX export of {weights_path} found (export it on a machine with ultralytics)")
+
+    # Exports are named <stem>-<hash>-<imgsz>.onnx; the hash in the key covers other files
+    imgsz_match = re.search(r'-(\d+)\.onnx$', onnx_paths[0])
+    compiled_path = compiled_model_path(onnx_paths[0], 'onnxruntime', imgsz_match.group(1) if imgsz_match else 'native')
+    model = SlimYOLO(onnx_paths[0], threads=cached.get('threads'), compiled_path=compiled_path)
+    spec.inference_config = {'backend': 'onnxruntime', 'threads': cached.get('threads'), 'imgsz': model.imgsz}
+    return model
+
+
+def load_tuned_model(spec, tune: bool = True):
+    """Registry loader: load a model with this host's tuned backend configuration
+
+    With tune False a model that has not been tuned yet loads with the defaults
+    instead of benchmarking (for background and pre-fork loads).
+    """
+    if 'torch' not in available_backends():
+        return _load_without_torch(spec)
+
+    sample_frames_dir = getattr(spec, 'sample_frames_dir', None) or DEFAULT_SAMPLE_FRAMES_DIR
+    config = InferenceTuner(sample_frames_dir).get_config(spec.weights_path, tune)
+    try:
+        model = load_backend_model(spec.weights_path, config['backend'], config['threads'], config['imgsz'])
+    except Exception as e:
+        print(f"⚠️ Tuned {config['backend']} backend failed to load ({e}), using torch")
+        config = dict(DEFAULT_CONFIG)
+        model = load_backend_model(spec.weights_path, 'torch', None, config['imgsz'])
+
+    spec.inference_config = config
+    return model
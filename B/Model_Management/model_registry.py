@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Model Registry
+This module keeps detection models resident across commands within a memory budget.
+Models are loaded on demand, evicted least-recently-used first when the budget is
+exceeded, and the models an activity is likely to need next are prefetched in the
+background so switching activities does not stall on a reload.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+# Default memory budget for resident models (override with WEPLAY_MODEL_BUDGET_MB)
+DEFAULT_MEMORY_BUDGET_MB = 1024
+
+# Loaded YOLO models take several times their weight file size once the
+# framework has built the graph and allocated inference buffers
+FOOTPRINT_FACTOR = 4.0
+
+# Used when a weight file is not on disk yet (e.g. 'yolov8n.pt' before download)
+DEFAULT_FOOTPRINT_MB = 64.0
+
+
+class ModelSpec:
+    """Describes a model the registry can load"""
+
+    def __init__(self, name: str, weights_path: str, next_likely: Optional[List[str]] = None,
+                 fallback: Optional[str] = None, footprint_mb: Optional[float] = None):
+        self.name = name
+        self.weights_path = weights_path
+        self.next_likely = list(next_likely or [])
+        self.fallback = fallback
+        self.footprint_mb = footprint_mb
+        # Frames used when auto-tuning this model (None = bundled dataset)
+        self.sample_frames_dir = None
+        # Backend / threads / imgsz chosen for this host, set by the loader
+        self.inference_config = {}
+
+    def is_available(self) -> bool:
+        """Check if the weights can be loaded (bare names are fetched by ultralytics)"""
+        if os.path.dirname(self.weights_path):
+            return os.path.exists(self.weights_path)
+        return True
+
+    def estimate_footprint_mb(self) -> float:
+        """Estimate resident memory for this model"""
+        if self.footprint_mb is not None:
+            return self.footprint_mb
+        if os.path.exists(self.weights_path):
+            return os.path.getsize(self.weights_path) / (1024 * 1024) * FOOTPRINT_FACTOR
+        return DEFAULT_FOOTPRINT_MB
+
+
+def _load_yolo(spec: ModelSpec):
+    """Load a model with this host's tuned backend (imported lazily so the registry stays light)"""
+    from inference_tuner import load_tuned_model
+    return load_tuned_model(spec)
+
+
+def _load_yolo_untuned(spec: ModelSpec):
+    """Load a model with its cached tuned backend, or the defaults, without benchmarking"""
+    from inference_tuner import load_tuned_model
+    return load_tuned_model(spec, tune=False)
+
+
+def _has_tuned_config(spec: ModelSpec) -> bool:
+    """Whether a load without tuning already gets this host's tuned configuration"""
+    from inference_tuner import AUTO_TUNE, TuningCache, available_backends, model_hash
+    if not AUTO_TUNE or 'torch' not in available_backends():
+        return True  # Nothing would be tuned: both loaders load the same model
+    return TuningCache().lookup(model_hash(spec.weights_path)) is not None
+
+
+class ModelRegistry:
+    """Memory-budgeted LRU cache of loaded detection models"""
+
+    def __init__(self, memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+                 loader: Callable[[ModelSpec], object] = _load_yolo,
+                 untuned_loader: Optional[Callable[[ModelSpec], object]] = None,
+                 has_tuned_config: Optional[Callable[[ModelSpec], bool]] = None):
+        self.memory_budget_mb = memory_budget_mb
+        self.loader = loader
+        # Loads without running the tuning benchmark (prefetch); defaults to loader for custom loaders
+        if untuned_loader is None:
+            untuned_loader = _load_yolo_untuned if loader is _load_yolo else loader
+        self.untuned_loader = untuned_loader
+        # Whether untuned_loader already gets the tuned configuration (e.g. from the tuning cache)
+        if has_tuned_config is None:
+            if untuned_loader is loader:
+                has_tuned_config = lambda spec: True
+            elif loader is _load_yolo:
+                has_tuned_config = _has_tuned_config
+            else:
+                has_tuned_config = lambda spec: False
+        self.has_tuned_config = has_tuned_config
+        self.specs: Dict[str, ModelSpec] = {}
+
+        # Resident models in LRU order (oldest first): name -> (model, footprint_mb)
+        self._resident: "OrderedDict[str, tuple]" = OrderedDict()
+        # Models the current command needs - never evicted while pinned
+        self._pinned = set()
+        # Models currently being loaded: name -> Event set when loading finishes
+        self._loading: Dict[str, threading.Event] = {}
+        # Footprints reserved by loads in progress, counted against the budget
+        self._reserved: Dict[str, float] = {}
+        # Resident models loaded without tuning that tuning would change
+        self._untuned = set()
+        self._lock = threading.RLock()
+        # Names waiting for the background prefetch worker (one worker at a time)
+        self._prefetch_queue: List[str] = []
+        self._prefetch_thread = None
+
+    # === REGISTRATION ===
+
+    def register(self, name: str, weights_path: str, next_likely: Optional[List[str]] = None,
+                 fallback: Optional[str] = None, footprint_mb: Optional[float] = None) -> ModelSpec:
+        """Register a model by name
+
+        Re-registering the same weights keeps the existing spec and its tuned
+        inference config; new weights replace the spec and drop the resident model.
+        """
+        with self._lock:
+            existing = self.specs.get(name)
+            if existing is not None and existing.weights_path == weights_path:
+                return existing
+            spec = ModelSpec(name, weights_path, next_likely, fallback, footprint_mb)
+            self.specs[name] = spec
+            if existing is not None:
+                self.evict(name)
+        return spec
+
+    def inference_config(self, name: str) -> Dict:
+        """Tuned inference configuration of a loaded model (empty if untuned)"""
+        with self._lock:
+            return dict(self.specs[self.resolve(name)].inference_config)
+
+    def resolve(self, name: str) -> str:
+        """Follow fallbacks until a model with available weights is found"""
+        seen = set()
+        while name in self.specs and name not in seen:
+            seen.add(name)
+            spec = self.specs[name]
+            if spec.is_available() or not spec.fallback:
+                return name
+            name = spec.fallback
+        if name not in self.specs:
+            raise KeyError(f"Unknown model: {name}")
+        return name
+
+    # === LOADING ===
+
+    def get(self, name: str, tune: bool = True):
+        """Return a loaded model, loading it (and evicting LRU models) if needed
+
+        With tune False an untuned model loads with the defaults instead of
+        running the tuning benchmark on this thread. With tune True a model
+        loaded untuned (e.g. by the prefetch this call waited for) is reloaded
+        with tuning here.
+        """
+        while True:
+            with self._lock:
+                resolved = self.resolve(name)
+                if resolved in self._resident:
+                    if not (tune and resolved in self._untuned):
+                        self._resident.move_to_end(resolved)
+                        return self._resident[resolved][0]
+                    print(f"⏱️ Reloading '{resolved}' with tuning (it was loaded untuned)")
+                    self.evict(resolved)
+
+                # Another thread (e.g. a prefetch) is already loading this model
+                loading = self._loading.get(resolved)
+                if loading is None:
+                    if resolved != name:
+                        print(f"⚠️ Model '{name}' not found, using '{resolved}' instead")
+                    spec = self.specs[resolved]
+                    footprint = spec.estimate_footprint_mb()
+                    self._make_room(footprint, keep={resolved})
+                    # Reserve now so a concurrent load (e.g. a prefetch) cannot overcommit the budget
+                    self._reserved[resolved] = footprint
+                    self._loading[resolved] = threading.Event()
+                    break
+            loading.wait()
+
+        # Load outside the lock so other models stay usable meanwhile
+        try:
+            print(f"📦 Loading model '{resolved}' ({footprint:.0f} MB est.)")
+            model = self.loader(spec) if tune else self.untuned_loader(spec)
+            untuned = not tune and not self.has_tuned_config(spec)
+            with self._lock:
+                self._resident[resolved] = (model, footprint)
+                if untuned:
+                    self._untuned.add(resolved)
+            return model
+        finally:
+            with self._lock:
+                self._reserved.pop(resolved, None)
+                self._loading.pop(resolved).set()
+
+    def require(self, names: List[str]) -> Dict[str, object]:
+        """Load the models a command needs, pin them, and prefetch what comes next"""
+        with self._lock:
+            self._pinned = {self.resolve(name) for name in names}
+        models = {name: self.get(name) for name in names}
+
+        next_likely = []
+        for name in names:
+            for candidate in self.specs[self.resolve(name)].next_likely:
+                if candidate not in names and candidate not in next_likely:
+                    next_likely.append(candidate)
+        if next_likely:
+            self.prefetch(next_likely)
+
+        return models
+
+    def prefetch(self, names: List[str]):
+        """Load models in the background if they fit without evicting pinned ones
+
+        Names requested while a prefetch is running are queued behind it.
+        """
+        with self._lock:
+            for name in names:
+                if name not in self._prefetch_queue:
+                    self._prefetch_queue.append(name)
+            if self._prefetch_thread is None:
+                self._prefetch_thread = threading.Thread(target=self._prefetch_worker, daemon=True)
+                self._prefetch_thread.start()
+
+    def _prefetch_worker(self):
+        """Prefetch queued names until the queue is empty"""
+        while True:
+            with self._lock:
+                if not self._prefetch_queue:
+                    self._prefetch_thread = None
+                    return
+                name = self._prefetch_queue.pop(0)
+            try:
+                with self._lock:
+                    resolved = self.resolve(name)
+                    if resolved in self._resident or resolved in self._loading:
+                        continue
+                    footprint = self.specs[resolved].estimate_footprint_mb()
+                    if footprint + self._pinned_mb() + self._reserved_mb() > self.memory_budget_mb:
+                        print(f"⏭️ Skipping prefetch of '{resolved}' (over memory budget)")
+                        continue
+                # The tuning benchmark only ever runs for a foreground load
+                self.get(resolved, tune=False)
+                # Prefetched models are the first candidates for eviction
+                with self._lock:
+                    if resolved in self._resident and resolved not in self._pinned:
+                        self._resident.move_to_end(resolved, last=False)
+            except Exception as e:
+                print(f"⚠️ Prefetch of '{name}' failed: {e}")
+
+    # === EVICTION ===
+
+    def _pinned_mb(self) -> float:
+        """Memory used by pinned resident models"""
+        return sum(footprint for name, (_, footprint) in self._resident.items() if name in self._pinned)
+
+    def resident_mb(self) -> float:
+        """Memory used by all resident models"""
+        with self._lock:
+            return sum(footprint for _, footprint in self._resident.values())
+
+    def _reserved_mb(self) -> float:
+        """Memory reserved by loads in progress"""
+        return sum(self._reserved.values())
+
+    def _make_room(self, needed_mb: float, keep=()):
+        """Evict least-recently-used models until needed_mb fits in the budget next to loads in progress"""
+        for name in list(self._resident.keys()):
+            if self.resident_mb() + self._reserved_mb() + needed_mb <= self.memory_budget_mb:
+                return
+            if name in self._pinned or name in keep:
+                continue
+            self.evict(name)
+
+        committed_mb = self.resident_mb() + self._reserved_mb() + needed_mb
+        if committed_mb > self.memory_budget_mb:
+            print(f"⚠️ Memory budget exceeded: {committed_mb:.0f}/{self.memory_budget_mb:.0f} MB "
+                  f"(pinned and loading models cannot be evicted)")
+
+    def evict(self, name: str) -> bool:
+        """Drop a resident model"""
+        with self._lock:
+            if name not in self._resident:
+                return False
+            _, footprint = self._resident.pop(name)
+            self._untuned.discard(name)
+            print(f"🗑️ Evicted model '{name}' (freed ~{footprint:.0f} MB)")
+            return True
+
+    def resident_models(self) -> List[str]:
+        """Names of resident models, least recently used first"""
+        with self._lock:
+            return list(self._resident.keys())
+
+    # === FORKED WORKERS ===
+
+    def after_fork(self):
+        """Make inherited models usable in a forked worker process
+
+        Locks and threads do not survive a fork, so fresh ones are created, and
+        models that hold fork-unsafe state (e.g. ONNX Runtime sessions) reopen it.
+        """
+        self._lock = threading.RLock()
+        self._loading = {}
+        self._reserved = {}
+        self._prefetch_queue = []
+        self._prefetch_thread = None
+        for name, (model, _) in self._resident.items():
+            reopen = getattr(model, 'reopen', None)
+            if reopen is not None:
+                try:
+                    reopen()
+                except Exception as e:
+                    print(f"⚠️ Could not reopen model '{name}' after fork: {e}")
+
+
+_shared_registry = None
+_shared_registry_lock = threading.Lock()
+
+
+def get_model_registry(memory_budget_mb: Optional[float] = None) -> ModelRegistry:
+    """Get the process-wide model registry shared by all detectors"""
+    global _shared_registry
+    with _shared_registry_lock:
+        if _shared_registry is None:
+            if memory_budget_mb is None:
+                memory_budget_mb = float(os.environ.get('WEPLAY_MODEL_BUDGET_MB', DEFAULT_MEMORY_BUDGET_MB))
+            _shared_registry = ModelRegistry(memory_budget_mb)
+        elif memory_budget_mb is not None:
+            _shared_registry.memory_budget_mb = memory_budget_mb
+        return _shared_registry
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+RuneScape Models
+The RuneScape activity models and the activities likely to follow each one.
+Kept free of detector and Windows imports so the bot launcher can register
+them on any platform before forking its workers.
+"""
+
+import os
+
+# Trained models per activity and the activities likely to follow each one
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+YOLO_TRAINING_DIR = os.path.join(project_root, 'A', 'Game_Services', 'RuneScape_Service', 'Yolo_Training')
+RUNESCAPE_MODELS = {
+    'chicken': {
+        'weights': os.path.join(YOLO_TRAINING_DIR, 'Chicken_Training', 'runs', 'train', 'yolov8n.pt', 'weights', 'best.pt'),
+        'next_likely': ['woodcutting'],
+    },
+    'woodcutting': {
+        'weights': os.path.join(YOLO_TRAINING_DIR, 'Woodcutting_Training', 'runs', 'train', 'yolov8n.pt', 'weights', 'best.pt'),
+        'next_likely': ['mining', 'chicken'],
+    },
+    'mining': {
+        'weights': os.path.join(YOLO_TRAINING_DIR, 'Mining_Training', 'runs', 'train', 'yolov8n.pt', 'weights', 'best.pt'),
+        'next_likely': ['woodcutting'],
+    },
+    'generic': {
+        'weights': 'yolov8n.pt',  # COCO model, downloaded by ultralytics if missing (or yolov8n-<hash>-<imgsz>.onnx without torch)
+        'next_likely': [],
+    },
+}
+
+
+def register_runescape_models(registry):
+    """Register the RuneScape models with a model registry (trained models fall back to generic)
+
+    Models already registered (e.g. by the launcher before forking) are left as they are.
+    """
+    for name, model_info in RUNESCAPE_MODELS.items():
+        if name in registry.specs:
+            continue
+        registry.register(
+            name, model_info['weights'],
+            next_likely=model_info['next_likely'],
+            fallback=None if name == 'generic' else 'generic'
+        )
+    return registry
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Slim YOLO Runtime
+Runs exported YOLOv8 ONNX models with ONNX Runtime and does letterboxing, output
+decoding and class-wise NMS in NumPy, so bot processes can detect objects without
+importing torch or ultralytics. Only model export and training need the heavy stack.
+"""
+
+import os
+import ast
+import json
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+# Letterbox padding colour used by ultralytics during training
+LETTERBOX_FILL = 114
+
+# Boxes are shifted by class_id * MAX_WH so one NMS pass keeps classes apart
+MAX_WH = 7680
+MAX_NMS_CANDIDATES = 30000
+MAX_DETECTIONS = 300
+
+
+def letterbox(frame: np.ndarray, imgsz: int) -> Tuple[np.ndarray, float, Tuple[int, int]]:
+    """Resize keeping aspect ratio and pad to imgsz x imgsz
+
+    Returns the NCHW float32 RGB input blob, the scale and the (left, top) padding.
+    """
+    height, width = frame.shape[:2]
+    scale = min(imgsz / height, imgsz / width)
+    new_width, new_height = int(round(width * scale)), int(round(height * scale))
+    left = int(round((imgsz - new_width) / 2 - 0.1))
+    top = int(round((imgsz - new_height) / 2 - 0.1))
+
+    canvas = np.full((imgsz, imgsz, 3), LETTERBOX_FILL, dtype=np.uint8)
+    if (new_width, new_height) != (width, height):
+        frame = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_LINEAR)
+    canvas[top:top + new_height, left:left + new_width] = frame
+
+    # BGR HWC uint8 -> RGB NCHW float32 in [0, 1]
+    blob = canvas[:, :, ::-1].transpose(2, 0, 1)[None].astype(np.float32) / 255.0
+    return np.ascontiguousarray(blob), scale, (left, top)
+
+
+def box_iou(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """Pairwise IoU between two sets of xyxy boxes"""
+    x1 = np.maximum(boxes_a[:, None, 0], boxes_b[None, :, 0])
+    y1 = np.maximum(boxes_a[:, None, 1], boxes_b[None, :, 1])
+    x2 = np.minimum(boxes_a[:, None, 2], boxes_b[None, :, 2])
+    y2 = np.minimum(boxes_a[:, None, 3], boxes_b[None, :, 3])
+    intersection = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    area_a = (boxes_a[:, 2] - boxes_a[:, 0]) * (boxes_a[:, 3] - boxes_a[:, 1])
+    area_b = (boxes_b[:, 2] - boxes_b[:, 0]) * (boxes_b[:, 3] - boxes_b[:, 1])
+    return intersection / np.maximum(area_a[:, None] + area_b[None, :] - intersection, 1e-9)
+
+
+def nms(boxes: np.ndarray, scores: np.ndarray, iou_threshold: float,
+        max_detections: int = MAX_DETECTIONS) -> np.ndarray:
+    """Greedy non-maximum suppression, returns kept indices best first"""
+    order = np.argsort(scores)[::-1]
+    keep = []
+    while order.size and len(keep) < max_detections:
+        best = order[0]
+        keep.append(best)
+        if order.size == 1:
+            break
+        overlaps = box_iou(boxes[best:best + 1], boxes[order[1:]])[0]
+        order = order[1:][overlaps <= iou_threshold]
+    return np.array(keep, dtype=np.int64)
+
+
+def decode_yolov8(output: np.ndarray, conf_threshold: float, iou_threshold: float) -> np.ndarray:
+    """Decode a raw YOLOv8 output (1, 4 + classes, anchors) into Nx6 detections
+
+    Rows are (x1, y1, x2, y2, conf, cls) in model input coordinates.
+    """
+    predictions = output[0].T  # (anchors, 4 + classes)
+    class_scores = predictions[:, 4:]
+    class_ids = class_scores.argmax(axis=1)
+    confidences = class_scores[np.arange(len(class_ids)), class_ids]
+
+    mask = confidences > conf_threshold
+    if not mask.any():
+        return np.zeros((0, 6), dtype=np.float32)
+    predictions, class_ids, confidences = predictions[mask], class_ids[mask], confidences[mask]
+
+    if len(confidences) > MAX_NMS_CANDIDATES:
+        top = np.argsort(confidences)[::-1][:MAX_NMS_CANDIDATES]
+        predictions, class_ids, confidences = predictions[top], class_ids[top], confidences[top]
+
+    # Centre / size -> corners
+    boxes = np.empty((len(predictions), 4), dtype=np.float32)
+    half_size = predictions[:, 2:4] / 2
+    boxes[:, :2] = predictions[:, :2] - half_size
+    boxes[:, 2:] = predictions[:, :2] + half_size
+
+    # Class-wise NMS in one pass by moving each class to its own region
+    offsets = (class_ids * MAX_WH)[:, None].astype(np.float32)
+    keep = nms(boxes + offsets, confidences, iou_threshold)
+
+    return np.column_stack([
+        boxes[keep], confidences[keep], class_ids[keep].astype(np.float32)
+    ]).astype(np.float32)
+
+
+def _parse_metadata(value: Optional[str], default=None):
+    """Parse a Python literal stored in ONNX metadata by ultralytics"""
+    if not value:
+        return default
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return default
+
+
+class SlimYOLO:
+    """YOLOv8 ONNX model served by ONNX Runtime without torch
+
+    With compiled_path, the first start saves the graph-optimised model in ORT
+    format there and later starts load it directly, skipping optimisation. Only
+    the portable (extended) optimisations are saved: the layout ones tied to
+    this CPU's instruction set would run the wrong kernels on another machine.
+    """
+
+    def __init__(self, onnx_path: str, threads: Optional[int] = None,
+                 names: Optional[Dict[int, str]] = None, compiled_path: Optional[str] = None):
+        import onnxruntime as ort
+
+        self.onnx_path = onnx_path
+        self.compiled_path = compiled_path
+        self.threads = threads
+        self._model_bytes = None
+        # Sessions inherited from a parent process (see reopen)
+        self._inherited_sessions = []
+
+        metadata = None
+        if compiled_path and os.path.exists(compiled_path) and os.path.exists(compiled_path + '.json'):
+            try:
+                metadata = self._load_compiled(compiled_path)
+            except Exception as e:
+                print(f"⚠️ Cached optimised model unusable ({e}), recompiling")
+
+        if metadata is None:
+            options = self._session_options()
+            saved_path = None
+            if compiled_path:
+                os.makedirs(os.path.dirname(compiled_path), exist_ok=True)
+                saved_path = f"{compiled_path}.{os.getpid()}.tmp"
+                options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+                options.optimized_model_filepath = saved_path
+                options.add_session_config_entry('session.save_model_format', 'ORT')
+            self.session = ort.InferenceSession(onnx_path, options, providers=['CPUExecutionProvider'])
+            metadata = self._session_metadata()
+            if saved_path and self._store_compiled(saved_path, compiled_path):
+                # Serve from the cached bytes like later starts do
+                self._load_compiled(compiled_path)
+        self.input_name = self.session.get_inputs()[0].name
+
+        self.names = names or {int(class_id): name for class_id, name in metadata['names'].items()}
+        input_size = self.session.get_inputs()[0].shape[2]
+        self.imgsz = input_size if isinstance(input_size, int) else metadata['imgsz'][0]
+
+    def _session_options(self):
+        """Session options with this model's thread count"""
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        if self.threads:
+            options.intra_op_num_threads = self.threads
+        return options
+
+    def _session_metadata(self) -> Dict:
+        """Class names and input size embedded by the ultralytics exporter"""
+        model_metadata = self.session.get_modelmeta().custom_metadata_map
+        return {
+            'names': _parse_metadata(model_metadata.get('names'), {}),
+            'imgsz': _parse_metadata(model_metadata.get('imgsz'), [640]),
+        }
+
+    def _session_from_bytes(self):
+        """Create a session over the ORT-format model bytes without re-running optimisation"""
+        import onnxruntime as ort
+
+        options = self._session_options()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+        # The session copies the weights: the Python binding only lends ORT a temporary
+        # copy of the bytes, so session.use_ort_model_bytes_* would read freed memory
+        return ort.InferenceSession(self._model_bytes, options, providers=['CPUExecutionProvider'])
+
+    def _load_compiled(self, compiled_path: str) -> Dict:
+        """Load an ORT-format model from the cache, returns its metadata"""
+        with open(compiled_path, 'rb') as f:
+            model_bytes = f.read()
+        with open(compiled_path + '.json', 'r') as f:
+            metadata = json.load(f)
+        self._model_bytes = model_bytes  # Kept for reopen after a fork
+        self.session = self._session_from_bytes()
+        return metadata
+
+    def _store_compiled(self, saved_path: str, compiled_path: str) -> bool:
+        """Move a freshly optimised model into the cache with its metadata"""
+        try:
+            with open(saved_path + '.json', 'w') as f:
+                json.dump(self._session_metadata(), f)
+            # Model first, metadata last: the cache only counts once both exist
+            os.replace(saved_path, compiled_path)
+            os.replace(saved_path + '.json', compiled_path + '.json')
+            return True
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not cache optimised model: {e}")
+            return False
+
+    def reopen(self):
+        """Recreate the session in a forked worker
+
+        ONNX Runtime sessions are not fork-safe (their thread pools stay in the
+        parent). The new session is built from the inherited ORT-format bytes, so
+        the worker neither reads the model from disk nor re-runs optimisation.
+        """
+        import onnxruntime as ort
+
+        # Never destroy the inherited session: its pool threads do not exist here
+        self._inherited_sessions.append(self.session)
+        if self._model_bytes is not None:
+            self.session = self._session_from_bytes()
+        else:
+            self.session = ort.InferenceSession(self.onnx_path, self._session_options(),
+                                                providers=['CPUExecutionProvider'])
+
+    def detect(self, frame: np.ndarray, conf: float = 0.25, iou: float = 0.45) -> np.ndarray:
+        """Detect objects in a BGR frame, returns Nx6 (x1, y1, x2, y2, conf, cls) in frame pixels"""
+        blob, scale, (left, top) = letterbox(frame, self.imgsz)
+        output = self.session.run(None, {self.input_name: blob})[0]
+        detections = decode_yolov8(output, conf, iou)
+        if len(detections) == 0:
+            return detections
+
+        # Undo letterbox and clip to the frame
+        height, width = frame.shape[:2]
+        detections[:, [0, 2]] = np.clip((detections[:, [0, 2]] - left) / scale, 0, width)
+        detections[:, [1, 3]] = np.clip((detections[:, [1, 3]] - top) / scale, 0, height)
+        return detections
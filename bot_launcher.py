@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Bot Launcher
+Runs several bots on one host from a single preloaded parent process. The parent
+imports the detection stack and loads the registry's models once, then forks the
+bot workers so they share those pages copy-on-write instead of each loading a copy.
+Per-worker unique memory (USS) is reported; --compare also starts one independent
+process per bot (the current command_processor.py setup) and reports the saving.
+
+Fork is POSIX only: on Windows workers are spawned and load their own models.
+Commands drive the game through win32 and vgamepad, so they only run on Windows;
+elsewhere workers just hold the models.
+"""
+
+import os
+import gc
+import sys
+import time
+import queue
+import argparse
+import subprocess
+import multiprocessing
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+RUNESCAPE_SERVICE_PATH = os.path.join(PROJECT_ROOT, 'A', 'Game_Services', 'RuneScape_Service')
+for import_path in (
+    os.path.join(PROJECT_ROOT, 'B', 'Model_Management'),
+    RUNESCAPE_SERVICE_PATH,
+    os.path.join(RUNESCAPE_SERVICE_PATH, 'Yolo Detector'),
+):
+    if import_path not in sys.path:
+        sys.path.append(import_path)
+
+DEFAULT_MODELS = ['generic']
+READY_TIMEOUT = 300  # Seconds a worker may take to load models and warm up
+READY_POLL_S = 1.0  # How often to check for workers that died before reporting
+STOP_TIMEOUT = 10  # Seconds a worker gets to finish after stop before it is terminated
+WARMUP_FRAME_SHAPE = (360, 640, 3)
+
+# command_processor imports win32 and vgamepad at module level
+COMMANDS_SUPPORTED = sys.platform == 'win32'
+
+
+def tune_models(models: List[tuple]):
+    """Child process: benchmark (weights_path, sample_frames_dir) pairs into the tuning cache"""
+    from inference_tuner import InferenceTuner, DEFAULT_SAMPLE_FRAMES_DIR
+
+    for weights_path, sample_frames_dir in models:
+        InferenceTuner(sample_frames_dir or DEFAULT_SAMPLE_FRAMES_DIR).get_config(weights_path)
+
+
+def tune_in_child(registry, model_names: List[str]):
+    """Run first-time tuning benchmarks in a throwaway process
+
+    Benchmarking starts torch and ONNX Runtime thread pools, which must not exist
+    in a parent that forks workers; the child only leaves the tuning cache behind.
+    """
+    from inference_tuner import AUTO_TUNE, TuningCache, available_backends, model_hash
+
+    if not AUTO_TUNE or 'torch' not in available_backends():
+        return
+    cache = TuningCache()
+    untuned = []
+    for name in model_names:
+        spec = registry.specs[registry.resolve(name)]
+        if cache.lookup(model_hash(spec.weights_path)) is None:
+            untuned.append((spec.weights_path, spec.sample_frames_dir))
+    if not untuned:
+        return
+
+    print(f"⏱️ Tuning {len(untuned)} model(s) in a child process...")
+    child = multiprocessing.get_context('spawn').Process(target=tune_models, args=(untuned,))
+    child.start()
+    child.join()
+    if child.exitcode != 0:
+        print(f"⚠️ Tuning process failed (exit code {child.exitcode}), using default configurations")
+
+
+def preload_models(model_names: List[str], import_commands: bool = False):
+    """Import the detection stack and load models into this process's registry
+
+    Models are registered and loaded here once, before any fork, and never tuned
+    in this process (see tune_in_child).
+    """
+    from model_registry import get_model_registry
+    from runescape_models import register_runescape_models
+
+    registry = register_runescape_models(get_model_registry())
+    tune_in_child(registry, model_names)
+
+    if import_commands and COMMANDS_SUPPORTED:
+        import command_processor  # noqa: F401 - shared with workers when forked
+
+    for name in model_names:
+        registry.get(name, tune=False)
+    return registry
+
+
+def warm_up_models(registry, model_names: List[str]):
+    """Run one detection per model so inference buffers are allocated"""
+    import numpy as np
+
+    frame = np.zeros(WARMUP_FRAME_SHAPE, dtype=np.uint8)
+    for name in model_names:
+        registry.get(name).detect(frame)
+
+
+def measure_memory(pids: List[int]) -> List[Dict]:
+    """Unique (USS) and proportional (PSS, Linux only) memory of processes in MB"""
+    import psutil
+
+    rows = []
+    for pid in pids:
+        info = psutil.Process(pid).memory_full_info()
+        pss = getattr(info, 'pss', None)
+        rows.append({
+            'pid': pid,
+            'uss_mb': info.uss / (1024 * 1024),
+            'pss_mb': pss / (1024 * 1024) if pss is not None else None,
+        })
+    return rows
+
+
+def print_memory_report(title: str, rows: List[Dict], labels: List[str]) -> float:
+    """Print a memory table and return the total USS in MB"""
+    print(f"\n📊 {title}")
+    print(f"   {'Process':<12} {'PID':>8} {'USS MB':>10} {'PSS MB':>10}")
+    for label, row in zip(labels, rows):
+        pss = f"{row['pss_mb']:.1f}" if row['pss_mb'] is not None else 'n/a'
+        print(f"   {label:<12} {row['pid']:>8} {row['uss_mb']:>10.1f} {pss:>10}")
+    total_uss = sum(row['uss_mb'] for row in rows)
+    print(f"   {'Total':<12} {'':>8} {total_uss:>10.1f}")
+    return total_uss
+
+
+def run_worker(worker_id: int, model_names: List[str], commands: List[str], forked: bool, ready, stop):
+    """Bot worker: run scripted commands, or hold the models until stopped"""
+    try:
+        if forked:
+            from model_registry import get_model_registry
+            registry = get_model_registry()
+            registry.after_fork()
+        else:
+            registry = preload_models(model_names, import_commands=bool(commands))
+        warm_up_models(registry, model_names)
+        ready.put((worker_id, os.getpid()))
+
+        if commands:
+            from command_processor import GameCommandProcessor
+
+            processor = GameCommandProcessor()
+            if processor.window_manager.game_window_title:
+                processor.service_registry.detect_and_load_game(processor.window_manager.game_window_title)
+            for command in commands:
+                print(f"🤖 Worker {worker_id}: {command}")
+                processor.process_command(command)
+        else:
+            stop.wait()
+    except Exception as e:
+        print(f"❌ Worker {worker_id} failed: {e}")
+        ready.put((worker_id, None))
+
+
+class BotLauncher:
+    """Starts bot workers that share preloaded models"""
+
+    def __init__(self, workers: int, model_names: List[str], commands: Optional[List[str]] = None):
+        self.workers = workers
+        self.model_names = model_names
+        self.commands = commands or []
+        if self.commands and not COMMANDS_SUPPORTED:
+            print("⚠️ Commands need Windows (win32 and vgamepad) - workers will only hold the models")
+            self.commands = []
+
+    def launch_forked(self) -> float:
+        """Preload once, fork workers and report their memory, returns total USS in MB"""
+        forked = 'fork' in multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if forked else 'spawn')
+
+        if forked:
+            print(f"📦 Preloading models {self.model_names} in parent (pid {os.getpid()})...")
+            start = time.time()
+            preload_models(self.model_names, import_commands=bool(self.commands))
+            # Move preloaded objects out of the collector's reach so workers'
+            # collections do not write to (and un-share) the parent's pages
+            gc.collect()
+            gc.freeze()
+            print(f"✅ Preloaded in {time.time() - start:.1f}s")
+        else:
+            print("⚠️ fork is not available on this platform - workers will load their own models")
+
+        ready = context.Queue()
+        stop = context.Event()
+        processes = [
+            context.Process(target=run_worker, args=(worker_id, self.model_names, self.commands, forked, ready, stop))
+            for worker_id in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+
+        try:
+            failed = self._wait_until_ready(ready, processes)
+            if failed:
+                print(f"❌ Workers {failed} failed to start")
+                return 0.0
+
+            pids = ([os.getpid()] if forked else []) + [process.pid for process in processes]
+            labels = (['parent'] if forked else []) + [f"worker {i}" for i in range(self.workers)]
+            title = "Forked workers (copy-on-write models)" if forked else "Spawned workers (separate models)"
+            return print_memory_report(title, measure_memory(pids), labels)
+        finally:
+            stop.set()
+            for process in processes:
+                process.join(STOP_TIMEOUT)
+                if process.is_alive():
+                    print(f"⚠️ Worker pid {process.pid} still running after {STOP_TIMEOUT}s - terminating")
+                    process.terminate()
+                    process.join()
+
+    @staticmethod
+    def _wait_until_ready(ready, processes) -> List[int]:
+        """Wait for every worker's ready report, returns the ids of workers that failed to start
+
+        Workers killed before reaching their except (segfault, OOM kill) never
+        report, so exited workers stop being waited for.
+        """
+        reported: Dict[int, Optional[int]] = {}
+        deadline = time.time() + READY_TIMEOUT
+        while len(reported) < len(processes):
+            try:
+                worker_id, pid = ready.get(timeout=READY_POLL_S)
+                reported[worker_id] = pid
+                continue
+            except queue.Empty:
+                pass
+            # A worker's report is flushed before it exits: collect any that arrived meanwhile
+            exited = [worker_id for worker_id, process in enumerate(processes) if process.exitcode is not None]
+            try:
+                while True:
+                    worker_id, pid = ready.get_nowait()
+                    reported[worker_id] = pid
+            except queue.Empty:
+                pass
+            for worker_id in exited:
+                if worker_id not in reported:
+                    print(f"❌ Worker {worker_id} exited (code {processes[worker_id].exitcode}) before it was ready")
+                    reported[worker_id] = None
+            if time.time() >= deadline:
+                missing = [worker_id for worker_id in range(len(processes)) if worker_id not in reported]
+                print(f"❌ Workers {missing} not ready after {READY_TIMEOUT}s")
+                break
+        return [worker_id for worker_id in range(len(processes)) if reported.get(worker_id) is None]
+
+    def launch_independent(self) -> float:
+        """Start one independent process per bot and report memory, returns total USS in MB"""
+        print(f"📦 Starting {self.workers} independent bot processes...")
+        processes = [
+            subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), '--standalone', '--models', *self.model_names],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+            )
+            for _ in range(self.workers)
+        ]
+        try:
+            # stdout ends without READY when a bot exits during startup
+            exited = [index for index, process in enumerate(processes)
+                      if not any(line.strip() == 'READY' for line in process.stdout)]
+            if exited:
+                codes = [processes[index].wait() for index in exited]
+                print(f"❌ Bots {exited} exited before they were ready (exit codes {codes})")
+                return 0.0
+            labels = [f"bot {i}" for i in range(self.workers)]
+            return print_memory_report("Independent processes (current setup)",
+                                       measure_memory([process.pid for process in processes]), labels)
+        finally:
+            for process in processes:
+                process.stdin.close()
+                try:
+                    process.wait(STOP_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    print(f"⚠️ Bot pid {process.pid} still running after {STOP_TIMEOUT}s - terminating")
+                    process.terminate()
+                    process.wait()
+
+
+def run_standalone(model_names: List[str]):
+    """Load models like an independent command processor and hold them until stdin closes"""
+    registry = preload_models(model_names)
+    warm_up_models(registry, model_names)
+    print('READY', flush=True)
+    sys.stdin.read()
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Run several bots sharing preloaded detection models")
+    parser.add_argument('--workers', type=int, default=2, help="Number of bot workers")
+    parser.add_argument('--models', nargs='+', default=DEFAULT_MODELS,
+                        help="Registry models to preload (chicken, woodcutting, mining, generic)")
+    parser.add_argument('--commands', nargs='*', default=[],
+                        help="Commands each worker runs (omit to only measure memory)")
+    parser.add_argument('--compare', action='store_true',
+                        help="Also run one independent process per bot and compare memory")
+    parser.add_argument('--standalone', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.standalone:
+        run_standalone(args.models)
+        return
+
+    print("🚀 Bot Launcher")
+    print("=" * 40)
+    launcher = BotLauncher(args.workers, args.models, args.commands)
+    if args.compare:
+        # Independent processes first, before the parent loads anything
+        independent_mb = launcher.launch_independent()
+        shared_mb = launcher.launch_forked()
+        if independent_mb and shared_mb:
+            saved_mb = independent_mb - shared_mb
+            print(f"\n💾 Shared preload saves {saved_mb:.1f} MB ({saved_mb / independent_mb:.0%}) "
+                  f"for {args.workers} bots")
+    else:
+        launcher.launch_forked()
+
+
+if __name__ == "__main__":
+    main()
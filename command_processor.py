@@ -165,27 +165,29 @@ class GameServiceRegistry:
                 # Create RuneScape commands instance and get available commands
                 rs_instance = commands_module.RuneScapeCommands()
                 
-                # Add basic woodcutting commands
+                # Command table - commands that need detection models declare them
+                # so the registry keeps them resident and prefetches what follows
+                requires = rs_instance.requires_models
                 commands.update({
-                    'chop tree': lambda: rs_instance.chop_tree(),
-                    'chop oak': lambda: rs_instance.chop_specific_tree('oak'),
-                    'chop willow': lambda: rs_instance.chop_specific_tree('willow'),
-                    'chop maple': lambda: rs_instance.chop_specific_tree('maple'),
-                    'chop yew': lambda: rs_instance.chop_specific_tree('yew'),
-                    'chop magic': lambda: rs_instance.chop_specific_tree('magic'),
-                    'auto woodcut': lambda: rs_instance.auto_woodcutting(duration_minutes=5),
-                    'auto chop oak': lambda: rs_instance.auto_woodcutting(tree_type='oak', duration_minutes=5),
-                    'auto chop willow': lambda: rs_instance.auto_woodcutting(tree_type='willow', duration_minutes=5),
-                    'mine rock': lambda: rs_instance.mine_rock(),
-                    'mine iron': lambda: rs_instance.mine_rock('iron'),
-                    'mine coal': lambda: rs_instance.mine_rock('coal'),
-                    'attack goblin': lambda: rs_instance.attack_npc('goblin'),
-                    'attack cow': lambda: rs_instance.attack_npc('cow'),
-                    'chick': lambda: rs_instance.attack_chicken(),
-                    'chick hunting': lambda: rs_instance.chicken_hunting(),
+                    'chop tree': requires(['woodcutting'], lambda: rs_instance.chop_tree()),
+                    'chop oak': requires(['woodcutting'], lambda: rs_instance.chop_specific_tree('oak')),
+                    'chop willow': requires(['woodcutting'], lambda: rs_instance.chop_specific_tree('willow')),
+                    'chop maple': requires(['woodcutting'], lambda: rs_instance.chop_specific_tree('maple')),
+                    'chop yew': requires(['woodcutting'], lambda: rs_instance.chop_specific_tree('yew')),
+                    'chop magic': requires(['woodcutting'], lambda: rs_instance.chop_specific_tree('magic')),
+                    'auto woodcut': requires(['woodcutting'], lambda: rs_instance.auto_woodcutting(duration_minutes=5)),
+                    'auto chop oak': requires(['woodcutting'], lambda: rs_instance.auto_woodcutting(tree_type='oak', duration_minutes=5)),
+                    'auto chop willow': requires(['woodcutting'], lambda: rs_instance.auto_woodcutting(tree_type='willow', duration_minutes=5)),
+                    'mine rock': requires(['mining'], lambda: rs_instance.mine_rock()),
+                    'mine iron': requires(['mining'], lambda: rs_instance.mine_rock('iron')),
+                    'mine coal': requires(['mining'], lambda: rs_instance.mine_rock('coal')),
+                    'attack goblin': requires(['generic'], lambda: rs_instance.attack_npc('goblin')),
+                    'attack cow': requires(['generic'], lambda: rs_instance.attack_npc('cow')),
+                    'chick': requires(['chicken'], lambda: rs_instance.attack_chicken()),
+                    'chick hunting': requires(['chicken'], lambda: rs_instance.chicken_hunting()),
                     'end': lambda: rs_instance.stop_hunting(),
-                    'collect coins': lambda: rs_instance.collect_item('coin'),
-                    'open bank': lambda: rs_instance.open_bank(),
+                    'collect coins': requires(['generic'], lambda: rs_instance.collect_item('coin')),
+                    'open bank': requires(['generic'], lambda: rs_instance.open_bank()),
                     'scan objects': lambda: rs_instance.scan_objects(),
                     'combat tab': lambda: rs_instance.switch_interface_tab('combat'),
                     'skills tab': lambda: rs_instance.switch_interface_tab('skills'),